@@ -1,47 +1,518 @@
 """단어 자동완성 추천 시스템 웹 인터페이스"""
 
+import atexit
 import json
+import os
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, jsonify, render_template, request, stream_with_context
+from werkzeug.serving import is_running_from_reloader
 
-from main import (
-    find_min_prefix_for_word,
-    split_sentence_to_words,
-    test_sentence_autocomplete,
-)
-from src.recommender import MultiLanguageRecommender
+from main import split_sentence_to_words, test_sentence_autocomplete
+from src.metrics import MetricsRegistry, StageTimer, format_sample, stage
+from src.next_word import NextWordModel
+from src.prefork import PreforkServer, freeze_shared_state
+from src.query_log import QueryLog, frequent_queries, read_query_log
+from src.recommender import AUTO_LANGUAGE, MultiLanguageRecommender
+from src.request_profiler import RequestProfiler
+from src.response_cache import HotResponseCache
+from src.selection_log import SelectionLog, open_selection_log
+from src.task_pool import BoundedTaskPool, PoolBusyError, TaskTimeoutError
 from src.user_profile import UserProfile, UserProfileManager
 
 app = Flask(__name__)
 
+# 선택 이벤트 로그 디렉토리 (언어별 하위 폴더) 및 자동 압축 기준 크기
+SELECTION_LOG_DIR = Path(__file__).parent / "user_simulate" / "profiles" / "selections"
+SELECTION_LOG_COMPACT_BYTES = 4 * 1024 * 1024
+
+# 언어별로 메모리에 유지할 최대 프로필 수 (환경 변수로 설정, 없으면 무제한)
+# 한도를 넘는 프로필은 SQLite 파일로 내보냈다가 접근 시 다시 읽어옴
+PROFILE_MAX_RESIDENT = int(os.environ.get("WORD_TRAIL_MAX_PROFILES", "0")) or None
+PROFILE_SPILL_DIR = Path(__file__).parent / "user_simulate" / "profiles" / "spill"
+
+# 일괄 추천 API 한 번에 처리할 수 있는 최대 질의 수
+MAX_BATCH_QUERIES = 1000
+
+# 추천 요청 하나가 반환할 수 있는 최대 단어 수 (top_n 상한)
+MAX_TOP_N = 100
+
+# 오타 허용 추천(max_edits)에서 허용하는 최대 편집 거리
+MAX_FUZZY_EDITS = 2
+
+# 문장 테스트처럼 무거운 작업을 처리하는 워커 풀 설정 (워커 수 0이면 요청 스레드에서 실행)
+# 가벼운 추천 요청은 항상 요청 스레드에서 바로 처리
+# 풀 종류는 기본이 프로세스(서버가 요청을 받기 전에 워커 프로세스를 fork, 추천 요청과
+# GIL을 다투지 않음)이며, "thread"면 서버 프로세스 안의 스레드 풀 사용
+HEAVY_WORKERS = int(os.environ.get("WORD_TRAIL_HEAVY_WORKERS", "2"))
+HEAVY_POOL_KIND = os.environ.get("WORD_TRAIL_HEAVY_POOL", "process")
+HEAVY_MAX_PENDING = int(os.environ.get("WORD_TRAIL_HEAVY_MAX_PENDING", "0")) or None
+HEAVY_TIMEOUT_SECONDS = float(os.environ.get("WORD_TRAIL_HEAVY_TIMEOUT", "60"))
+
+# 응답 본문을 미리 인코딩해 둘 언어별 인기 접두사 수 (0이면 사용 안 함)
+HOT_RESPONSE_PREFIXES = int(os.environ.get("WORD_TRAIL_HOT_PREFIXES", "2000"))
+
+# 요청 프로파일링 관리자 토큰 (설정하지 않으면 프로파일링 기능을 사용하지 않음)
+# 및 결과 저장 디렉토리
+PROFILE_ADMIN_TOKEN = os.environ.get("WORD_TRAIL_PROFILE_TOKEN") or None
+PROFILE_OUTPUT_DIR = Path(
+    os.environ.get("WORD_TRAIL_PROFILE_DIR", Path(__file__).parent / "profiling")
+)
+
+# 단어 추가 API 관리자 토큰 (설정하지 않으면 단어 추가 기능을 사용하지 않음)
+VOCABULARY_ADMIN_TOKEN = os.environ.get("WORD_TRAIL_VOCAB_TOKEN") or None
+
+# 추천 질의 로그 표본 비율 (0이면 기록 안 함) 및 저장 디렉토리,
+# 시작 시 질의 로그에서 골라 응답을 미리 만들어 둘 최다 질의 수 (0이면 예열 안 함)
+QUERY_LOG_SAMPLE_RATE = float(os.environ.get("WORD_TRAIL_QUERY_LOG_SAMPLE", "0"))
+QUERY_LOG_DIR = Path(
+    os.environ.get("WORD_TRAIL_QUERY_LOG_DIR", Path(__file__).parent / "query_logs")
+)
+QUERY_WARMUP_QUERIES = int(os.environ.get("WORD_TRAIL_QUERY_WARMUP", "1000"))
+
+# 웹 서버 워커 프로세스 수 (2 이상이면 마스터가 인덱스를 한 번 로드한 뒤 워커들을 fork)
+SERVER_WORKERS = int(os.environ.get("WORD_TRAIL_WORKERS", "1"))
+
 # 전역 추천 시스템 (초기화는 첫 요청 시)
 recommender: MultiLanguageRecommender | None = None
 profile_managers: dict[str, UserProfileManager] = {}
+next_word_models: dict[str, NextWordModel] | None = None
+selection_logs: dict[str, SelectionLog] = {}
+heavy_pool: BoundedTaskPool | None = None
+response_cache: HotResponseCache | None = None
+query_log: QueryLog | None = None
+# 엔드포인트/언어/단계별 지연 시간 히스토그램 (프로세스별)
+request_metrics = MetricsRegistry()
+request_profiler = RequestProfiler(PROFILE_OUTPUT_DIR)
+_init_lock = threading.Lock()
 
 
 def get_recommender() -> MultiLanguageRecommender:
     """추천 시스템을 가져오거나 초기화합니다."""
     global recommender
     if recommender is None:
-        recommender = MultiLanguageRecommender(languages=["en", "it", "ja"])
+        with _init_lock:
+            if recommender is None:
+                recommender = MultiLanguageRecommender(languages=["en", "it", "ja"])
     return recommender
 
 
+def get_response_cache() -> HotResponseCache | None:
+    """인기 접두사 응답 캐시를 가져오거나 구축합니다. (비활성화된 경우 None)"""
+    global response_cache
+    if response_cache is None and HOT_RESPONSE_PREFIXES > 0:
+        rec = get_recommender()
+        with _init_lock:
+            if response_cache is None:
+                cache = HotResponseCache(max_prefixes=HOT_RESPONSE_PREFIXES)
+                cache.build(rec, encode_recommendations, logged_warmup_queries(rec))
+                response_cache = cache
+    return response_cache
+
+
+def logged_warmup_queries(rec: MultiLanguageRecommender) -> list[tuple[str, str, int]]:
+    """질의 로그에서 가장 자주 들어온 개인화하지 않은 질의들 (응답 캐시 예열용)"""
+    if QUERY_WARMUP_QUERIES <= 0:
+        return []
+    try:
+        queries = frequent_queries(
+            read_query_log(QUERY_LOG_DIR), QUERY_WARMUP_QUERIES, normalize=rec.normalize_prefix
+        )
+    except Exception as e:
+        print(f"질의 로그 읽기 실패: {e}")
+        return []
+    if queries:
+        print(f"질의 로그 예열: {len(queries)}개 질의")
+    return queries
+
+
+def get_query_log() -> QueryLog | None:
+    """추천 질의 로그를 가져오거나 엽니다. (비활성화된 경우 None)"""
+    global query_log
+    if query_log is None and QUERY_LOG_SAMPLE_RATE > 0:
+        with _init_lock:
+            if query_log is None:
+                query_log = QueryLog(QUERY_LOG_DIR, sample_rate=QUERY_LOG_SAMPLE_RATE)
+    return query_log
+
+
+def record_query(prefix: Any, lang: Any, top_n: Any, has_user: bool) -> None:
+    """질의 로그가 켜져 있으면 추천 질의를 표본으로 기록합니다. (형식이 잘못된 질의는 제외)"""
+    log = get_query_log()
+    if log is not None and isinstance(prefix, str) and isinstance(lang, str) and type(top_n) is int:
+        log.maybe_record(prefix, lang, top_n, has_user)
+
+
+def get_heavy_pool() -> BoundedTaskPool | None:
+    """무거운 작업용 워커 풀을 가져오거나 생성합니다. (비활성화된 경우 None)
+
+    프로세스 풀은 추천 시스템을 먼저 초기화한 뒤 워커를 모두 fork하므로
+    워커들이 인덱스를 다시 구축하지 않고 공유합니다. 요청 스레드에서 fork하지
+    않도록 warm_up()(prefork 모드에서는 init_prefork_worker())에서 미리 만듭니다.
+    """
+    global heavy_pool
+    if heavy_pool is None and HEAVY_WORKERS > 0:
+        get_recommender()
+        with _init_lock:
+            if heavy_pool is None:
+                pool = BoundedTaskPool(
+                    HEAVY_WORKERS, max_pending=HEAVY_MAX_PENDING, kind=HEAVY_POOL_KIND
+                )
+                # 워커 프로세스가 로그 flush 스레드의 락을 물려받지 않도록 fork하는 동안 멈춤
+                logs = open_logs() if pool.kind == "process" else []
+                for log in logs:
+                    log.stop_flusher()
+                try:
+                    pool.start()
+                finally:
+                    for log in logs:
+                        log.start_flusher()
+                heavy_pool = pool
+    return heavy_pool
+
+
+def run_heavy(fn, *args: Any) -> Any:
+    """무거운 작업을 워커 풀에서 실행합니다.
+
+    풀이 비활성화되어 있거나 요청을 프로파일링 중이면 직접 실행합니다.
+    제한 시간이 지나면 기다리기만 멈추며, 이미 시작한 작업은 끝까지 실행되고
+    그동안 풀의 대기열 자리를 차지합니다.
+
+    Raises:
+        PoolBusyError: 대기 중인 작업이 한도에 도달한 경우
+        TaskTimeoutError: HEAVY_TIMEOUT_SECONDS 안에 끝나지 않은 경우
+    """
+    # 프로파일링 중인 요청은 프로파일에 포함되도록 요청 스레드에서 실행
+    pool = get_heavy_pool()
+    if pool is None or request_profiler.active():
+        return fn(*args)
+    return pool.run(fn, *args, timeout=HEAVY_TIMEOUT_SECONDS)
+
+
+def run_sentence_test(
+    sentence: str, lang: str, user_profile: UserProfile | None, return_word_details: bool
+) -> tuple[dict[str, Any] | None, dict[str, float]]:
+    """한 문장의 자동완성 효율을 테스트합니다. (워커 풀에서 실행)
+
+    Returns:
+        (테스트 결과, 단계별 소요 시간) 튜플
+    """
+    timer = StageTimer()
+    with timer.activate():
+        result = test_sentence_autocomplete(
+            get_recommender(),
+            sentence,
+            lang,
+            user_profile=user_profile,
+            return_word_details=return_word_details,
+            next_word_model=load_next_word_models().get(lang),
+        )
+    return result, timer.durations
+
+
+def run_batch_test(
+    sentences: list[str], lang: str, user_profile: UserProfile | None
+) -> list[dict[str, Any]]:
+    """여러 문장의 자동완성 효율을 테스트합니다. (워커 풀에서 실행, 실패한 문장은 제외)"""
+    rec = get_recommender()
+    next_word_model = load_next_word_models().get(lang)
+    results = []
+    for sentence in sentences:
+        try:
+            result = test_sentence_autocomplete(
+                rec, sentence, lang, user_profile=user_profile, next_word_model=next_word_model
+            )
+            if result:
+                results.append(result)
+        except Exception:
+            continue
+    return results
+
+
 def load_profiles() -> dict[str, UserProfileManager]:
     """사용자 프로필을 로드합니다."""
     global profile_managers
     if not profile_managers:
         try:
-            from user_simulate.build_profiles import main as build_profiles_main
+            from user_simulate.build_profiles import load_or_build_profile_managers
 
-            profile_managers, _ = build_profiles_main()
+            # 스냅샷이 최신이면 그대로 로드하고, 문장 파일이 바뀐 경우에만 다시 구축
+            profile_managers = load_or_build_profile_managers()
         except Exception as e:
             print(f"프로필 로드 실패: {e}")
             profile_managers = {}
+
+        # 저장된 선택 이벤트를 복원하고 이후 선택을 로그에 기록
+        # (prefork 모드에서는 프로필 한도를 워커마다 따로 적용)
+        for lang, profile_manager in profile_managers.items():
+            if PROFILE_MAX_RESIDENT is not None and SERVER_WORKERS <= 1:
+                profile_manager.set_capacity(
+                    max_profiles=PROFILE_MAX_RESIDENT,
+                    spill_path=PROFILE_SPILL_DIR / f"{lang}.sqlite3",
+                )
+            try:
+                selection_logs[lang] = open_selection_log(
+                    profile_manager,
+                    SELECTION_LOG_DIR / lang,
+                    compact_threshold=SELECTION_LOG_COMPACT_BYTES,
+                )
+            except Exception as e:
+                print(f"[{lang}] 선택 로그 로드 실패: {e}")
     return profile_managers
 
 
+def load_next_word_models() -> dict[str, NextWordModel]:
+    """프로필과 같은 문장 파일로 언어별 다음 단어 예측 모델을 구축합니다. (한 번만)"""
+    global next_word_models
+    if next_word_models is None:
+        with _init_lock:
+            if next_word_models is None:
+                try:
+                    from user_simulate.build_profiles import build_next_word_models
+
+                    next_word_models = build_next_word_models()
+                except Exception as e:
+                    print(f"다음 단어 예측 모델 구축 실패: {e}")
+                    next_word_models = {}
+    return next_word_models
+
+
+def find_user_profile(user_id: str | None, user_lang: str) -> UserProfile | None:
+    """요청의 사용자 ID와 언어에 해당하는 프로필을 찾습니다.
+
+    Args:
+        user_id: 사용자 ID (없으면 None)
+        user_lang: 프로필 언어 코드
+
+    Returns:
+        사용자 프로필 (없으면 None)
+    """
+    if not user_id:
+        return None
+    profiles = load_profiles()
+    if user_lang not in profiles:
+        return None
+    return profiles[user_lang].find_profile(user_id)
+
+
+def metric_lang(lang: str) -> str:
+    """지표 레이블에 쓸 언어 코드 (지원하지 않는 언어는 하나로 묶음)"""
+    if lang == AUTO_LANGUAGE:
+        return lang
+    return lang if lang in get_recommender().recommenders else "other"
+
+
+def parse_max_edits(value: Any) -> int:
+    """요청의 max_edits 값을 검사합니다.
+
+    Raises:
+        ValueError: 0~MAX_FUZZY_EDITS 사이의 정수가 아닌 경우
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value <= MAX_FUZZY_EDITS:
+        raise ValueError(f"max_edits는 0~{MAX_FUZZY_EDITS} 사이의 정수여야 합니다")
+    return value
+
+
+def parse_top_n(value: Any) -> int:
+    """요청의 top_n 값을 검사합니다.
+
+    Raises:
+        ValueError: 1~MAX_TOP_N 사이의 정수가 아닌 경우
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= MAX_TOP_N:
+        raise ValueError(f"top_n은 1~{MAX_TOP_N} 사이의 정수여야 합니다")
+    return value
+
+
+def parse_batch_query(query: Any) -> tuple[str, str, int, str | None, str, int]:
+    """일괄 추천 질의 하나의 필드 형식을 검사합니다.
+
+    Returns:
+        (prefix, lang, top_n, user_id, user_lang, max_edits) 튜플
+
+    Raises:
+        ValueError: 질의가 객체가 아니거나, 필드 형식이 잘못되었거나, 접두사가 비어 있는 경우
+    """
+    if not isinstance(query, dict):
+        raise ValueError("질의는 객체여야 합니다")
+    prefix = query.get("prefix", "")
+    lang = query.get("lang", "en")
+    top_n = query.get("top_n", 10)
+    user_id = query.get("user_id", None)
+    user_lang = query.get("user_lang", lang)
+
+    for name, value in (("prefix", prefix), ("lang", lang), ("user_lang", user_lang)):
+        if not isinstance(value, str):
+            raise ValueError(f"{name}는 문자열이어야 합니다")
+    if user_id is not None and not isinstance(user_id, str):
+        raise ValueError("user_id는 문자열이어야 합니다")
+    if not prefix:
+        raise ValueError("접두사가 필요합니다")
+    return (
+        prefix,
+        lang,
+        parse_top_n(top_n),
+        user_id,
+        user_lang,
+        parse_max_edits(query.get("max_edits", 0)),
+    )
+
+
+def format_recommendations(recommendations: list[tuple[str, float]]) -> list[dict]:
+    """(단어, 점수) 리스트를 API 응답 형식으로 변환합니다."""
+    return [{"word": word, "score": float(score)} for word, score in recommendations]
+
+
+def format_auto_recommendations(recommendations: list[tuple[str, float, str]]) -> list[dict]:
+    """(단어, 점수, 언어) 리스트를 언어를 포함한 API 응답 형식으로 변환합니다."""
+    return [
+        {"word": word, "score": float(score), "lang": lang}
+        for word, score, lang in recommendations
+    ]
+
+
+def encode_recommendations(recommendations: list[tuple[str, float]]) -> bytes:
+    """추천 API의 성공 응답 본문을 jsonify와 같은 형식의 바이트로 만듭니다."""
+    payload = {"success": True, "recommendations": format_recommendations(recommendations)}
+    return app.json.response(payload).get_data()
+
+
+def open_logs() -> list[SelectionLog | QueryLog]:
+    """열려 있는 선택 로그와 질의 로그를 반환합니다."""
+    logs: list[SelectionLog | QueryLog] = list(selection_logs.values())
+    if query_log is not None:
+        logs.append(query_log)
+    return logs
+
+
+def flush_logs() -> None:
+    """선택 로그와 질의 로그의 버퍼를 디스크로 내보냅니다. (한 로그의 실패가 다른 로그를 막지 않음)"""
+    for log in open_logs():
+        try:
+            log.flush()
+        except Exception as e:
+            print(f"로그 flush 실패: {e}")
+
+
+@atexit.register
+def close_selection_logs() -> None:
+    """종료 시 선택 로그와 질의 로그의 버퍼를 디스크로 내보내고 워커 풀을 정리합니다."""
+    for log in selection_logs.values():
+        log.close()
+    if query_log is not None:
+        query_log.close()
+    if heavy_pool is not None:
+        heavy_pool.shutdown()
+
+
+def prepare_prefork_master() -> None:
+    """prefork 모드의 마스터에서 워커를 fork하기 전에 공유할 상태를 준비합니다.
+
+    인덱스와 프로필을 로드하고, 쌓인 선택 로그를 미리 압축한 뒤(워커들이 같은
+    디렉토리에 쓰는 동안에는 압축하지 않음) 객체들을 GC 추적에서 제외합니다.
+    마스터는 로그에 쓰지 않으므로 로그의 flush 스레드를 멈춰 두고, 워커들은
+    init_prefork_worker()에서 각자 다시 시작합니다. (fork 시점에 다른 스레드가 로그
+    락을 잡고 있지 않도록)
+    """
+    warm_up(start_heavy_pool=False)
+    get_query_log()
+    for log in selection_logs.values():
+        log.compact(background=False)
+    for log in open_logs():
+        log.stop_flusher()
+    freeze_shared_state()
+
+
+def warm_up(start_heavy_pool: bool = True) -> None:
+    """첫 요청 전에 인덱스, 오타 허용 추천 자료, 응답 캐시(질의 로그 예열 포함), 프로필, 다음 단어 예측 모델을 준비합니다.
+
+    Args:
+        start_heavy_pool: 무거운 작업용 워커 풀도 만들지 여부 (모두 로드한 뒤 마지막에 만듦,
+            prefork 마스터에서는 False로 하고 워커마다 만듦)
+    """
+    get_recommender().prepare_fuzzy()
+    get_response_cache()
+    load_profiles()
+    load_next_word_models()
+    if start_heavy_pool:
+        get_heavy_pool()
+
+
+def exit_prefork_worker() -> None:
+    """워커가 종료될 때 로그 버퍼를 먼저 내보낸 뒤 자원을 정리합니다.
+
+    워커는 os._exit로 끝나 atexit 훅이 실행되지 않으므로 여기서 직접 정리합니다.
+    """
+    flush_logs()
+    close_selection_logs()
+
+
+def init_prefork_worker(slot: int, generation: int) -> None:
+    """fork된 워커에서 프로세스별 자원을 엽니다.
+
+    로그는 워커별 세그먼트로 옮기고 flush 스레드를 새로 시작합니다.
+    프로필과 요청 프로파일링 예약은 워커마다 따로 가지므로, 한 워커가 처리한
+    /api/select의 선택이나 /api/admin/profile의 예약은 다른 워커에 보이지 않습니다.
+    (선택은 워커의 로그 세그먼트에 남아 다음 시작 때 모든 프로필에 반영됨)
+
+    Args:
+        slot: 워커 번호
+        generation: 워커 생성 번호 (다시 띄운 워커도 겹치지 않는 고유 번호)
+    """
+    for log in selection_logs.values():
+        # 마스터의 활성 세그먼트 다음 번호부터 워커마다 다른 세그먼트 사용
+        log.reopen(log.seq + generation + 1)
+    if query_log is not None:
+        query_log.reopen(query_log.seq + generation + 1)
+    if PROFILE_MAX_RESIDENT is not None:
+        for lang, profile_manager in profile_managers.items():
+            profile_manager.set_capacity(
+                max_profiles=PROFILE_MAX_RESIDENT,
+                spill_path=PROFILE_SPILL_DIR / f"{lang}.worker{slot}.sqlite3",
+            )
+    # 요청 스레드가 생기기 전에 워커별 풀을 만듦
+    get_heavy_pool()
+
+
+def is_profile_admin() -> bool:
+    """요청의 관리자 토큰이 프로파일링 토큰과 일치하는지 여부"""
+    return (
+        PROFILE_ADMIN_TOKEN is not None
+        and request.headers.get("X-Admin-Token") == PROFILE_ADMIN_TOKEN
+    )
+
+
+@app.before_request
+def start_request_profile():
+    """예약되었거나 X-Profile 헤더가 있는 요청의 프로파일링을 시작합니다."""
+    if PROFILE_ADMIN_TOKEN is None:
+        return
+    forced = request.headers.get("X-Profile") == PROFILE_ADMIN_TOKEN
+    request_profiler.maybe_start(request.path, forced)
+
+
+@app.after_request
+def finish_request_profile(response):
+    """프로파일링을 끝내고 저장한 결과 이름을 X-Profile-Output 헤더로 알립니다.
+
+    스트리밍 응답은 본문을 만드는 시간이 포함되지 않습니다.
+    """
+    if request_profiler.active():
+        path = request_profiler.stop(request.endpoint or "unknown")
+        response.headers["X-Profile-Output"] = path.stem
+    return response
+
+
+@app.teardown_request
+def abort_request_profile(error):
+    """처리 중 예외로 after_request가 실행되지 않은 경우에도 프로파일링을 끝냅니다."""
+    if request_profiler.active():
+        request_profiler.stop(request.endpoint or "unknown")
+
+
 @app.route("/")
 def index():
     """메인 페이지"""
@@ -50,42 +521,184 @@ def index():
 
 @app.route("/api/recommend", methods=["POST"])
 def api_recommend():
-    """단어 추천 API"""
+    """단어 추천 API
+
+    max_edits(1~MAX_FUZZY_EDITS)를 주면 오타를 허용하여 추천합니다. (개인화하지 않음)
+    lang이 "auto"면 모든 언어의 추천을 합쳐 항목마다 언어를 함께 반환합니다. (개인화하지 않음)
+    접두사가 비어 있고 context(같은 문장에서 앞에 입력한 텍스트)를 주면 단어 경계
+    직후로 보고 다음 단어 예측 결과를 반환합니다.
+    """
     data = request.json
     prefix = data.get("prefix", "")
     lang = data.get("lang", "en")
-    top_n = data.get("top_n", 10)
     user_id = data.get("user_id", None)
     user_lang = data.get("user_lang", lang)
+    context = data.get("context", None)
 
+    # 미리 인코딩한 응답을 찾기 전에 검사 (잘못된 top_n이 캐시에 적중하지 않도록)
+    try:
+        top_n = parse_top_n(data.get("top_n", 10))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not prefix and isinstance(context, str):
+        return recommend_next_word(context, lang, top_n)
     if not prefix:
         return jsonify({"error": "접두사가 필요합니다"}), 400
+    try:
+        max_edits = parse_max_edits(data.get("max_edits", 0))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    record_query(prefix, lang, top_n, bool(user_id))
 
     rec = get_recommender()
-    user_profile = None
+    endpoint = "recommend_fuzzy" if max_edits else "recommend"
+    with request_metrics.track(endpoint, metric_lang(lang)):
+        user_profile = None
+        if not max_edits and lang != AUTO_LANGUAGE:
+            with stage("profile"):
+                user_profile = find_user_profile(user_id, user_lang)
 
-    # 사용자 프로필 로드
-    if user_id:
-        profiles = load_profiles()
-        if user_lang in profiles:
-            profile_manager = profiles[user_lang]
-            if user_id in profile_manager.profiles:
-                user_profile = profile_manager.profiles[user_id]
+        # 개인화하지 않는 요청은 미리 인코딩한 응답이 있으면 그대로 반환
+        if user_profile is None and not max_edits and lang != AUTO_LANGUAGE:
+            with stage("cache"):
+                cache = get_response_cache()
+                body = cache.get(lang, prefix, top_n) if cache is not None else None
+            if body is not None:
+                return app.response_class(body, mimetype=app.json.mimetype)
 
-    try:
-        recommendations = rec.recommend(
-            prefix=prefix, lang=lang, top_n=top_n, user_profile=user_profile
-        )
-        return jsonify(
-            {
-                "success": True,
-                "recommendations": [
-                    {"word": word, "score": float(score)} for word, score in recommendations
-                ],
-            }
-        )
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        try:
+            if max_edits:
+                recommendations = rec.recommend_fuzzy(
+                    prefix=prefix, lang=lang, top_n=top_n, max_edits=max_edits
+                )
+            elif lang == AUTO_LANGUAGE:
+                auto_recommendations = rec.recommend_auto(prefix=prefix, top_n=top_n)
+                with stage("serialize"):
+                    return jsonify(
+                        {
+                            "success": True,
+                            "recommendations": format_auto_recommendations(auto_recommendations),
+                        }
+                    )
+            else:
+                recommendations = rec.recommend(
+                    prefix=prefix, lang=lang, top_n=top_n, user_profile=user_profile
+                )
+            with stage("serialize"):
+                return jsonify(
+                    {
+                        "success": True,
+                        "recommendations": format_recommendations(recommendations),
+                    }
+                )
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+
+def recommend_next_word(context: str, lang: str, top_n: int):
+    """문맥 텍스트 뒤에 올 다음 단어를 예측하여 추천 API 형식으로 반환합니다."""
+    with request_metrics.track("next_word", metric_lang(lang)):
+        model = load_next_word_models().get(lang)
+        if model is None:
+            return jsonify({"error": f"다음 단어 예측을 지원하지 않는 언어: {lang}"}), 400
+        with stage("tokenize"):
+            previous_words = split_sentence_to_words(context, lang)
+        try:
+            with stage("next_word"):
+                recommendations = model.predict(previous_words, top_n=top_n)
+            with stage("serialize"):
+                return jsonify(
+                    {
+                        "success": True,
+                        "recommendations": format_recommendations(recommendations),
+                    }
+                )
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/recommend-batch", methods=["POST"])
+def api_recommend_batch():
+    """여러 접두사/언어에 대한 일괄 단어 추천 API
+
+    요청: {"queries": [{"prefix", "lang", "top_n", "user_id", "user_lang", "max_edits"}, ...]}
+    응답의 results는 queries와 같은 순서이며, 각 항목은 recommendations 또는 error를 가집니다.
+    형식이 잘못된 질의는 그 항목만 error가 되고 나머지 질의는 계속 처리합니다.
+    같은 질의는 한 번만 계산하고, 사용자 프로필은 사용자별로 한 번만 조회합니다.
+    """
+    data = request.json
+    queries = data.get("queries", []) if isinstance(data, dict) else None
+
+    if not isinstance(queries, list) or not queries:
+        return jsonify({"error": "질의 리스트가 필요합니다"}), 400
+    if len(queries) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"질의는 최대 {MAX_BATCH_QUERIES}개까지 가능합니다"}), 400
+
+    rec = get_recommender()
+    user_profiles: dict[tuple[str | None, str], UserProfile | None] = {}
+    answers: dict[tuple, dict] = {}
+    results = []
+
+    for query in queries:
+        try:
+            key = parse_batch_query(query)
+        except ValueError as e:
+            results.append({"error": str(e)})
+            continue
+        prefix, lang, top_n, user_id, user_lang, max_edits = key
+        record_query(prefix, lang, top_n, bool(user_id))
+
+        if key in answers:
+            results.append(answers[key])
+            continue
+
+        if max_edits:
+            try:
+                recommendations = rec.recommend_fuzzy(
+                    prefix=prefix, lang=lang, top_n=top_n, max_edits=max_edits
+                )
+                answer = {"recommendations": format_recommendations(recommendations)}
+            except Exception as e:
+                answer = {"error": str(e)}
+        else:
+            profile_key = (user_id, user_lang)
+            if profile_key not in user_profiles:
+                user_profiles[profile_key] = find_user_profile(user_id, user_lang)
+            try:
+                recommendations = rec.recommend(
+                    prefix=prefix,
+                    lang=lang,
+                    top_n=top_n,
+                    user_profile=user_profiles[profile_key],
+                )
+                answer = {"recommendations": format_recommendations(recommendations)}
+            except Exception as e:
+                answer = {"error": str(e)}
+
+        answers[key] = answer
+        results.append(answer)
+
+    return jsonify({"success": True, "results": results})
+
+
+@app.route("/api/select", methods=["POST"])
+def api_select():
+    """단어 선택 기록 API"""
+    data = request.json
+    word = data.get("word", "")
+    prefix = data.get("prefix", "")
+    user_id = data.get("user_id", None)
+    lang = data.get("user_lang", data.get("lang", "en"))
+
+    if not word or not user_id:
+        return jsonify({"error": "단어와 사용자 ID가 필요합니다"}), 400
+
+    profiles = load_profiles()
+    if lang not in profiles:
+        return jsonify({"error": f"지원하지 않는 언어: {lang}"}), 400
+
+    profiles[lang].record_selection(user_id, word, prefix)
+    return jsonify({"success": True})
 
 
 @app.route("/api/test-sentence", methods=["POST"])
@@ -100,27 +713,28 @@ def api_test_sentence():
     if not sentence:
         return jsonify({"error": "문장이 필요합니다"}), 400
 
-    rec = get_recommender()
-    user_profile = None
-
-    # 사용자 프로필 로드
-    if user_id:
-        profiles = load_profiles()
-        if user_lang in profiles:
-            profile_manager = profiles[user_lang]
-            if user_id in profile_manager.profiles:
-                user_profile = profile_manager.profiles[user_id]
+    with request_metrics.track("test-sentence", metric_lang(lang)) as timer:
+        with stage("profile"):
+            user_profile = find_user_profile(user_id, user_lang)
 
-    try:
-        result = test_sentence_autocomplete(
-            rec, sentence, lang, user_profile=user_profile, return_word_details=True
-        )
-        if result:
-            return jsonify({"success": True, "result": result})
-        else:
-            return jsonify({"error": "문장 처리 실패"}), 400
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        try:
+            # worker: 워커 풀 대기 시간을 포함한 테스트 전체 시간
+            with stage("worker"):
+                result, durations = run_heavy(
+                    run_sentence_test, sentence, lang, user_profile, True
+                )
+            timer.merge(durations)
+            with stage("serialize"):
+                if result:
+                    return jsonify({"success": True, "result": result})
+                else:
+                    return jsonify({"error": "문장 처리 실패"}), 400
+        except PoolBusyError as e:
+            return jsonify({"error": str(e)}), 503
+        except TaskTimeoutError as e:
+            return jsonify({"error": str(e)}), 504
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
 
 
 @app.route("/api/test-batch", methods=["POST"])
@@ -135,51 +749,158 @@ def api_test_batch():
     if not sentences:
         return jsonify({"error": "문장 리스트가 필요합니다"}), 400
 
-    rec = get_recommender()
-    user_profile = None
+    user_profile = find_user_profile(user_id, user_lang)
 
-    # 사용자 프로필 로드
-    if user_id:
-        profiles = load_profiles()
-        if user_lang in profiles:
-            profile_manager = profiles[user_lang]
-            if user_id in profile_manager.profiles:
-                user_profile = profile_manager.profiles[user_id]
-
-    results = []
-    for sentence in sentences:
-        try:
-            result = test_sentence_autocomplete(rec, sentence, lang, user_profile=user_profile)
-            if result:
-                results.append(result)
-        except Exception:
-            continue
+    try:
+        results = run_heavy(run_batch_test, sentences, lang, user_profile)
+    except PoolBusyError as e:
+        return jsonify({"error": str(e)}), 503
+    except TaskTimeoutError as e:
+        return jsonify({"error": str(e)}), 504
 
     if not results:
         return jsonify({"error": "처리된 문장이 없습니다"}), 400
 
-    # 통계 계산
-    total_chars_without = sum(r["total_chars_without"] for r in results)
-    total_chars_with = sum(r["total_chars_with"] for r in results)
-    total_chars_saved = sum(r["chars_saved"] for r in results)
+    return jsonify(
+        {
+            "success": True,
+            "results": results,
+            "statistics": batch_statistics(
+                len(results),
+                sum(r["total_chars_without"] for r in results),
+                sum(r["total_chars_with"] for r in results),
+                sum(r["chars_saved"] for r in results),
+                total_chars_with_next_word(results),
+            ),
+        }
+    )
+
+
+def total_chars_with_next_word(results: list[dict[str, Any]]) -> int | None:
+    """다음 단어 예측까지 사용했을 때의 입력 글자 수 합계 (예측 모델이 없었으면 None)"""
+    if not all("total_chars_with_next_word" in r for r in results):
+        return None
+    return sum(r["total_chars_with_next_word"] for r in results)
+
+
+def batch_statistics(
+    sentence_count: int,
+    total_chars_without: int,
+    total_chars_with: int,
+    total_chars_saved: int,
+    total_chars_with_next_word: int | None = None,
+) -> dict[str, Any]:
+    """일괄 테스트 결과의 통계를 계산합니다. (다음 단어 예측 합계가 있으면 그 절약률도 포함)"""
     avg_savings_rate = (
         (1 - total_chars_with / total_chars_without) * 100
         if total_chars_without > 0
         else 0
     )
+    statistics = {
+        "sentence_count": sentence_count,
+        "total_chars_without": total_chars_without,
+        "total_chars_with": total_chars_with,
+        "total_chars_saved": total_chars_saved,
+        "avg_savings_rate": round(avg_savings_rate, 2),
+    }
+    if total_chars_with_next_word is not None:
+        savings_rate_with_next_word = (
+            (1 - total_chars_with_next_word / total_chars_without) * 100
+            if total_chars_without > 0
+            else 0
+        )
+        statistics["total_chars_with_next_word"] = total_chars_with_next_word
+        statistics["avg_savings_rate_with_next_word"] = round(savings_rate_with_next_word, 2)
+    return statistics
 
-    return jsonify(
-        {
-            "success": True,
-            "results": results,
-            "statistics": {
-                "sentence_count": len(results),
-                "total_chars_without": total_chars_without,
-                "total_chars_with": total_chars_with,
-                "total_chars_saved": total_chars_saved,
-                "avg_savings_rate": round(avg_savings_rate, 2),
-            },
-        }
+
+def iter_ndjson_sentences(stream) -> Iterator[str | ValueError]:
+    """NDJSON 요청 본문에서 문장을 한 줄씩 읽습니다.
+
+    각 줄은 JSON 문자열, {"sentence": ...} 객체 또는 일반 텍스트이며, 빈 줄은 건너뜁니다.
+    UTF-8이 아니거나 JSON 문자열/객체로 시작했지만 잘못된 줄은 스트림을 끊지 않도록
+    예외를 발생시키는 대신 ValueError 객체로 반환합니다.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            text = line.decode("utf-8")
+        except UnicodeDecodeError as e:
+            yield ValueError(f"{line_number}번째 줄이 UTF-8이 아닙니다: {e}")
+            continue
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError as e:
+            if text[0] in "{\"":
+                yield ValueError(f"{line_number}번째 줄의 JSON이 잘못되었습니다: {e}")
+                continue
+            item = text  # JSON이 아닌 줄은 문장 그대로 사용
+        sentence = item.get("sentence", "") if isinstance(item, dict) else item
+        if isinstance(sentence, str) and sentence:
+            yield sentence
+
+
+@app.route("/api/test-batch-stream", methods=["POST"])
+def api_test_batch_stream():
+    """여러 문장 일괄 테스트 API (NDJSON 스트리밍)
+
+    요청은 /api/test-batch와 같은 JSON이거나, Content-Type이 application/x-ndjson인
+    한 줄에 한 문장씩의 본문입니다. (이 경우 lang, user_id, user_lang은 쿼리 문자열로 전달)
+    응답은 문장마다 처리가 끝나는 즉시 {"index", "result"} 한 줄을 내보내고,
+    마지막에 {"statistics"} 한 줄을 내보냅니다. 처리하지 못한 문장(워커 풀이 가득
+    찼거나 제한 시간을 넘긴 경우 포함)과 읽을 수 없는 NDJSON 줄은 {"index", "error"}
+    줄로 알리며 통계에서 제외합니다.
+    """
+    if request.mimetype == "application/x-ndjson":
+        options = request.args
+        sentences = iter_ndjson_sentences(request.stream)
+    else:
+        options = request.json
+        sentences = options.get("sentences", [])
+        if not sentences:
+            return jsonify({"error": "문장 리스트가 필요합니다"}), 400
+
+    lang = options.get("lang", "en")
+    user_id = options.get("user_id", None)
+    user_lang = options.get("user_lang", lang)
+    user_profile = find_user_profile(user_id, user_lang)
+
+    def generate() -> Iterator[str]:
+        # 결과는 모아 두지 않고 통계에 필요한 합계만 유지
+        count = total_chars_without = total_chars_with = total_chars_saved = 0
+        chars_with_next_word: int | None = 0
+        for index, sentence in enumerate(sentences):
+            if isinstance(sentence, ValueError):
+                yield app.json.dumps({"index": index, "error": str(sentence)}) + "\n"
+                continue
+            try:
+                result, _ = run_heavy(run_sentence_test, sentence, lang, user_profile, False)
+            except Exception as e:
+                yield app.json.dumps({"index": index, "error": str(e)}) + "\n"
+                continue
+            if not result:
+                yield app.json.dumps({"index": index, "error": "문장 처리 실패"}) + "\n"
+                continue
+
+            count += 1
+            total_chars_without += result["total_chars_without"]
+            total_chars_with += result["total_chars_with"]
+            total_chars_saved += result["chars_saved"]
+            if chars_with_next_word is not None and "total_chars_with_next_word" in result:
+                chars_with_next_word += result["total_chars_with_next_word"]
+            else:
+                chars_with_next_word = None
+            yield app.json.dumps({"index": index, "result": result}) + "\n"
+
+        statistics = batch_statistics(
+            count, total_chars_without, total_chars_with, total_chars_saved, chars_with_next_word
+        )
+        yield app.json.dumps({"statistics": statistics}) + "\n"
+
+    return app.response_class(
+        stream_with_context(generate()), mimetype="application/x-ndjson"
     )
 
 
@@ -189,10 +910,153 @@ def api_users():
     profiles = load_profiles()
     users = {}
     for lang, profile_manager in profiles.items():
-        users[lang] = list(profile_manager.profiles.keys())
+        users[lang] = profile_manager.user_ids()
     return jsonify({"success": True, "users": users})
 
 
+@app.route("/api/profile-stats", methods=["GET"])
+def api_profile_stats():
+    """언어별 프로필 캐시 통계 API (적중/미스/디스크 읽기/내보내기 횟수)"""
+    profiles = load_profiles()
+    stats = {lang: profile_manager.stats() for lang, profile_manager in profiles.items()}
+    return jsonify({"success": True, "stats": stats})
+
+
+@app.route("/api/admin/profile", methods=["GET", "POST"])
+def api_admin_profile():
+    """요청 프로파일링 관리 API (X-Admin-Token 헤더 필요)
+
+    POST {"path": "/api/recommend", "count": 5}: 해당 경로의 다음 count개 요청을 프로파일링
+    (count가 0이면 예약 취소)
+    GET: 남은 예약과 저장된 프로파일 목록
+    """
+    if PROFILE_ADMIN_TOKEN is None:
+        return jsonify({"error": "프로파일링이 비활성화되어 있습니다"}), 404
+    if not is_profile_admin():
+        return jsonify({"error": "관리자 토큰이 필요합니다"}), 403
+
+    if request.method == "POST":
+        data = request.json
+        path = data.get("path", "")
+        count = data.get("count", 1)
+        if not path.startswith("/") or not isinstance(count, int) or count < 0:
+            return jsonify({"error": "path와 0 이상의 count가 필요합니다"}), 400
+        request_profiler.arm(path, count)
+
+    return jsonify(
+        {
+            "success": True,
+            "armed": request_profiler.budgets,
+            "profiles": request_profiler.saved_profiles(),
+        }
+    )
+
+
+@app.route("/api/admin/profile/<name>", methods=["GET"])
+def api_admin_profile_summary(name: str):
+    """저장된 프로파일의 누적 시간 순 요약 (pstats 텍스트)"""
+    if PROFILE_ADMIN_TOKEN is None:
+        return jsonify({"error": "프로파일링이 비활성화되어 있습니다"}), 404
+    if not is_profile_admin():
+        return jsonify({"error": "관리자 토큰이 필요합니다"}), 403
+
+    names = {profile["name"] for profile in request_profiler.saved_profiles()}
+    if name not in names:
+        return jsonify({"error": "프로파일을 찾을 수 없습니다"}), 404
+    summary = (PROFILE_OUTPUT_DIR / f"{name}.txt").read_text(encoding="utf-8")
+    return app.response_class(summary, mimetype="text/plain")
+
+
+@app.route("/api/admin/vocabulary", methods=["POST"])
+def api_admin_vocabulary():
+    """단어 추가/빈도 변경 API (X-Admin-Token 헤더 필요)
+
+    POST {"lang": "en", "words": [{"word": "kubectl", "frequency": 1e-5}, ...]}
+    인덱스를 다시 구축하지 않고 단어들의 접두사 목록만 교체하며, 그 접두사들의 미리
+    만든 응답을 지웁니다. prefork 모드에서는 워커마다 인덱스가 따로 있으므로 사용할
+    수 없습니다.
+    """
+    if VOCABULARY_ADMIN_TOKEN is None:
+        return jsonify({"error": "단어 추가가 비활성화되어 있습니다"}), 404
+    if request.headers.get("X-Admin-Token") != VOCABULARY_ADMIN_TOKEN:
+        return jsonify({"error": "관리자 토큰이 필요합니다"}), 403
+    if SERVER_WORKERS > 1:
+        return jsonify({"error": "prefork 모드에서는 단어를 추가할 수 없습니다"}), 409
+
+    data = request.json
+    lang = data.get("lang", "en")
+    items = data.get("words", [])
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "단어 리스트가 필요합니다"}), 400
+    words = []
+    for item in items:
+        word = item.get("word") if isinstance(item, dict) else None
+        frequency = item.get("frequency") if isinstance(item, dict) else None
+        if (
+            not isinstance(word, str)
+            or isinstance(frequency, bool)
+            or not isinstance(frequency, (int, float))
+        ):
+            return jsonify({"error": "각 단어에 word(문자열)와 frequency(숫자)가 필요합니다"}), 400
+        words.append((word, frequency))
+
+    try:
+        replaced = get_recommender().add_words(lang, words)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    invalidated = 0
+    if response_cache is not None:
+        invalidated = response_cache.invalidate(lang, [word for word, _ in words])
+    return jsonify(
+        {
+            "success": True,
+            "words": len(words),
+            "prefixes": replaced,
+            "invalidated_responses": invalidated,
+        }
+    )
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus 텍스트 형식 지표 (단계별 지연 시간 히스토그램과 캐시 통계)
+
+    prefork 모드에서는 요청을 받은 워커 프로세스의 지표만 포함합니다.
+    """
+    lines = [request_metrics.render().rstrip("\n")]
+    if response_cache is not None:
+        cache_stats = response_cache.stats()
+        lines.append("# TYPE word_trail_response_cache_hits_total counter")
+        lines.append(format_sample("word_trail_response_cache_hits_total", {}, cache_stats["hits"]))
+        lines.append("# TYPE word_trail_response_cache_misses_total counter")
+        lines.append(
+            format_sample("word_trail_response_cache_misses_total", {}, cache_stats["misses"])
+        )
+    if profile_managers:
+        lines.append("# TYPE word_trail_profile_cache gauge")
+        for lang, profile_manager in profile_managers.items():
+            for name, value in profile_manager.stats().items():
+                labels = {"lang": lang, "stat": name}
+                lines.append(format_sample("word_trail_profile_cache", labels, value))
+    return app.response_class("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5050)
+    if SERVER_WORKERS > 1:
+        prepare_prefork_master()
+        server = PreforkServer(
+            app,
+            "0.0.0.0",
+            5050,
+            SERVER_WORKERS,
+            worker_init=init_prefork_worker,
+            worker_exit=exit_prefork_worker,
+        )
+        server.serve()
+    else:
+        # 리로더가 띄운 서버 프로세스에서만 첫 요청 전에 상태를 준비
+        if is_running_from_reloader():
+            warm_up()
+        # 무거운 작업이 다른 요청을 막지 않도록 요청마다 스레드로 처리
+        app.run(debug=True, host="0.0.0.0", port=5050, threaded=True)
 
@@ -0,0 +1,215 @@
+"""인덱스 가지치기 옵션별 메모리 절감 보고서 스크립트
+
+IndexBuildOptions의 각 옵션(빈도 하한, 최대 어휘 수, 단어 종류 제외, 최대 접두사
+길이)을 하나씩, 그리고 모두 함께 적용하여 인덱스를 구축하고, 가지치기 없는
+인덱스와 비교한 메모리(tracemalloc으로 잰 인덱스 크기), 접두사 수, 항목 수를
+보고합니다. 추천 품질 영향으로 테스트 문장 접두사들의 상위 10개 추천이 그대로인
+비율과, 테스트 단어가 자기 접두사들의 상위 10개 안에 나오는 비율을 함께 보고합니다.
+
+사용 예:
+    python benchmarks/bench_pruning.py
+    python benchmarks/bench_pruning.py --languages en --floor 1e-6 --depth 4
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import (
+    default_output_path,
+    environment_info,
+    load_test_words,
+    write_report,
+)
+from src.recommender import TOKEN_CLASSES, IndexBuildOptions, WordRecommender
+from src.wordfreq_local import get_frequency_dict
+
+BENCHMARK_NAME = "pruning"
+
+DEFAULT_LANGUAGES = ["en", "it", "ja"]
+DEFAULT_FLOOR = 1e-7
+DEFAULT_MAX_VOCAB = 100_000
+DEFAULT_EXCLUDE = ("numeric", "symbol")
+DEFAULT_DEPTH = 6
+# 추천 결과 비교에 사용하는 결과 수
+AGREEMENT_TOP_N = 10
+
+MB = 1024 * 1024
+
+
+def option_sets(floor: float, max_vocab: int, exclude: frozenset[str], depth: int) -> dict[str, IndexBuildOptions]:
+    """비교할 옵션 조합 (이름 -> 옵션)"""
+    return {
+        "none": IndexBuildOptions(),
+        f"min_frequency={floor:g}": IndexBuildOptions(min_frequency=floor),
+        f"max_vocab={max_vocab}": IndexBuildOptions(max_vocab=max_vocab),
+        f"exclude={','.join(sorted(exclude))}": IndexBuildOptions(exclude_token_classes=exclude),
+        f"max_prefix_depth={depth}": IndexBuildOptions(max_prefix_depth=depth),
+        "all": IndexBuildOptions(floor, max_vocab, exclude, depth),
+    }
+
+
+def build_traced(lang: str, options: IndexBuildOptions) -> tuple[WordRecommender, float, float]:
+    """인덱스를 구축하며 남은 할당량을 측정합니다.
+
+    Returns:
+        (구축한 WordRecommender, 인덱스 크기 (MB), 구축 시간 (초, tracemalloc 포함))
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        recommender = WordRecommender(lang, build_options=options)
+        seconds = time.perf_counter() - start
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return recommender, (after - before) / MB, seconds
+
+
+def top_n_agreement(
+    reference: WordRecommender, pruned: WordRecommender, prefixes: list[str]
+) -> float:
+    """두 인덱스의 상위 추천이 같은 접두사 비율"""
+    if not prefixes:
+        return 1.0
+    same = sum(
+        1
+        for prefix in prefixes
+        if reference.recommend(prefix, AGREEMENT_TOP_N) == pruned.recommend(prefix, AGREEMENT_TOP_N)
+    )
+    return same / len(prefixes)
+
+
+def word_hit_rate(recommender: WordRecommender, cases: list[tuple[str, str]]) -> float:
+    """(접두사, 단어) 중 단어가 접두사의 상위 추천 안에 나오는 비율"""
+    if not cases:
+        return 1.0
+    hits = sum(
+        1
+        for prefix, word in cases
+        if any(candidate.lower() == word for candidate, _ in recommender.recommend(prefix, AGREEMENT_TOP_N))
+    )
+    return hits / len(cases)
+
+
+def test_cases(lang: str) -> list[tuple[str, str]]:
+    """테스트 문장 단어들과 그 모든 접두사의 (접두사, 단어) 쌍"""
+    return [
+        (word[:length], word)
+        for word in load_test_words(lang)
+        for length in range(1, len(word) + 1)
+    ]
+
+
+def run_report(languages: list[str], options: dict[str, IndexBuildOptions]) -> dict[str, Any]:
+    """언어별로 옵션 조합마다 인덱스를 구축하여 비교합니다.
+
+    Returns:
+        "언어/옵션 이름" -> {index_mb, saved_mb, saved_ratio, prefixes, entries,
+        words, build_seconds, top10_agreement, word_hit_rate}
+    """
+    results = {}
+    for lang in languages:
+        # 단어 사전은 모든 조합이 공유하므로 측정 전에 읽어 둠
+        get_frequency_dict(lang)
+        cases = test_cases(lang)
+        prefixes = list(dict.fromkeys(prefix for prefix, _ in cases))
+        reference = None
+        reference_mb = 0.0
+        for name, build_options in options.items():
+            recommender, index_mb, seconds = build_traced(lang, build_options)
+            if reference is None:
+                reference, reference_mb = recommender, index_mb
+            entries = sum(len(candidates) for candidates in recommender.prefix_index.values())
+            words = sum(1 for _ in build_options.select_words(get_frequency_dict(lang)))
+            results[f"{lang}/{name}"] = {
+                "index_mb": index_mb,
+                "saved_mb": reference_mb - index_mb,
+                "saved_ratio": 1 - index_mb / reference_mb if reference_mb else 0.0,
+                "prefixes": len(recommender.prefix_index),
+                "entries": entries,
+                "words": words,
+                "build_seconds": seconds,
+                "top10_agreement": top_n_agreement(reference, recommender, prefixes),
+                "word_hit_rate": word_hit_rate(recommender, cases),
+            }
+            del recommender
+        del reference
+        gc.collect()
+    return results
+
+
+def print_report(results: dict[str, dict[str, Any]]) -> None:
+    print("\n" + "=" * 60)
+    print("가지치기 옵션별 인덱스 크기")
+    print("=" * 60)
+    print(
+        f"{'언어/옵션':<36} {'크기(MB)':>9} {'절감(MB)':>9} {'절감률':>7} "
+        f"{'단어':>9} {'접두사':>9} {'항목':>10} {'top10 유지':>10} {'단어 적중':>9}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<36} {result['index_mb']:>9.1f} {result['saved_mb']:>9.1f} "
+            f"{result['saved_ratio'] * 100:>6.1f}% {result['words']:>9,} {result['prefixes']:>9,} "
+            f"{result['entries']:>10,} {result['top10_agreement'] * 100:>9.1f}% "
+            f"{result['word_hit_rate'] * 100:>8.1f}%"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="인덱스 가지치기 옵션별 메모리 절감 보고서")
+    parser.add_argument("--languages", default=",".join(DEFAULT_LANGUAGES), help="쉼표로 구분한 언어 코드")
+    parser.add_argument("--floor", type=float, default=DEFAULT_FLOOR, help="빈도 하한")
+    parser.add_argument("--max-vocab", type=int, default=DEFAULT_MAX_VOCAB, help="최대 어휘 수")
+    parser.add_argument(
+        "--exclude",
+        default=",".join(DEFAULT_EXCLUDE),
+        help=f"제외할 단어 종류 (쉼표로 구분, {', '.join(TOKEN_CLASSES)})",
+    )
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="최대 접두사 길이")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+    exclude = frozenset(name.strip() for name in args.exclude.split(",") if name.strip())
+    unknown = exclude - set(TOKEN_CLASSES)
+    if unknown:
+        print(f"알 수 없는 단어 종류: {', '.join(sorted(unknown))} (가능한 값: {', '.join(TOKEN_CLASSES)})")
+        sys.exit(2)
+
+    print("=" * 60)
+    print("인덱스 가지치기 옵션별 메모리 절감 보고서")
+    print("=" * 60)
+
+    options = option_sets(args.floor, args.max_vocab, exclude, args.depth)
+    results = run_report(languages, options)
+    print_report(results)
+
+    report = {
+        "benchmark": BENCHMARK_NAME,
+        "environment": environment_info(),
+        "settings": {
+            "languages": languages,
+            "options": {name: option._asdict() | {"exclude_token_classes": sorted(option.exclude_token_classes)}
+                        for name, option in options.items()},
+        },
+        "results": results,
+    }
+    output = write_report(report, args.output or default_output_path(BENCHMARK_NAME))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""추천 함수 마이크로 벤치마크 스크립트
+
+WordRecommender.recommend와 MultiLanguageRecommender.recommend의 호출별 지연 시간과
+처리량을 언어, 접두사 길이(1~6), 프로필 유무, top_n, min_frequency 조합별로 측정하고,
+오타를 하나 넣은 접두사로 recommend_fuzzy(max_edits 1, 2)의 지연 시간과, 언어를
+지정하지 않는 recommend_auto를 통합 인덱스(unified)와 언어별 결과 합치기(merge)로
+각각 측정하여 JSON으로 저장하고, 저장해 둔 기준 결과(baseline)와 비교하여 회귀를 표시합니다.
+
+사용 예:
+    python benchmarks/bench_recommend.py --save-baseline
+    python benchmarks/bench_recommend.py --compare
+    python benchmarks/bench_recommend.py --languages en --min-time 0.05
+"""
+
+import argparse
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import (
+    BASELINE_DIR,
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_results,
+    default_output_path,
+    environment_info,
+    load_report,
+    load_test_words,
+    print_comparison,
+    summarize_latencies,
+    write_report,
+)
+from src.recommender import MultiLanguageRecommender, WordRecommender
+from src.user_profile import UserProfile
+
+BENCHMARK_NAME = "recommend"
+DEFAULT_BASELINE = BASELINE_DIR / f"{BENCHMARK_NAME}.json"
+
+DEFAULT_LANGUAGES = ["en", "it", "ja"]
+PREFIX_LENGTHS = range(1, 7)
+# 접두사 길이별로 측정에 사용할 접두사 수
+DEFAULT_PREFIX_SAMPLES = 200
+# 측정 항목별 최소 측정 시간 (초)
+DEFAULT_MIN_TIME = 0.2
+
+# 기본 조합 (모든 접두사 길이에서 측정)
+DEFAULT_TOP_N = 10
+# 추가 조합 (짧은 접두사에서만 측정): (top_n, min_frequency)
+OPTION_VARIANTS = [(1, None), (50, None), (DEFAULT_TOP_N, 1e-6)]
+OPTION_PREFIX_LENGTHS = (1, 2)
+# 오타 허용 추천 조합: 접두사 길이, 최대 편집 거리, 길이별 접두사 수 (호출이 느려 적게 사용)
+FUZZY_PREFIX_LENGTHS = (2, 4, 6)
+FUZZY_MAX_EDITS = (1, 2)
+FUZZY_PREFIX_SAMPLES = 50
+# 언어 자동 추천 조합: 통합 인덱스 조회, 언어별 상위 결과 합치기
+AUTO_MODES = ("unified", "merge")
+
+SAMPLE_SEED = 42
+
+
+def sample_prefixes(
+    recommender: WordRecommender, words: list[str], length: int, count: int
+) -> list[str]:
+    """측정에 사용할 길이 length의 접두사들을 고릅니다.
+
+    테스트 문장 단어들의 접두사 중 인덱스에 있는 것을 먼저 사용하고,
+    모자라면 인덱스의 같은 길이 접두사에서 고정 시드로 채웁니다.
+
+    Args:
+        recommender: 단일 언어 추천기
+        words: 테스트 문장 단어들
+        length: 접두사 길이
+        count: 고를 접두사 수
+
+    Returns:
+        접두사 리스트 (중복 없음)
+    """
+    index = recommender.prefix_index
+    chosen: dict[str, None] = {}
+    for word in words:
+        prefix = word[:length]
+        if len(prefix) == length and prefix in index:
+            chosen[prefix] = None
+
+    prefixes = list(chosen)[:count]
+    if len(prefixes) < count:
+        rng = random.Random(f"{SAMPLE_SEED}-{recommender.lang}-{length}")
+        extra = sorted(p for p in index if len(p) == length and p not in chosen)
+        prefixes += rng.sample(extra, min(count - len(prefixes), len(extra)))
+    return prefixes
+
+
+def typo_prefixes(prefixes: list[str], seed: str) -> list[str]:
+    """접두사마다 한 글자를 다른 접두사들에 나오는 글자로 바꾼 오타 접두사를 만듭니다."""
+    rng = random.Random(f"{SAMPLE_SEED}-typo-{seed}")
+    alphabet = sorted({char for prefix in prefixes for char in prefix})
+    typos = []
+    for prefix in prefixes:
+        position = rng.randrange(len(prefix))
+        replacements = [char for char in alphabet if char != prefix[position]]
+        if replacements:
+            prefix = prefix[:position] + rng.choice(replacements) + prefix[position + 1:]
+        typos.append(prefix)
+    return typos
+
+
+def build_bench_profile(words_by_lang: dict[str, list[str]]) -> UserProfile:
+    """테스트 문장 단어들을 선택한 것으로 기록한 측정용 프로필을 만듭니다."""
+    profile = UserProfile("bench")
+    for words in words_by_lang.values():
+        for word in words:
+            for length in PREFIX_LENGTHS:
+                if length > len(word):
+                    break
+                profile.record_word_selection(word, word[:length])
+    return profile
+
+
+def measure(call, prefixes: list[str], min_time: float) -> dict[str, float]:
+    """call(prefix)를 접두사들에 대해 반복 호출하며 호출별 지연 시간을 측정합니다.
+
+    한 바퀴 예열한 뒤, 최소 min_time초 동안 (최소 한 바퀴) 측정합니다.
+
+    Args:
+        call: 접두사 하나를 받는 측정 대상 함수
+        prefixes: 측정에 사용할 접두사들
+        min_time: 최소 측정 시간 (초)
+
+    Returns:
+        지연 시간 요약과 처리량 (ops_per_sec)
+    """
+    for prefix in prefixes:
+        call(prefix)
+
+    perf_counter = time.perf_counter
+    samples = []
+    started = perf_counter()
+    while True:
+        for prefix in prefixes:
+            start = perf_counter()
+            call(prefix)
+            samples.append(perf_counter() - start)
+        if perf_counter() - started >= min_time:
+            break
+
+    summary = summarize_latencies(samples)
+    total = sum(samples)
+    summary["ops_per_sec"] = len(samples) / total if total else 0.0
+    return summary
+
+
+def case_name(
+    target: str, lang: str, length: int, mode: str, top_n: int, min_frequency: float | None
+) -> str:
+    """측정 항목 이름 (예: "word/en/len2/profile/top10/minf-none", mode는 base, profile, fuzzy1, unified 등)"""
+    threshold = "none" if min_frequency is None else f"{min_frequency:g}"
+    return f"{target}/{lang}/len{length}/{mode}/top{top_n}/minf-{threshold}"
+
+
+def run_benchmarks(
+    languages: list[str], prefix_samples: int, min_time: float
+) -> dict[str, dict[str, float]]:
+    """모든 조합을 측정합니다.
+
+    Args:
+        languages: 측정할 언어 코드 리스트
+        prefix_samples: 접두사 길이별 접두사 수
+        min_time: 항목별 최소 측정 시간 (초)
+
+    Returns:
+        항목 이름 -> 측정 결과
+    """
+    multi = MultiLanguageRecommender(languages, shared_memory=False, unified_index=True)
+    unified_index = multi.unified_index
+    words_by_lang = {lang: load_test_words(lang) for lang in languages}
+    profile = build_bench_profile(words_by_lang)
+
+    cases = [
+        (length, profiled, DEFAULT_TOP_N, None)
+        for length in PREFIX_LENGTHS
+        for profiled in (False, True)
+    ]
+    cases.extend(
+        (length, profiled, top_n, min_frequency)
+        for length in OPTION_PREFIX_LENGTHS
+        for profiled in (False, True)
+        for top_n, min_frequency in OPTION_VARIANTS
+    )
+
+    results = {}
+    for lang in languages:
+        word_recommender = multi.recommenders[lang]
+        prefixes_by_length = {
+            length: sample_prefixes(word_recommender, words_by_lang[lang], length, prefix_samples)
+            for length in PREFIX_LENGTHS
+        }
+        for length, profiled, top_n, min_frequency in cases:
+            prefixes = prefixes_by_length[length]
+            if not prefixes:
+                continue
+            user_profile = profile if profiled else None
+
+            calls = {
+                "word": partial(
+                    word_recommender.recommend,
+                    top_n=top_n,
+                    min_frequency=min_frequency,
+                    user_profile=user_profile,
+                ),
+                "multi": partial(
+                    multi.recommend,
+                    lang=lang,
+                    top_n=top_n,
+                    min_frequency=min_frequency,
+                    user_profile=user_profile,
+                ),
+            }
+            for target, call in calls.items():
+                mode = "profile" if profiled else "base"
+                name = case_name(target, lang, length, mode, top_n, min_frequency)
+                result = measure(call, prefixes, min_time)
+                result["prefixes"] = len(prefixes)
+                results[name] = result
+                print_result(name, result)
+
+        for length in FUZZY_PREFIX_LENGTHS:
+            prefixes = typo_prefixes(prefixes_by_length[length][:FUZZY_PREFIX_SAMPLES], f"{lang}-{length}")
+            if not prefixes:
+                continue
+            for max_edits in FUZZY_MAX_EDITS:
+                calls = {
+                    "word": partial(
+                        word_recommender.recommend_fuzzy, top_n=DEFAULT_TOP_N, max_edits=max_edits
+                    ),
+                    "multi": partial(
+                        multi.recommend_fuzzy, lang=lang, top_n=DEFAULT_TOP_N, max_edits=max_edits
+                    ),
+                }
+                for target, call in calls.items():
+                    name = case_name(target, lang, length, f"fuzzy{max_edits}", DEFAULT_TOP_N, None)
+                    result = measure(call, prefixes, min_time)
+                    result["prefixes"] = len(prefixes)
+                    results[name] = result
+                    print_result(name, result)
+
+        # 언어를 모르는 질의: 이 언어의 접두사로 모든 언어에서 추천
+        for length in PREFIX_LENGTHS:
+            prefixes = prefixes_by_length[length]
+            if not prefixes:
+                continue
+            for mode in AUTO_MODES:
+                multi.unified_index = unified_index if mode == "unified" else None
+                name = case_name("auto", lang, length, mode, DEFAULT_TOP_N, None)
+                result = measure(lambda p: multi.recommend_auto(p, DEFAULT_TOP_N), prefixes, min_time)
+                result["prefixes"] = len(prefixes)
+                results[name] = result
+                print_result(name, result)
+            multi.unified_index = unified_index
+    return results
+
+
+def print_result(name: str, result: dict[str, float]) -> None:
+    print(
+        f"{name:<48} p50 {result['p50_us']:>9.2f}µs  p99 {result['p99_us']:>9.2f}µs  "
+        f"{result['ops_per_sec']:>12,.0f} ops/s"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="추천 함수 마이크로 벤치마크")
+    parser.add_argument("--languages", default=",".join(DEFAULT_LANGUAGES), help="쉼표로 구분한 언어 코드")
+    parser.add_argument("--prefixes", type=int, default=DEFAULT_PREFIX_SAMPLES, help="접두사 길이별 접두사 수")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="항목별 최소 측정 시간 (초)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument(
+        "--save-baseline", nargs="?", const=DEFAULT_BASELINE, type=Path, help="결과를 기준 결과로 저장"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="기준 결과와 비교"
+    )
+    parser.add_argument("--metric", default="p50_us", help="비교할 측정값 (예: p50_us, p99_us, ops_per_sec)")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="회귀로 판단할 변화 비율"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+
+    print("=" * 60)
+    print("추천 함수 마이크로 벤치마크")
+    print("=" * 60)
+
+    results = run_benchmarks(languages, args.prefixes, args.min_time)
+    report = {
+        "benchmark": BENCHMARK_NAME,
+        "environment": environment_info(),
+        "settings": {"languages": languages, "prefixes": args.prefixes, "min_time": args.min_time},
+        "results": results,
+    }
+
+    output = write_report(report, args.output or default_output_path(BENCHMARK_NAME))
+    print(f"\n결과 저장: {output}")
+    if args.save_baseline:
+        print(f"기준 결과 저장: {write_report(report, args.save_baseline)}")
+
+    if args.compare:
+        if not args.compare.exists():
+            print(f"기준 결과가 없습니다: {args.compare} (--save-baseline으로 먼저 저장하세요)")
+            sys.exit(2)
+        baseline = load_report(args.compare)
+        rows = compare_results(
+            results,
+            baseline["results"],
+            args.metric,
+            args.threshold,
+            higher_is_better=args.metric == "ops_per_sec",
+        )
+        print("=" * 60)
+        print(f"기준 결과와 비교: {args.compare} (기준 커밋 {baseline['environment'].get('git_commit')})")
+        print("=" * 60)
+        if print_comparison(rows, args.metric):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
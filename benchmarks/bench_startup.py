@@ -0,0 +1,343 @@
+"""시작 비용(인덱스 구축) 벤치마크 스크립트
+
+언어별로 인덱스를 처음부터 만드는 단계들의 시간과 메모리를 측정합니다.
+
+    read_cBpack          wordlist 파일 읽기 (get_frequency_list)
+    get_frequency_dict   단어-빈도 딕셔너리 변환 (파일은 앞 단계에서 읽어 둔 것 사용)
+    build_prefix_index   접두사 인덱스 구축 (WordRecommender 생성)
+
+단계별로 소요 시간, RSS 증가량과 최고 RSS, tracemalloc으로 잰 할당 증가량과
+최고 할당량을 기록하고, 인덱스의 접두사 수, 항목 수, 접두사별 목록 길이 분포를
+함께 JSON 보고서로 저장합니다. tracemalloc은 실행을 느리게 하므로 시간은
+추적하지 않는 첫 번째 실행에서, 할당량은 두 번째 실행에서 측정합니다.
+언어들은 한 프로세스에서 차례로 측정하므로 최고 RSS(peak_rss_mb)에는 앞서 측정한
+언어가 남긴 메모리가 포함되며, 단계별 비교에는 증가량(*_growth_mb)을 사용합니다.
+
+사용 예:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --languages en --no-tracemalloc
+    python benchmarks/bench_startup.py --compare --metric peak_rss_mb
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import (
+    BASELINE_DIR,
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_results,
+    default_output_path,
+    environment_info,
+    load_report,
+    percentile,
+    print_comparison,
+    write_report,
+)
+from src.recommender import WordRecommender
+from src.wordfreq_local import get_frequency_dict, get_frequency_list
+
+BENCHMARK_NAME = "startup"
+DEFAULT_BASELINE = BASELINE_DIR / f"{BENCHMARK_NAME}.json"
+
+DEFAULT_LANGUAGES = ["en", "it", "ja"]
+PHASES = ("read_cBpack", "get_frequency_dict", "build_prefix_index")
+# 접두사별 목록 길이 분포의 구간 상한
+LENGTH_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000)
+
+MB = 1024 * 1024
+
+
+def _read_status_kb(field: str) -> int | None:
+    """/proc/self/status의 field 값(kB)을 읽습니다. (Linux 전용, 없으면 None)"""
+    try:
+        with open("/proc/self/status") as infile:
+            for line in infile:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def current_rss() -> int | None:
+    """현재 RSS (바이트)"""
+    kb = _read_status_kb("VmRSS")
+    return kb * 1024 if kb is not None else None
+
+
+def peak_rss() -> int | None:
+    """최고 RSS (바이트, reset_peak_rss() 이후 기준)"""
+    kb = _read_status_kb("VmHWM")
+    if kb is not None:
+        return kb * 1024
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 kB, macOS는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """최고 RSS 기록을 현재 RSS로 초기화합니다. (Linux 전용, 실패하면 False)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as outfile:
+            outfile.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def reset_caches() -> None:
+    """wordlist 캐시를 비우고 남은 객체를 정리합니다."""
+    get_frequency_list.cache_clear()
+    get_frequency_dict.cache_clear()
+    gc.collect()
+
+
+def language_phases(lang: str, wordlist: str) -> list[tuple[str, Callable[[], Any]]]:
+    """언어 하나의 단계 이름과 실행 함수 목록 (순서대로 실행해야 함)"""
+    return [
+        ("read_cBpack", lambda: get_frequency_list(lang, wordlist)),
+        ("get_frequency_dict", lambda: get_frequency_dict(lang, wordlist)),
+        ("build_prefix_index", lambda: WordRecommender(lang, wordlist)),
+    ]
+
+
+def time_phases(lang: str, wordlist: str) -> tuple[dict[str, dict[str, float]], WordRecommender]:
+    """단계별 시간과 RSS를 측정합니다. (tracemalloc 없이)
+
+    Returns:
+        (단계 이름 -> 측정값, 구축된 WordRecommender)
+    """
+    reset_caches()
+    results = {}
+    value = None
+    for phase, run in language_phases(lang, wordlist):
+        rss_before = current_rss()
+        peak_resettable = reset_peak_rss()
+        start = time.perf_counter()
+        value = run()
+        seconds = time.perf_counter() - start
+        rss_after = current_rss()
+        peak = peak_rss()
+
+        result = {"seconds": seconds}
+        if rss_before is not None and rss_after is not None:
+            result["rss_growth_mb"] = (rss_after - rss_before) / MB
+        if peak is not None:
+            result["peak_rss_mb"] = peak / MB
+            if peak_resettable and rss_before is not None:
+                result["phase_peak_growth_mb"] = (peak - rss_before) / MB
+        results[phase] = result
+    return results, value
+
+
+def trace_phases(lang: str, wordlist: str) -> dict[str, dict[str, float]]:
+    """단계별 tracemalloc 할당량을 측정합니다.
+
+    Returns:
+        단계 이름 -> {traced_growth_mb: 단계 후 남은 할당 증가량, traced_peak_mb: 단계 중 최고 증가량}
+    """
+    reset_caches()
+    results = {}
+    keep = []
+    tracemalloc.start()
+    try:
+        for phase, run in language_phases(lang, wordlist):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            keep.append(run())
+            after, peak = tracemalloc.get_traced_memory()
+            results[phase] = {
+                "traced_growth_mb": (after - before) / MB,
+                "traced_peak_mb": (peak - before) / MB,
+            }
+    finally:
+        tracemalloc.stop()
+        del keep
+        reset_caches()
+    return results
+
+
+def index_statistics(recommender: WordRecommender) -> dict[str, Any]:
+    """인덱스의 접두사 수, 항목 수, 접두사별 목록 길이 분포
+
+    Args:
+        recommender: 인덱스를 구축한 단일 언어 추천기
+
+    Returns:
+        prefixes, entries, words, list_length(분위수), length_buckets(구간별 접두사 수),
+        prefixes_by_length(접두사 길이별 접두사 수)
+    """
+    lengths = sorted(len(candidates) for candidates in recommender.prefix_index.values())
+
+    buckets = Counter()
+    for length in lengths:
+        for bound in LENGTH_BUCKETS:
+            if length <= bound:
+                buckets[f"<={bound}"] += 1
+                break
+        else:
+            buckets[f">{LENGTH_BUCKETS[-1]}"] += 1
+
+    prefix_lengths = Counter(len(prefix) for prefix in recommender.prefix_index)
+    return {
+        "prefixes": len(lengths),
+        "entries": sum(lengths),
+        "words": len(get_frequency_dict(recommender.lang, recommender.wordlist)),
+        "list_length": {
+            "mean": sum(lengths) / len(lengths) if lengths else 0.0,
+            "p50": percentile(lengths, 0.50),
+            "p90": percentile(lengths, 0.90),
+            "p99": percentile(lengths, 0.99),
+            "max": lengths[-1] if lengths else 0,
+        },
+        "length_buckets": {
+            label: buckets.get(label, 0)
+            for label in [f"<={bound}" for bound in LENGTH_BUCKETS] + [f">{LENGTH_BUCKETS[-1]}"]
+        },
+        "prefixes_by_length": {str(length): prefix_lengths[length] for length in sorted(prefix_lengths)},
+    }
+
+
+def run_benchmarks(languages: list[str], wordlist: str, trace: bool) -> dict[str, Any]:
+    """언어별로 모든 단계를 측정합니다.
+
+    Returns:
+        {"results": "언어/단계" -> 측정값, "index": 언어 -> 인덱스 통계}
+    """
+    results = {}
+    index = {}
+    for lang in languages:
+        print(f"\n[{lang}] 시간/RSS 측정")
+        phases, recommender = time_phases(lang, wordlist)
+        index[lang] = index_statistics(recommender)
+        del recommender
+
+        if trace:
+            print(f"[{lang}] tracemalloc 할당량 측정")
+            for phase, values in trace_phases(lang, wordlist).items():
+                phases[phase].update(values)
+        else:
+            reset_caches()
+
+        for phase in PHASES:
+            results[f"{lang}/{phase}"] = phases[phase]
+        total = {"seconds": sum(phases[phase]["seconds"] for phase in PHASES)}
+        peaks = [phases[phase]["peak_rss_mb"] for phase in PHASES if "peak_rss_mb" in phases[phase]]
+        if peaks:
+            total["peak_rss_mb"] = max(peaks)
+        results[f"{lang}/total"] = total
+    return {"results": results, "index": index}
+
+
+def format_column(values: dict[str, float], key: str, width: int) -> str:
+    """측정값 하나를 표의 열 너비에 맞춰 만듭니다. (값이 없으면 "-")"""
+    return f"{values[key]:>{width}.2f}" if key in values else f"{'-':>{width}}"
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """단계별 측정값과 인덱스 통계를 출력합니다."""
+    print("\n" + "=" * 60)
+    print("단계별 측정 결과")
+    print("=" * 60)
+    print(f"{'단계':<30} {'시간(s)':>9} {'RSS+(MB)':>10} {'RSS최고+(MB)':>12} {'할당+(MB)':>10} {'할당최고(MB)':>12}")
+    for name, values in report["results"].items():
+        print(
+            f"{name:<30} {format_column(values, 'seconds', 9)} "
+            f"{format_column(values, 'rss_growth_mb', 10)} "
+            f"{format_column(values, 'phase_peak_growth_mb', 12)} "
+            f"{format_column(values, 'traced_growth_mb', 10)} "
+            f"{format_column(values, 'traced_peak_mb', 12)}"
+        )
+
+    print("\n" + "=" * 60)
+    print("인덱스 통계")
+    print("=" * 60)
+    for lang, stats in report["index"].items():
+        lengths = stats["list_length"]
+        print(
+            f"[{lang}] 단어 {stats['words']:,}개, 접두사 {stats['prefixes']:,}개, "
+            f"항목 {stats['entries']:,}개"
+        )
+        print(
+            f"     목록 길이 평균 {lengths['mean']:.1f}, p50 {lengths['p50']:.0f}, "
+            f"p90 {lengths['p90']:.0f}, p99 {lengths['p99']:.0f}, 최대 {lengths['max']:,}"
+        )
+        buckets = ", ".join(f"{label}: {count:,}" for label, count in stats["length_buckets"].items())
+        print(f"     목록 길이 구간별 접두사 수: {buckets}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="시작 비용(인덱스 구축) 벤치마크")
+    parser.add_argument("--languages", default=",".join(DEFAULT_LANGUAGES), help="쉼표로 구분한 언어 코드")
+    parser.add_argument("--wordlist", default="best", help="wordfreq wordlist 옵션")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="tracemalloc 할당량 측정 생략")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument(
+        "--save-baseline", nargs="?", const=DEFAULT_BASELINE, type=Path, help="결과를 기준 결과로 저장"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="기준 결과와 비교"
+    )
+    parser.add_argument("--metric", default="seconds", help="비교할 측정값 (예: seconds, peak_rss_mb)")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="회귀로 판단할 변화 비율"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+
+    print("=" * 60)
+    print("시작 비용(인덱스 구축) 벤치마크")
+    print("=" * 60)
+
+    measured = run_benchmarks(languages, args.wordlist, trace=not args.no_tracemalloc)
+    report = {
+        "benchmark": BENCHMARK_NAME,
+        "environment": environment_info(),
+        "settings": {
+            "languages": languages,
+            "wordlist": args.wordlist,
+            "tracemalloc": not args.no_tracemalloc,
+        },
+        **measured,
+    }
+    print_report(report)
+
+    output = write_report(report, args.output or default_output_path(BENCHMARK_NAME))
+    print(f"\n결과 저장: {output}")
+    if args.save_baseline:
+        print(f"기준 결과 저장: {write_report(report, args.save_baseline)}")
+
+    if args.compare:
+        if not args.compare.exists():
+            print(f"기준 결과가 없습니다: {args.compare} (--save-baseline으로 먼저 저장하세요)")
+            sys.exit(2)
+        baseline = load_report(args.compare)
+        current = {name: values for name, values in report["results"].items() if args.metric in values}
+        rows = compare_results(current, baseline["results"], args.metric, args.threshold)
+        print("=" * 60)
+        print(f"기준 결과와 비교: {args.compare} (기준 커밋 {baseline['environment'].get('git_commit')})")
+        print("=" * 60)
+        if print_comparison(rows, args.metric):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""벤치마크 스크립트들이 공통으로 사용하는 함수 모음"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+RESULTS_DIR = BENCHMARK_DIR / "results"
+BASELINE_DIR = BENCHMARK_DIR / "baselines"
+TEST_SENTENCES_DIR = PROJECT_ROOT / "tests"
+
+# 기준값보다 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def environment_info() -> dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit,
+    }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값들의 q 분위수 (선형 보간, 값이 없으면 0.0)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize_latencies(samples: list[float]) -> dict[str, float]:
+    """지연 시간 샘플(초)의 요약 통계 (마이크로초 단위)
+
+    Args:
+        samples: 호출별 지연 시간 (초)
+
+    Returns:
+        calls, mean_us, p50_us, p95_us, p99_us, max_us
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "calls": count,
+        "mean_us": sum(ordered) / count * 1e6 if count else 0.0,
+        "p50_us": percentile(ordered, 0.50) * 1e6,
+        "p95_us": percentile(ordered, 0.95) * 1e6,
+        "p99_us": percentile(ordered, 0.99) * 1e6,
+        "max_us": ordered[-1] * 1e6 if count else 0.0,
+    }
+
+
+def load_test_words(lang: str) -> list[str]:
+    """tests/test_sentences_{lang}.txt의 문장들을 단어로 분리하여 반환합니다. (중복 제거, 순서 유지)"""
+    from main import split_sentence_to_words
+
+    path = TEST_SENTENCES_DIR / f"test_sentences_{lang}.txt"
+    words: dict[str, None] = {}
+    with open(path, encoding="utf-8") as infile:
+        for line in infile:
+            for word in split_sentence_to_words(line.strip(), lang):
+                words[word.lower()] = None
+    return list(words)
+
+
+def write_report(report: dict[str, Any], path: str | Path) -> Path:
+    """벤치마크 결과를 JSON 파일로 저장합니다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as outfile:
+        json.dump(report, outfile, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """저장된 벤치마크 결과를 읽습니다."""
+    with open(path, encoding="utf-8") as infile:
+        return json.load(infile)
+
+
+def default_output_path(name: str) -> Path:
+    """results/{name}-{시각}.json 경로"""
+    return RESULTS_DIR / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+
+
+def compare_results(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    metric: str,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    higher_is_better: bool = False,
+) -> list[dict[str, Any]]:
+    """같은 이름의 측정 항목들을 기준 결과와 비교합니다.
+
+    Args:
+        current: 항목 이름 -> 측정값 딕셔너리
+        baseline: 기준 결과 (같은 형식)
+        metric: 비교할 측정값 이름 (예: "p50_us")
+        threshold: 회귀/개선으로 판단할 변화 비율
+        higher_is_better: 값이 클수록 좋은 측정값인지 여부 (예: 처리량)
+
+    Returns:
+        항목별 {name, baseline, current, change, status} 리스트
+        (status: "regression", "improvement", "ok", "new")
+    """
+    rows = []
+    for name, values in current.items():
+        value = values[metric]
+        base_values = baseline.get(name)
+        if base_values is None or not base_values.get(metric):
+            rows.append({"name": name, "baseline": None, "current": value, "change": None, "status": "new"})
+            continue
+
+        base = base_values[metric]
+        change = (value - base) / base
+        worse = -change if higher_is_better else change
+        if worse > threshold:
+            status = "regression"
+        elif worse < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": base, "current": value, "change": change, "status": status})
+    return rows
+
+
+def print_comparison(rows: list[dict[str, Any]], metric: str) -> int:
+    """비교 결과를 출력하고 회귀 항목 수를 반환합니다."""
+    print(f"\n{'항목':<48} {'기준':>12} {'현재':>12} {'변화':>9}  ({metric})")
+    for row in rows:
+        if row["baseline"] is None:
+            print(f"{row['name']:<48} {'-':>12} {row['current']:>12.2f} {'-':>9}  new")
+            continue
+        marker = {"regression": "  << 회귀", "improvement": "  개선"}.get(row["status"], "")
+        print(
+            f"{row['name']:<48} {row['baseline']:>12.2f} {row['current']:>12.2f} "
+            f"{row['change'] * 100:>+8.1f}%{marker}"
+        )
+
+    regressions = sum(1 for row in rows if row["status"] == "regression")
+    improvements = sum(1 for row in rows if row["status"] == "improvement")
+    print(f"\n회귀 {regressions}개, 개선 {improvements}개, 전체 {len(rows)}개")
+    return regressions
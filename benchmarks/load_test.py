@@ -0,0 +1,381 @@
+"""로컬 웹 서버 부하 테스트 스크립트
+
+user_simulate/generate_user_data.py가 만드는 사용자별 문장을 한 글자씩 입력하는
+세션으로 바꾸어, 여러 가상 사용자가 동시에 /api/recommend를 호출하게 합니다.
+입력 사이에는 지정한 분포의 생각 시간(think time)을 두고, 가상 사용자 중 일부는
+서버에 프로필이 있는 사용자(개인화 요청), 나머지는 프로필 없는 사용자로 요청합니다.
+입력 중인 단어가 추천 목록에 나오면 그 단어를 고른 것으로 보고 다음 단어로 넘어가며,
+--select를 주면 프로필 사용자의 선택을 /api/select로 기록합니다.
+
+끝나면 엔드포인트/언어별 요청 수, 오류 수, 처리량(req/s), p50/p95/p99 지연 시간을
+출력하고 JSON으로 저장합니다. 서버는 미리 실행해 두어야 합니다. (uv run python app.py)
+
+사용 예:
+    python benchmarks/load_test.py --users 20 --duration 30
+    python benchmarks/load_test.py --users 50 --think exp:150 --profile-ratio 0.5
+    python benchmarks/load_test.py --url http://localhost:5050 --think none --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import (
+    default_output_path,
+    environment_info,
+    summarize_latencies,
+    write_report,
+)
+from main import split_sentence_to_words
+from user_simulate.generate_user_data import USER_PROFILES, generate_sentences_for_user
+
+BENCHMARK_NAME = "load"
+
+DEFAULT_URL = "http://localhost:5050"
+DEFAULT_LANGUAGES = ["en", "it", "ja"]
+DEFAULT_USERS = 10
+DEFAULT_DURATION = 30.0
+DEFAULT_THINK = "exp:120"
+DEFAULT_PROFILE_RATIO = 0.5
+DEFAULT_TOP_N = 10
+# 가상 사용자별로 미리 만들어 두는 문장 수
+SENTENCES_PER_USER = 200
+# 서버가 응답할 때까지 기다리는 최대 시간 (초)
+SERVER_WAIT_SECONDS = 30.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+
+def parse_think_time(spec: str) -> Callable[[random.Random], float]:
+    """생각 시간 분포 지정 문자열을 초 단위 표본 함수로 변환합니다.
+
+    Args:
+        spec: "none", "const:<ms>", "uniform:<min_ms>:<max_ms>",
+            "exp:<평균 ms>", "lognormal:<중앙값 ms>:<sigma>" 중 하나
+
+    Returns:
+        난수 생성기를 받아 생각 시간(초)을 반환하는 함수
+
+    Raises:
+        ValueError: 지정 형식이 잘못된 경우
+    """
+    kind, _, rest = spec.partition(":")
+    try:
+        params = [float(value) for value in rest.split(":")] if rest else []
+    except ValueError:
+        params = None
+    if kind == "none" and params == []:
+        return lambda rng: 0.0
+    if kind == "const" and params and len(params) == 1:
+        return lambda rng: params[0] / 1000
+    if kind == "uniform" and params and len(params) == 2:
+        return lambda rng: rng.uniform(params[0], params[1]) / 1000
+    if kind == "exp" and params and len(params) == 1 and params[0] > 0:
+        return lambda rng: rng.expovariate(1000 / params[0])
+    if kind == "lognormal" and params and len(params) == 2 and params[0] > 0:
+        return lambda rng: params[0] / 1000 * rng.lognormvariate(0.0, params[1])
+    raise ValueError(f"생각 시간 분포 형식이 잘못되었습니다: {spec!r}")
+
+
+class LoadStats:
+    """(엔드포인트, 언어)별 응답 시간과 오류 수를 모읍니다. (여러 스레드에서 기록)"""
+
+    def __init__(self):
+        self.latencies: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self.errors: dict[tuple[str, str], int] = defaultdict(int)
+        self.statuses: dict[int, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, lang: str, seconds: float, status: int | None) -> None:
+        """요청 하나의 결과를 기록합니다. (status가 None이면 연결 오류)"""
+        with self._lock:
+            self.latencies[(endpoint, lang)].append(seconds)
+            self.statuses[status or 0] += 1
+            if status is None or status >= 400:
+                self.errors[(endpoint, lang)] += 1
+
+    def summary(self, elapsed: float) -> dict[str, dict[str, float]]:
+        """항목("엔드포인트/언어", 전체는 "엔드포인트/all")별 요약
+
+        Args:
+            elapsed: 측정 시간 (초, 처리량 계산용)
+        """
+        with self._lock:
+            groups = {f"{endpoint}/{lang}": (samples, self.errors[(endpoint, lang)])
+                      for (endpoint, lang), samples in self.latencies.items()}
+            endpoints: dict[str, tuple[list[float], int]] = {}
+            for (endpoint, lang), samples in self.latencies.items():
+                merged, errors = endpoints.get(endpoint, ([], 0))
+                endpoints[endpoint] = (merged + samples, errors + self.errors[(endpoint, lang)])
+
+        results = {}
+        for name, (samples, errors) in sorted(groups.items()) + [
+            (f"{endpoint}/all", value) for endpoint, value in sorted(endpoints.items())
+        ]:
+            result = summarize_latencies(samples)
+            result["errors"] = errors
+            result["throughput"] = len(samples) / elapsed if elapsed > 0 else 0.0
+            results[name] = result
+        return results
+
+
+class ApiClient:
+    """가상 사용자 하나가 사용하는 HTTP 연결 (스레드별로 하나씩 생성)"""
+
+    def __init__(self, base_url: str):
+        parts = urlsplit(base_url)
+        self.host: str = parts.hostname or "localhost"
+        self.port: int = parts.port or 80
+        self.connection = http.client.HTTPConnection(self.host, self.port, timeout=REQUEST_TIMEOUT_SECONDS)
+
+    def request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> tuple[int | None, Any]:
+        """요청을 보내고 (상태 코드, JSON 본문)을 반환합니다. (연결 오류면 (None, None))"""
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        try:
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            # 다음 요청에서 새로 연결
+            self.connection.close()
+            return None, None
+        try:
+            return response.status, json.loads(data)
+        except ValueError:
+            return response.status, None
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class VirtualUser(threading.Thread):
+    """문장을 한 글자씩 입력하는 가상 사용자
+
+    Args:
+        index: 가상 사용자 번호 (난수 시드에 사용)
+        base_url: 서버 주소
+        lang: 입력 언어
+        persona: 문장을 생성할 사용자 유형 (예: "developer")
+        user_id: 요청에 보낼 사용자 ID (None이면 프로필 없는 요청)
+        settings: think, top_n, select, deadline, start_delay, stats
+    """
+
+    def __init__(
+        self,
+        index: int,
+        base_url: str,
+        lang: str,
+        persona: str,
+        user_id: str | None,
+        settings: dict[str, Any],
+    ):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.base_url: str = base_url
+        self.lang: str = lang
+        self.user_id: str | None = user_id
+        self.settings: dict[str, Any] = settings
+        self.rng = random.Random(index)
+        # generate_sentences_for_user는 전역 난수를 사용하므로 사용자별로 시드를 고정
+        random.seed(index)
+        self.sentences: list[str] = generate_sentences_for_user(persona, lang, SENTENCES_PER_USER)
+        self.keystrokes: int = 0
+
+    def run(self) -> None:
+        settings = self.settings
+        stats: LoadStats = settings["stats"]
+        think = settings["think"]
+        deadline = settings["deadline"]
+        client = ApiClient(self.base_url)
+        time.sleep(settings["start_delay"])
+
+        try:
+            while time.monotonic() < deadline:
+                sentence = self.rng.choice(self.sentences)
+                for word in split_sentence_to_words(sentence, self.lang):
+                    if time.monotonic() >= deadline:
+                        return
+                    self._type_word(client, stats, word, think, deadline)
+        finally:
+            client.close()
+
+    def _type_word(self, client: ApiClient, stats: LoadStats, word: str, think, deadline: float) -> None:
+        """단어를 한 글자씩 입력하며 추천을 요청하고, 추천 목록에 나오면 선택합니다."""
+        word_lower = word.lower()
+        for length in range(1, len(word) + 1):
+            if time.monotonic() >= deadline:
+                return
+            prefix = word[:length]
+            payload = {"prefix": prefix, "lang": self.lang, "top_n": self.settings["top_n"]}
+            if self.user_id:
+                payload["user_id"] = self.user_id
+            start = time.perf_counter()
+            status, body = client.request("POST", "/api/recommend", payload)
+            stats.record("/api/recommend", self.lang, time.perf_counter() - start, status)
+            self.keystrokes += 1
+
+            recommended = [item["word"].lower() for item in (body or {}).get("recommendations", [])]
+            time.sleep(think(self.rng))
+            if word_lower in recommended:
+                if self.settings["select"] and self.user_id:
+                    start = time.perf_counter()
+                    status, _ = client.request(
+                        "POST",
+                        "/api/select",
+                        {"word": word, "prefix": prefix, "user_id": self.user_id, "lang": self.lang},
+                    )
+                    stats.record("/api/select", self.lang, time.perf_counter() - start, status)
+                return
+
+
+def wait_for_server(base_url: str, wait: float = SERVER_WAIT_SECONDS) -> dict[str, list[str]]:
+    """서버가 응답할 때까지 기다리고 언어별 프로필 사용자 목록을 반환합니다.
+
+    Raises:
+        ConnectionError: wait초 안에 서버가 응답하지 않은 경우
+    """
+    client = ApiClient(base_url)
+    deadline = time.monotonic() + wait
+    try:
+        while True:
+            status, body = client.request("GET", "/api/users")
+            if status == 200 and body:
+                return body.get("users", {})
+            if time.monotonic() >= deadline:
+                raise ConnectionError(f"서버가 응답하지 않습니다: {base_url}")
+            time.sleep(0.5)
+    finally:
+        client.close()
+
+
+def plan_users(
+    count: int, languages: list[str], profile_ratio: float, profile_users: dict[str, list[str]]
+) -> list[tuple[str, str, str | None]]:
+    """가상 사용자별 (언어, 문장 유형, 요청 사용자 ID)를 정합니다.
+
+    언어는 차례로 돌아가며 배정하고, 언어마다 profile_ratio 비율만큼을 서버에
+    프로필이 있는 사용자로 요청하게 합니다.
+    """
+    plans = []
+    rng = random.Random(0)
+    for index in range(count):
+        lang = languages[index % len(languages)]
+        persona = rng.choice(list(USER_PROFILES[lang]))
+        user_id = None
+        available = profile_users.get(lang, [])
+        if available and rng.random() < profile_ratio:
+            # 서버에 같은 유형의 프로필이 있으면 그 사용자로 요청
+            user_id = persona if persona in available else rng.choice(available)
+        plans.append((lang, persona, user_id))
+    return plans
+
+
+def print_report(results: dict[str, dict[str, float]], elapsed: float, keystrokes: int) -> None:
+    print("\n" + "=" * 60)
+    print(f"부하 테스트 결과 ({elapsed:.1f}초, 입력 {keystrokes:,}회)")
+    print("=" * 60)
+    print(f"{'엔드포인트/언어':<24} {'요청':>8} {'오류':>6} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['calls']:>8,} {result['errors']:>6,} {result['throughput']:>9.1f} "
+            f"{result['p50_us'] / 1000:>9.2f} {result['p95_us'] / 1000:>9.2f} {result['p99_us'] / 1000:>9.2f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="로컬 웹 서버 부하 테스트")
+    parser.add_argument("--url", default=DEFAULT_URL, help="서버 주소")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="측정 시간 (초)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="가상 사용자를 나누어 시작하는 시간 (초)")
+    parser.add_argument("--languages", default=",".join(DEFAULT_LANGUAGES), help="쉼표로 구분한 언어 코드")
+    parser.add_argument(
+        "--think",
+        default=DEFAULT_THINK,
+        help="입력 사이 생각 시간 분포: none, const:<ms>, uniform:<min>:<max>, exp:<평균>, lognormal:<중앙값>:<sigma>",
+    )
+    parser.add_argument(
+        "--profile-ratio", type=float, default=DEFAULT_PROFILE_RATIO, help="프로필 사용자로 요청하는 가상 사용자 비율"
+    )
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N, help="요청할 추천 수")
+    parser.add_argument(
+        "--select", action="store_true", help="프로필 사용자의 단어 선택을 /api/select로 기록 (서버 선택 로그에 남음)"
+    )
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+    think = parse_think_time(args.think)
+
+    print("=" * 60)
+    print("로컬 웹 서버 부하 테스트")
+    print("=" * 60)
+
+    profile_users = wait_for_server(args.url)
+    plans = plan_users(args.users, languages, args.profile_ratio, profile_users)
+    profiled = sum(1 for _, _, user_id in plans if user_id)
+    print(f"가상 사용자 {len(plans)}명 (프로필 사용자 {profiled}명), 생각 시간 {args.think}, {args.duration}초")
+
+    stats = LoadStats()
+    start = time.monotonic()
+    deadline = start + args.ramp_up + args.duration
+    users = []
+    for index, (lang, persona, user_id) in enumerate(plans):
+        settings = {
+            "stats": stats,
+            "think": think,
+            "top_n": args.top_n,
+            "select": args.select,
+            "deadline": deadline,
+            "start_delay": args.ramp_up * index / max(len(plans), 1),
+        }
+        users.append(VirtualUser(index, args.url, lang, persona, user_id, settings))
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    elapsed = time.monotonic() - start
+
+    results = stats.summary(elapsed)
+    keystrokes = sum(user.keystrokes for user in users)
+    print_report(results, elapsed, keystrokes)
+
+    report = {
+        "benchmark": BENCHMARK_NAME,
+        "environment": environment_info(),
+        "settings": {
+            "url": args.url,
+            "users": args.users,
+            "profile_users": profiled,
+            "duration": args.duration,
+            "ramp_up": args.ramp_up,
+            "languages": languages,
+            "think": args.think,
+            "top_n": args.top_n,
+            "select": args.select,
+        },
+        "elapsed": elapsed,
+        "keystrokes": keystrokes,
+        "statuses": {str(status): count for status, count in sorted(stats.statuses.items())},
+        "results": results,
+    }
+    output = write_report(report, args.output or default_output_path(BENCHMARK_NAME))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""질의 로그 재생 벤치마크 스크립트
+
+웹 서버가 기록한 추천 질의 로그(WORD_TRAIL_QUERY_LOG_SAMPLE로 활성화)를 읽어
+실제 트래픽과 같은 질의 분포로 추천 성능을 측정합니다.
+
+    프로세스 내 재생 (기본): MultiLanguageRecommender.recommend를 직접 호출하여
+        언어/개인화 여부별 지연 시간을 측정합니다. 사용자가 있던 질의는 테스트
+        문장으로 만든 측정용 프로필로 개인화합니다.
+    HTTP 재생 (--url): 실행 중인 서버의 /api/recommend로 보냅니다. 사용자가 있던
+        질의는 --user-id 사용자로 요청합니다.
+
+로그에는 사용자 ID가 없으므로 개인화 질의는 실제 사용자 대신 대표 프로필로 재생합니다.
+
+사용 예:
+    python benchmarks/replay_queries.py
+    python benchmarks/replay_queries.py --limit 50000 --save-baseline
+    python benchmarks/replay_queries.py --url http://localhost:5050 --concurrency 8
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_recommend import build_bench_profile
+from benchmarks.common import (
+    BASELINE_DIR,
+    DEFAULT_REGRESSION_THRESHOLD,
+    PROJECT_ROOT,
+    compare_results,
+    default_output_path,
+    environment_info,
+    load_report,
+    load_test_words,
+    print_comparison,
+    summarize_latencies,
+    write_report,
+)
+from benchmarks.load_test import ApiClient, LoadStats, print_report, wait_for_server
+from src.query_log import QueryRecord, read_query_log
+from src.recommender import MultiLanguageRecommender
+
+BENCHMARK_NAME = "replay"
+DEFAULT_BASELINE = BASELINE_DIR / f"{BENCHMARK_NAME}.json"
+DEFAULT_LOG_DIR = PROJECT_ROOT / "query_logs"
+SUPPORTED_LANGUAGES = ["en", "it", "ja"]
+DEFAULT_CONCURRENCY = 4
+DEFAULT_USER_ID = "developer"
+
+
+def load_queries(log_dir: Path, limit: int | None) -> list[QueryRecord]:
+    """질의 로그를 기록 순서대로 읽습니다. (최대 limit개)"""
+    queries = []
+    for record in read_query_log(log_dir):
+        queries.append(record)
+        if limit is not None and len(queries) >= limit:
+            break
+    return queries
+
+
+def replay_in_process(queries: list[QueryRecord]) -> tuple[dict[str, dict[str, float]], float]:
+    """질의들을 추천 시스템에 직접 재생합니다.
+
+    Returns:
+        ("언어/base|profile" -> 측정 결과, 전체 재생 시간(초))
+    """
+    languages = [lang for lang in SUPPORTED_LANGUAGES if any(q.lang == lang for q in queries)]
+    recommender = MultiLanguageRecommender(languages, shared_memory=False)
+    profile = build_bench_profile({lang: load_test_words(lang) for lang in languages})
+
+    samples: dict[str, list[float]] = {}
+    perf_counter = time.perf_counter
+    started = perf_counter()
+    for query in queries:
+        if query.lang not in recommender.recommenders:
+            continue
+        user_profile = profile if query.has_user else None
+        start = perf_counter()
+        recommender.recommend(query.prefix, query.lang, query.top_n, user_profile=user_profile)
+        elapsed = perf_counter() - start
+        samples.setdefault(f"{query.lang}/{'profile' if query.has_user else 'base'}", []).append(elapsed)
+    wall = perf_counter() - started
+
+    results = {}
+    for name in sorted(samples):
+        result = summarize_latencies(samples[name])
+        total = sum(samples[name])
+        result["ops_per_sec"] = len(samples[name]) / total if total else 0.0
+        results[name] = result
+    return results, wall
+
+
+def replay_http(
+    queries: list[QueryRecord], url: str, concurrency: int, user_id: str
+) -> tuple[LoadStats, float]:
+    """질의들을 concurrency개 연결로 나누어 서버에 보냅니다. (가능한 빠르게)
+
+    Returns:
+        (엔드포인트/언어별 통계, 전체 재생 시간(초))
+    """
+    stats = LoadStats()
+
+    def worker(offset: int) -> None:
+        client = ApiClient(url)
+        try:
+            for query in queries[offset::concurrency]:
+                payload = {"prefix": query.prefix, "lang": query.lang, "top_n": query.top_n}
+                if query.has_user:
+                    payload["user_id"] = user_id
+                start = time.perf_counter()
+                status, _ = client.request("POST", "/api/recommend", payload)
+                stats.record("/api/recommend", query.lang, time.perf_counter() - start, status)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(offset,), daemon=True) for offset in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats, time.monotonic() - started
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="질의 로그 재생 벤치마크")
+    parser.add_argument("--log-dir", type=Path, default=DEFAULT_LOG_DIR, help="질의 로그 디렉토리")
+    parser.add_argument("--limit", type=int, help="재생할 최대 질의 수")
+    parser.add_argument("--url", help="HTTP로 재생할 서버 주소 (없으면 프로세스 내 재생)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="HTTP 재생 동시 연결 수")
+    parser.add_argument("--user-id", default=DEFAULT_USER_ID, help="HTTP 재생에서 개인화 질의에 사용할 사용자 ID")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument(
+        "--save-baseline", nargs="?", const=DEFAULT_BASELINE, type=Path, help="결과를 기준 결과로 저장"
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="기준 결과와 비교"
+    )
+    parser.add_argument("--metric", default="p50_us", help="비교할 측정값 (예: p50_us, p99_us)")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="회귀로 판단할 변화 비율"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 60)
+    print("질의 로그 재생 벤치마크")
+    print("=" * 60)
+
+    queries = load_queries(args.log_dir, args.limit)
+    if not queries:
+        print(f"재생할 질의가 없습니다: {args.log_dir}")
+        print("서버를 WORD_TRAIL_QUERY_LOG_SAMPLE=<비율>로 실행하여 질의를 기록하세요.")
+        sys.exit(2)
+    personalized = sum(1 for query in queries if query.has_user)
+    print(f"질의 {len(queries):,}개 (개인화 {personalized:,}개)")
+
+    if args.url:
+        wait_for_server(args.url)
+        stats, wall = replay_http(queries, args.url, args.concurrency, args.user_id)
+        results = stats.summary(wall)
+        print_report(results, wall, len(queries))
+        mode = "http"
+    else:
+        results, wall = replay_in_process(queries)
+        print(f"\n재생 시간 {wall:.2f}초 ({len(queries) / wall:,.0f} 질의/s)")
+        for name, result in results.items():
+            print(
+                f"{name:<16} {result['calls']:>9,}개  p50 {result['p50_us']:>9.2f}µs  "
+                f"p95 {result['p95_us']:>9.2f}µs  p99 {result['p99_us']:>9.2f}µs"
+            )
+        mode = "in-process"
+
+    report = {
+        "benchmark": BENCHMARK_NAME,
+        "environment": environment_info(),
+        "settings": {
+            "mode": mode,
+            "log_dir": str(args.log_dir),
+            "queries": len(queries),
+            "personalized": personalized,
+            "url": args.url,
+            "concurrency": args.concurrency if args.url else None,
+        },
+        "elapsed": wall,
+        "results": results,
+    }
+    output = write_report(report, args.output or default_output_path(BENCHMARK_NAME))
+    print(f"\n결과 저장: {output}")
+    if args.save_baseline:
+        print(f"기준 결과 저장: {write_report(report, args.save_baseline)}")
+
+    if args.compare:
+        if not args.compare.exists():
+            print(f"기준 결과가 없습니다: {args.compare} (--save-baseline으로 먼저 저장하세요)")
+            sys.exit(2)
+        baseline = load_report(args.compare)
+        rows = compare_results(results, baseline["results"], args.metric, args.threshold)
+        print("=" * 60)
+        print(f"기준 결과와 비교: {args.compare} (기준 커밋 {baseline['environment'].get('git_commit')})")
+        print("=" * 60)
+        if print_comparison(rows, args.metric):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from src.metrics import stage
+from src.next_word import NextWordModel
 from src.recommender import MultiLanguageRecommender
 from src.user_profile import UserProfile
 
@@ -152,31 +154,49 @@ def test_sentence_autocomplete(
     lang: str,
     user_profile: UserProfile | None = None,
     return_word_details: bool = False,
+    next_word_model: NextWordModel | None = None,
+    next_word_top_n: int = 10,
 ) -> dict[str, Any] | None:
     """문장에 대해 자동완성 효율을 테스트합니다.
     
+    next_word_model이 있으면 단어 경계마다(빈 접두사) 다음 단어 예측을 먼저 확인하여,
+    예측 목록에 단어가 있으면 한 글자도 입력하지 않은 것으로 계산한 결과를 함께 반환합니다.
+    
     Args:
         recommender: 추천 시스템 인스턴스
         sentence: 테스트할 문장
         lang: 언어 코드
         user_profile: 사용자 프로필
         return_word_details: True면 각 단어별 상세 정보 반환
+        next_word_model: 다음 단어 예측 모델 (None이면 접두사 자동완성만 측정)
+        next_word_top_n: 다음 단어 예측 목록 크기
     
     Returns:
         테스트 결과 딕셔너리
     """
     # 문장을 언어에 맞게 단어로 분리
-    words: list[str] = split_sentence_to_words(sentence, lang)
+    with stage("tokenize"):
+        words: list[str] = split_sentence_to_words(sentence, lang)
     
     if not words:
         return None
     
     total_chars_without_autocomplete = 0
     total_chars_with_autocomplete = 0
+    next_word_hits = 0
+    next_word_chars_saved = 0
     word_details: list[dict[str, Any]] = []
+    words_lower: list[str] = [word.lower() for word in words]
     
-    for word in words:
-        word_lower: str = word.lower()
+    for i, word in enumerate(words):
+        word_lower: str = words_lower[i]
+        
+        # 단어 경계 직후 다음 단어 예측에 나오는지 확인
+        predicted_next = False
+        if next_word_model is not None:
+            with stage("next_word"):
+                predictions = next_word_model.predict(words_lower[:i], top_n=next_word_top_n)
+            predicted_next = any(predicted == word_lower for predicted, _ in predictions)
         
         if return_word_details:
             result = find_min_prefix_for_word(
@@ -201,6 +221,8 @@ def test_sentence_autocomplete(
                     for rec_word, score in recommendations
                 ]
             }
+            if next_word_model is not None:
+                word_detail['predicted_next'] = predicted_next
             
             # 일본어인 경우 로마자 변환 추가
             if lang == "ja" and romaji_converter:
@@ -217,6 +239,9 @@ def test_sentence_autocomplete(
         
         total_chars_without_autocomplete += len(word_lower)
         total_chars_with_autocomplete += prefix_len
+        if predicted_next:
+            next_word_hits += 1
+            next_word_chars_saved += prefix_len
     
     result: dict[str, Any] = {
         'sentence': sentence,
@@ -228,6 +253,14 @@ def test_sentence_autocomplete(
         'savings_rate': (1 - total_chars_with_autocomplete / total_chars_without_autocomplete) * 100 if total_chars_without_autocomplete > 0 else 0
     }
     
+    if next_word_model is not None:
+        # 예측이 맞은 단어는 접두사를 입력하지 않아도 되므로 그만큼 추가로 절약
+        total_chars_with_next_word = total_chars_with_autocomplete - next_word_chars_saved
+        result['next_word_hits'] = next_word_hits
+        result['next_word_chars_saved'] = next_word_chars_saved
+        result['total_chars_with_next_word'] = total_chars_with_next_word
+        result['savings_rate_with_next_word'] = (1 - total_chars_with_next_word / total_chars_without_autocomplete) * 100 if total_chars_without_autocomplete > 0 else 0
+    
     if return_word_details:
         result['word_details'] = word_details
     
@@ -294,9 +327,18 @@ def main():
     print("문장 자동완성 효율 테스트")
     print("=" * 60)
     
-    # 파일에서 테스트 문장 읽기
-    test_sentences_from_files(recommender)
+    # 사용자 문장 파일로 다음 단어 예측 모델 구축 (문장 파일이 없으면 생략)
+    next_word_models: dict[str, NextWordModel] = {}
+    try:
+        from user_simulate.build_profiles import build_next_word_models
+        
+        next_word_models = build_next_word_models()
+    except Exception as e:
+        print(f"다음 단어 예측 모델 구축 실패: {e}")
     
+    # 파일에서 테스트 문장 읽기
+    test_sentences_from_files(recommender, next_word_models)
+
 
 
 def load_test_sentences(lang: str) -> list[str]:
@@ -324,12 +366,19 @@ def load_test_sentences(lang: str) -> list[str]:
     return sentences
 
 
-def test_sentences_from_files(recommender: MultiLanguageRecommender) -> None:
+def test_sentences_from_files(
+    recommender: MultiLanguageRecommender,
+    next_word_models: dict[str, NextWordModel] | None = None,
+) -> None:
     """각 언어별 테스트 문장 파일을 읽어서 테스트합니다.
     
     Args:
         recommender: 추천 시스템 인스턴스
+        next_word_models: 언어별 다음 단어 예측 모델 (있는 언어는 추가 절약도 출력)
     """
+    if next_word_models is None:
+        next_word_models = {}
+    
     languages: dict[str, str] = {
         'en': '영어',
         'it': '이탈리아어',
@@ -351,7 +400,9 @@ def test_sentences_from_files(recommender: MultiLanguageRecommender) -> None:
             if i % 10 == 0 or i == len(sentences):
                 print(f"[{lang_name}] 처리 중: {i}/{len(sentences)} 문장...", end='\r')
             
-            result = test_sentence_autocomplete(recommender, sentence, lang=lang_code)
+            result = test_sentence_autocomplete(
+                recommender, sentence, lang=lang_code, next_word_model=next_word_models.get(lang_code)
+            )
             if result:
                 lang_results.append(result)
         
@@ -376,6 +427,16 @@ def test_sentences_from_files(recommender: MultiLanguageRecommender) -> None:
                 print(f"  문장 수: {len(results)}")
                 print(f"  평균 절약률: {avg_savings_rate:.1f}%")
                 print(f"  총 절약 글자: {total_chars_saved}")
+                
+                if lang_code in next_word_models:
+                    next_word_hits = sum(r['next_word_hits'] for r in results)
+                    word_count = sum(r['word_count'] for r in results)
+                    next_word_saved = sum(r['next_word_chars_saved'] for r in results)
+                    total_with_next_word = total_chars_with - next_word_saved
+                    rate_with_next_word = (1 - total_with_next_word / total_chars_without) * 100 if total_chars_without > 0 else 0
+                    print(f"  다음 단어 예측 적중: {next_word_hits}/{word_count} 단어")
+                    print(f"  다음 단어 예측 추가 절약 글자: {next_word_saved}")
+                    print(f"  다음 단어 예측 포함 절약률: {rate_with_next_word:.1f}% (접두사만: {(1 - total_chars_with / total_chars_without) * 100:.1f}%)")
         
         # 전체 합계
         all_total_without = sum(
@@ -392,6 +453,16 @@ def test_sentences_from_files(recommender: MultiLanguageRecommender) -> None:
         print(f"\n전체 합계:")
         print(f"  총 절약 글자 수: {all_total_saved}")
         print(f"  전체 평균 절약률: {all_avg_rate:.1f}%")
+        
+        if next_word_models:
+            # 예측 모델이 없는 언어는 접두사 자동완성 결과 그대로 합산
+            all_total_with_next_word = sum(
+                r.get('total_chars_with_next_word', r['total_chars_with'])
+                for results in all_results.values()
+                for r in results
+            )
+            all_rate_with_next_word = (1 - all_total_with_next_word / all_total_without) * 100 if all_total_without > 0 else 0
+            print(f"  다음 단어 예측 포함 절약률: {all_rate_with_next_word:.1f}%")
 
 
 
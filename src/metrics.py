@@ -0,0 +1,190 @@
+"""요청 단계별 지연 시간 측정 모듈
+
+요청 하나를 처리하는 동안 단계(로마자 변환, 인덱스 조회, 개인화 점수 계산,
+직렬화, 프로필 조회 등)별로 걸린 시간을 모아 엔드포인트/언어/단계별
+히스토그램에 기록하고, Prometheus 텍스트 형식으로 내보냅니다.
+
+측정 중인 요청이 없으면 stage()는 아무 일도 하지 않는 컨텍스트를 반환하므로
+추천 코드에 측정 구간을 넣어도 평소 비용은 거의 없습니다.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+
+# 히스토그램 버킷 상한 (초): 10µs ~ 10s
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+METRIC_NAME = "word_trail_stage_seconds"
+
+_current_timer: ContextVar["StageTimer | None"] = ContextVar("stage_timer", default=None)
+_NULL_STAGE = nullcontext()
+
+
+class StageTimer:
+    """요청 하나의 단계별 소요 시간 (같은 단계가 여러 번 실행되면 합산)"""
+    
+    __slots__ = ("durations",)
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 name 단계에 더합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """단계 소요 시간을 더합니다."""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def merge(self, durations: dict[str, float]) -> None:
+        """다른 곳(예: 워커 프로세스)에서 측정한 단계 시간들을 더합니다."""
+        for name, seconds in durations.items():
+            self.add(name, seconds)
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        """with 블록 안에서 stage()가 이 타이머에 기록하도록 설정합니다."""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+
+def stage(name: str) -> AbstractContextManager:
+    """현재 측정 중인 요청의 name 단계 구간을 만듭니다. (측정 중이 아니면 아무 일도 안 함)"""
+    timer = _current_timer.get()
+    if timer is None:
+        return _NULL_STAGE
+    return timer.stage(name)
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = buckets
+        # 마지막 칸은 가장 큰 버킷을 넘는 값 (+Inf)
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """버킷별 누적 개수 (마지막은 +Inf 버킷)"""
+        cumulative = []
+        total = 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def quantile(self, q: float) -> float:
+        """버킷 경계로 근사한 분위수 (값이 없으면 0.0)"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        # +Inf 버킷에 해당하는 마지막 누적 개수는 건너뜀
+        for bound, total in zip(self.buckets, self.cumulative_counts(), strict=False):
+            if total >= rank:
+                return bound
+        return self.buckets[-1]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    """Prometheus 레이블 문자열 ({key="value",...})"""
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape_label(str(value))}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    """Prometheus 텍스트 형식의 샘플 한 줄"""
+    return f"{name}{format_labels(labels)} {value}"
+
+
+class MetricsRegistry:
+    """(엔드포인트, 언어, 단계)별 지연 시간 히스토그램 모음"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = buckets
+        self.histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, lang: str, stage_name: str, seconds: float) -> None:
+        """단계 소요 시간 하나를 기록합니다."""
+        key = (endpoint, lang, stage_name)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def track(self, endpoint: str, lang: str) -> Iterator[StageTimer]:
+        """with 블록을 요청 하나로 측정하고 끝나면 단계별 시간과 전체 시간을 기록합니다.
+        
+        Args:
+            endpoint: 엔드포인트 이름 (레이블)
+            lang: 언어 코드 (레이블)
+        
+        Yields:
+            단계 시간을 모으는 StageTimer
+        """
+        timer = StageTimer()
+        start = time.perf_counter()
+        with timer.activate():
+            try:
+                yield timer
+            finally:
+                total = time.perf_counter() - start
+                for stage_name, seconds in timer.durations.items():
+                    self.observe(endpoint, lang, stage_name, seconds)
+                self.observe(endpoint, lang, "total", total)
+
+    def render(self) -> str:
+        """모든 히스토그램을 Prometheus 텍스트 형식으로 반환합니다."""
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent per request stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            items = sorted(self.histograms.items())
+            snapshots = [
+                (key, histogram.cumulative_counts(), histogram.sum, histogram.count)
+                for key, histogram in items
+            ]
+        
+        for (endpoint, lang, stage_name), cumulative, total, count in snapshots:
+            labels = {"endpoint": endpoint, "lang": lang, "stage": stage_name}
+            bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+            for bound, value in zip(bounds, cumulative, strict=True):
+                lines.append(format_sample(f"{METRIC_NAME}_bucket", {**labels, "le": bound}, value))
+            lines.append(format_sample(f"{METRIC_NAME}_sum", labels, total))
+            lines.append(format_sample(f"{METRIC_NAME}_count", labels, count))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,209 @@
+"""다음 단어 예측 모듈
+
+사용자 문장들에서 바이그램/트라이그램 횟수를 모아, 단어 경계 뒤(빈 접두사)에서
+다음에 올 단어를 예측합니다. 접두사 자동완성은 단어마다 최소 한 글자를 입력해야
+하지만, 다음 단어 예측이 맞으면 그 단어는 한 글자도 입력하지 않아도 됩니다.
+
+단어는 정수 ID로 바꾸고, 문맥(이전 단어 1개 또는 2개)별 다음 단어 목록을
+CSR 형식 배열에 저장합니다. 문맥마다 횟수 상위 max_successors개만 횟수
+내림차순으로 미리 정렬해 두므로, 예측은 문맥을 이진 탐색으로 찾은 뒤 앞에서부터
+읽기만 합니다.
+
+점수는 stupid backoff 방식입니다: 트라이그램 문맥에서 나온 단어는
+횟수 / 문맥 전체 횟수, 바이그램에서만 나온 단어는 BACKOFF_WEIGHT를 곱합니다.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+# 문장 시작을 나타내는 문맥 단어 (ID 0)
+SENTENCE_START = "<s>"
+# 문맥별로 저장하는 최대 다음 단어 수
+DEFAULT_MAX_SUCCESSORS = 32
+# 트라이그램 문맥에 없는 단어의 바이그램 점수에 곱하는 가중치
+BACKOFF_WEIGHT = 0.4
+
+
+class SuccessorTable:
+    """문맥 키별 다음 단어 ID와 횟수를 저장하는 배열 테이블
+    
+    context_keys는 정렬된 문맥 키, offsets[i]:offsets[i + 1]은 i번째 문맥의
+    successors/counts 구간이며, totals[i]는 잘라내기 전 문맥의 전체 횟수입니다.
+    """
+    
+    __slots__ = ("context_keys", "counts", "offsets", "successors", "totals")
+
+    def __init__(self, counts: dict[int, Counter[int]], max_successors: int):
+        """SuccessorTable 초기화
+        
+        Args:
+            counts: 문맥 키 -> 다음 단어 ID별 횟수
+            max_successors: 문맥별로 저장할 최대 다음 단어 수
+        """
+        self.context_keys = array("Q")
+        self.offsets = array("I", [0])
+        self.successors = array("I")
+        self.counts = array("I")
+        self.totals = array("I")
+        
+        for key in sorted(counts):
+            successors = counts[key]
+            # 횟수 내림차순, 같으면 ID(먼저 나온 단어) 순
+            top = sorted(successors.items(), key=lambda item: (-item[1], item[0]))[:max_successors]
+            self.context_keys.append(key)
+            self.successors.extend(word_id for word_id, _ in top)
+            self.counts.extend(count for _, count in top)
+            self.offsets.append(len(self.successors))
+            self.totals.append(sum(successors.values()))
+
+    def __len__(self) -> int:
+        return len(self.context_keys)
+
+    def find(self, key: int) -> int:
+        """문맥 키의 위치를 이진 탐색으로 찾습니다. (없으면 -1)"""
+        position = bisect_left(self.context_keys, key)
+        if position < len(self.context_keys) and self.context_keys[position] == key:
+            return position
+        return -1
+
+    def nbytes(self) -> int:
+        """배열들이 차지하는 바이트 수"""
+        return sum(
+            len(values) * values.itemsize
+            for values in (self.context_keys, self.offsets, self.successors, self.counts, self.totals)
+        )
+
+
+class NextWordModel:
+    """바이그램/트라이그램 다음 단어 예측 모델
+    
+    build()로 단어 리스트(문장별)에서 구축합니다. 단어는 소문자로 저장합니다.
+    """
+
+    def __init__(self, words: list[str], bigrams: SuccessorTable, trigrams: SuccessorTable):
+        """NextWordModel 초기화 (build() 사용 권장)
+        
+        Args:
+            words: ID 순서의 단어 목록 (0번은 SENTENCE_START)
+            bigrams: 이전 단어 ID -> 다음 단어 테이블
+            trigrams: (이전 두 단어 ID 쌍 키) -> 다음 단어 테이블
+        """
+        self.words: list[str] = words
+        self.word_ids: dict[str, int] = {word: word_id for word_id, word in enumerate(words)}
+        self.bigrams: SuccessorTable = bigrams
+        self.trigrams: SuccessorTable = trigrams
+
+    @classmethod
+    def build(
+        cls, sentences: Iterable[Sequence[str]], max_successors: int = DEFAULT_MAX_SUCCESSORS
+    ) -> "NextWordModel":
+        """문장들(단어 리스트)에서 모델을 구축합니다.
+        
+        각 문장 앞에 SENTENCE_START를 붙여 문장 첫 단어도 예측할 수 있게 합니다.
+        
+        Args:
+            sentences: 문장별 단어 리스트
+            max_successors: 문맥별로 저장할 최대 다음 단어 수
+        
+        Returns:
+            구축된 NextWordModel
+        """
+        words = [SENTENCE_START]
+        word_ids = {SENTENCE_START: 0}
+        sentence_ids: list[list[int]] = []
+        for sentence in sentences:
+            ids = [0]
+            for word in sentence:
+                word = word.lower()
+                word_id = word_ids.get(word)
+                if word_id is None:
+                    word_id = word_ids[word] = len(words)
+                    words.append(word)
+                ids.append(word_id)
+            sentence_ids.append(ids)
+        
+        # 트라이그램 문맥 키는 (첫 단어 ID * 어휘 수 + 둘째 단어 ID)
+        vocab_size = len(words)
+        bigram_counts: dict[int, Counter[int]] = {}
+        trigram_counts: dict[int, Counter[int]] = {}
+        for ids in sentence_ids:
+            for i in range(1, len(ids)):
+                bigram_counts.setdefault(ids[i - 1], Counter())[ids[i]] += 1
+                if i >= 2:
+                    key = ids[i - 2] * vocab_size + ids[i - 1]
+                    trigram_counts.setdefault(key, Counter())[ids[i]] += 1
+        
+        return cls(
+            words,
+            SuccessorTable(bigram_counts, max_successors),
+            SuccessorTable(trigram_counts, max_successors),
+        )
+
+    def predict(
+        self, previous_words: Sequence[str], top_n: int = 10, prefix: str = ""
+    ) -> list[tuple[str, float]]:
+        """이전 단어들 뒤에 올 다음 단어를 예측합니다.
+        
+        Args:
+            previous_words: 같은 문장에서 앞에 입력한 단어들 (빈 리스트면 문장 첫 단어 예측)
+            top_n: 반환할 최대 단어 개수
+            prefix: 다음 단어의 이미 입력한 접두사 (빈 문자열이면 단어 경계 직후)
+        
+        Returns:
+            (단어, 점수) 튜플의 리스트, 점수 순으로 정렬됨 (알 수 없는 문맥이면 빈 리스트)
+        """
+        if top_n <= 0:
+            return []
+        
+        # 문장 시작(ID 0) 뒤에 이어지는 마지막 두 단어 (모르는 단어는 -1)
+        context = [0] + [self.word_ids.get(word.lower(), -1) for word in previous_words[-2:]]
+        last = context[-1]
+        if last < 0:
+            return []
+        prefix = prefix.lower()
+        
+        # 트라이그램 점수가 있는 단어는 그 점수를, 없으면 바이그램 점수에 가중치를 곱해 사용
+        scores: dict[int, float] = {}
+        weight = 1.0
+        if len(context) >= 2:
+            before = context[-2]
+            if before >= 0:
+                self._collect(self.trigrams, before * len(self.words) + last, 1.0, prefix, scores)
+            weight = BACKOFF_WEIGHT
+        self._collect(self.bigrams, last, weight, prefix, scores)
+        
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_n]
+        return [(self.words[word_id], score) for word_id, score in ranked]
+
+    def _collect(
+        self, table: SuccessorTable, key: int, weight: float, prefix: str, scores: dict[int, float]
+    ) -> None:
+        """테이블에서 문맥의 다음 단어들을 점수에 더합니다. (이미 점수가 있는 단어는 그대로)"""
+        position = table.find(key)
+        if position < 0:
+            return
+        total = table.totals[position]
+        for i in range(table.offsets[position], table.offsets[position + 1]):
+            word_id = table.successors[i]
+            if word_id in scores or (prefix and not self.words[word_id].startswith(prefix)):
+                continue
+            scores[word_id] = weight * table.counts[i] / total
+
+    def memory_usage(self) -> int:
+        """모델이 차지하는 메모리 크기(바이트)를 추정합니다. (단어 문자열과 ID 딕셔너리 포함)"""
+        total = sys.getsizeof(self.words) + sys.getsizeof(self.word_ids)
+        total += sum(sys.getsizeof(word) for word in self.words)
+        return total + self.bigrams.nbytes() + self.trigrams.nbytes()
+
+    def stats(self) -> dict[str, int]:
+        """어휘 수, 문맥 수, 저장한 다음 단어 항목 수"""
+        return {
+            "vocabulary": len(self.words) - 1,
+            "bigram_contexts": len(self.bigrams),
+            "bigram_entries": len(self.bigrams.successors),
+            "trigram_contexts": len(self.trigrams),
+            "trigram_entries": len(self.trigrams.successors),
+        }
@@ -0,0 +1,247 @@
+"""여러 워커 프로세스로 웹 앱을 실행하는 prefork 서버 모듈
+
+마스터 프로세스가 인덱스와 프로필을 한 번만 로드한 뒤 gc.freeze()로 고정하고
+워커들을 fork합니다. 워커들은 같은 리스닝 소켓에서 요청을 받으며, 마스터가
+로드한 객체를 copy-on-write로 공유하므로 워커를 늘려도 인덱스가 복제되지 않습니다.
+"""
+
+import contextlib
+import gc
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from typing import Any
+
+from werkzeug.serving import make_server
+
+# /proc/<pid>/smaps_rollup에서 읽는 항목 (kB 단위)
+MEMORY_FIELDS = ("Rss", "Pss", "Private_Clean", "Private_Dirty", "Shared_Clean", "Shared_Dirty")
+
+
+def freeze_shared_state() -> None:
+    """지금까지 만든 객체들을 GC 추적 대상에서 제외합니다.
+    
+    fork 후 워커에서 GC가 공유 객체의 헤더를 건드리면 해당 메모리 페이지가
+    복사되므로, fork 직전에 호출하여 공유 상태를 영구 세대로 옮깁니다.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def read_process_memory(pid: int) -> dict[str, int] | None:
+    """프로세스의 메모리 사용량을 읽습니다. (Linux 전용)
+    
+    Args:
+        pid: 프로세스 ID
+    
+    Returns:
+        항목별 바이트 수와 unique(해당 프로세스만 쓰는 메모리) 값 (읽을 수 없으면 None)
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as infile:
+            lines = infile.readlines()
+    except OSError:
+        return None
+    
+    memory = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        if name in MEMORY_FIELDS:
+            memory[name.lower()] = int(value.split()[0]) * 1024
+    memory["unique"] = memory.get("private_clean", 0) + memory.get("private_dirty", 0)
+    return memory
+
+
+class PreforkServer:
+    """마스터가 워커 프로세스들을 fork하여 관리하는 WSGI 서버
+    
+    워커가 비정상 종료하면 같은 자리에 새 워커를 띄웁니다. 마스터에 SIGUSR1을
+    보내면 프로세스별 메모리 사용량을 출력합니다.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        host: str,
+        port: int,
+        workers: int,
+        worker_init: Callable[[int, int], None] | None = None,
+        worker_exit: Callable[[], None] | None = None,
+        threaded: bool = True,
+    ):
+        """PreforkServer 초기화
+        
+        Args:
+            app: WSGI 애플리케이션
+            host: 바인드할 호스트
+            port: 바인드할 포트
+            workers: 워커 프로세스 수
+            worker_init: fork 직후 워커에서 호출할 함수 (워커 번호, 생성 번호)
+                생성 번호는 워커를 다시 띄울 때마다 증가하는 고유 번호
+            worker_exit: 워커가 종료될 때 호출할 정리 함수
+            threaded: 워커 안에서 요청마다 스레드를 사용할지 여부
+        """
+        if workers <= 0:
+            raise ValueError("워커 수는 1 이상이어야 합니다")
+        
+        self.app = app
+        self.host: str = host
+        self.port: int = port
+        self.workers: int = workers
+        self.worker_init = worker_init
+        self.worker_exit = worker_exit
+        self.threaded: bool = threaded
+        
+        # 워커 pid -> 워커 번호
+        self.children: dict[int, int] = {}
+        self._generation: int = 0
+        self._socket: socket.socket | None = None
+        self._stopping: bool = False
+
+    def serve(self, report_delay: float = 5.0) -> None:
+        """소켓을 열고 워커들을 띄운 뒤 종료 신호를 받을 때까지 관리합니다.
+        
+        Args:
+            report_delay: 시작 후 메모리 사용량을 한 번 출력할 때까지의 시간 (초)
+        """
+        self._socket = socket.create_server((self.host, self.port), reuse_port=False)
+        self._socket.set_inheritable(True)
+        
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGUSR1, lambda *_: self.print_memory_report())
+        
+        print(f"prefork 서버 시작: http://{self.host}:{self.port} (워커 {self.workers}개)")
+        for slot in range(self.workers):
+            self._spawn(slot)
+        
+        report_at = time.monotonic() + report_delay
+        try:
+            while not self._stopping:
+                self._reap()
+                if report_at is not None and time.monotonic() >= report_at:
+                    self.print_memory_report()
+                    report_at = None
+                time.sleep(0.5)
+        finally:
+            self._stop_children()
+            self._socket.close()
+
+    def _spawn(self, slot: int) -> None:
+        """워커 하나를 fork합니다."""
+        generation = self._generation
+        self._generation += 1
+        
+        pid = os.fork()
+        if pid:
+            self.children[pid] = slot
+            return
+        
+        # 워커 프로세스: 여기서 반환하지 않고 종료
+        exit_code = 0
+        try:
+            self._run_worker(slot, generation)
+        except BaseException as e:
+            if not isinstance(e, SystemExit):
+                print(f"[worker {slot}] 오류로 종료: {e}")
+                exit_code = 1
+        finally:
+            if self.worker_exit is not None:
+                self.worker_exit()
+            os._exit(exit_code)
+
+    def _run_worker(self, slot: int, generation: int) -> None:
+        """워커 프로세스에서 요청을 처리합니다."""
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C는 마스터가 처리
+        signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, self._handle_worker_stop)
+        
+        if self.worker_init is not None:
+            self.worker_init(slot, generation)
+        
+        server = make_server(
+            self.host, self.port, self.app, threaded=self.threaded, fd=self._socket.fileno()
+        )
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+    @staticmethod
+    def _handle_worker_stop(signum: int, frame: Any) -> None:
+        raise SystemExit(0)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        self._stopping = True
+
+    def _reap(self) -> None:
+        """종료된 워커를 정리하고 같은 자리에 새 워커를 띄웁니다."""
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            slot = self.children.pop(pid, None)
+            if slot is None:
+                continue
+            print(f"[worker {slot}] 종료됨 (pid {pid}, 상태 {status}), 다시 시작합니다")
+            if not self._stopping:
+                self._spawn(slot)
+
+    def _stop_children(self, timeout: float = 10.0) -> None:
+        """모든 워커에 종료 신호를 보내고 끝날 때까지 기다립니다."""
+        for pid in self.children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        
+        deadline = time.monotonic() + timeout
+        while self.children and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                time.sleep(0.1)
+                continue
+            self.children.pop(pid, None)
+        
+        for pid in self.children:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.clear()
+
+    def memory_report(self) -> list[dict[str, Any]]:
+        """마스터와 워커들의 메모리 사용량을 반환합니다.
+        
+        Returns:
+            프로세스별 정보 리스트 (role, slot, pid와 read_process_memory() 항목들)
+        """
+        report = []
+        processes = [("master", None, os.getpid())]
+        processes += [("worker", slot, pid) for pid, slot in sorted(self.children.items())]
+        for role, slot, pid in processes:
+            memory = read_process_memory(pid)
+            if memory is not None:
+                report.append({"role": role, "slot": slot, "pid": pid, **memory})
+        return report
+
+    def print_memory_report(self) -> None:
+        """프로세스별 메모리 사용량과 워커당 추가 메모리를 출력합니다."""
+        report = self.memory_report()
+        if not report:
+            print("메모리 사용량을 읽을 수 없습니다 (/proc 필요)")
+            return
+        
+        mb = 1024 * 1024
+        print("\n프로세스별 메모리 (MB)       RSS      PSS   unique")
+        for entry in report:
+            name = "master" if entry["role"] == "master" else f"worker {entry['slot']}"
+            print(
+                f"  {name:<10} pid {entry['pid']:<8} "
+                f"{entry['rss'] / mb:8.1f} {entry['pss'] / mb:8.1f} {entry['unique'] / mb:8.1f}"
+            )
+        
+        workers = [entry for entry in report if entry["role"] == "worker"]
+        if workers:
+            extra = sum(entry["unique"] for entry in workers) / len(workers)
+            total = sum(entry["pss"] for entry in report)
+            print(f"  워커당 추가 메모리 (unique 평균): {extra / mb:.1f}MB")
+            print(f"  전체 실제 사용량 (PSS 합계): {total / mb:.1f}MB\n")
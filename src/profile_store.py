@@ -0,0 +1,123 @@
+"""사용자 프로필 디스크 저장소 모듈
+
+UserProfileManager가 메모리 한도를 넘을 때 내보낸(evict) 프로필을
+SQLite 파일에 보관하고, 다시 필요할 때 읽어옵니다.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import msgpack
+
+from src.user_profile import UserProfile
+
+
+class SQLiteProfileStore:
+    """SQLite 기반 프로필 저장소
+    
+    프로필은 to_dict() 결과를 msgpack으로 직렬화하여 user_id별 한 행에 저장합니다.
+    여러 스레드에서 사용할 수 있도록 연결 하나를 락으로 보호합니다.
+    """
+
+    def __init__(self, path: str | Path):
+        """SQLiteProfileStore 초기화
+        
+        Args:
+            path: SQLite 파일 경로 (상위 폴더가 없으면 생성)
+        """
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        # 저장소는 재시작 시 비우는 임시 공간이므로 동기화 수준을 낮춰 쓰기 비용을 줄임
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles (user_id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+        )
+
+    def put(self, profile: UserProfile) -> None:
+        """프로필을 저장합니다. (같은 user_id가 있으면 덮어씀)
+        
+        Args:
+            profile: 저장할 프로필
+        """
+        data = msgpack.packb(profile.to_dict())
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (user_id, data) VALUES (?, ?)",
+                (profile.user_id, data),
+            )
+
+    def get(self, user_id: str) -> UserProfile | None:
+        """프로필을 읽어옵니다.
+        
+        Args:
+            user_id: 사용자 ID
+        
+        Returns:
+            저장된 프로필 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return UserProfile.from_dict(msgpack.unpackb(row[0], raw=False))
+
+    def pop(self, user_id: str) -> UserProfile | None:
+        """프로필을 읽어오고 저장소에서 삭제합니다.
+        
+        Args:
+            user_id: 사용자 ID
+        
+        Returns:
+            저장되어 있던 프로필 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("DELETE FROM profiles WHERE user_id = ?", (user_id,))
+        return UserProfile.from_dict(msgpack.unpackb(row[0], raw=False))
+
+    def user_ids(self) -> list[str]:
+        """저장된 프로필들의 사용자 ID 리스트"""
+        with self._lock:
+            rows = self._conn.execute("SELECT user_id FROM profiles").fetchall()
+        return [row[0] for row in rows]
+
+    def iter_profiles(self) -> Iterator[UserProfile]:
+        """저장된 프로필들을 순서대로 복원하여 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM profiles").fetchall()
+        for (data,) in rows:
+            yield UserProfile.from_dict(msgpack.unpackb(data, raw=False))
+
+    def clear(self) -> None:
+        """저장된 프로필을 모두 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM profiles")
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()
+        return count
@@ -0,0 +1,198 @@
+"""추천 요청 질의 로그 모듈
+
+들어오는 추천 요청 중 일부를 표본으로 골라 (시각, 언어, 접두사, top_n, 사용자 유무)를
+추가 전용 바이너리 로그에 기록합니다. 기록한 로그는 부하 재현(replay)과 시작 시
+캐시 예열(자주 들어온 질의의 응답을 미리 계산)에 사용합니다.
+사용자 ID는 기록하지 않습니다.
+
+로그 디렉토리 구성:
+    queries.000001.log   로그 세그먼트 (번호 순으로 읽음)
+
+각 레코드는 segment_log 형식(4바이트 길이 + msgpack 페이로드)의
+[timestamp, lang, prefix, top_n, has_user]입니다.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from src.segment_log import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    SegmentedLog,
+    encode_record,
+    iter_segment_records,
+)
+from src.segment_log import list_segments as list_log_segments
+
+SEGMENT_PREFIX = "queries."
+
+# 세그먼트를 교체하는 크기와 보관할 최대 세그먼트 수
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+
+
+class QueryRecord(NamedTuple):
+    """기록된 추천 질의 하나"""
+    
+    timestamp: float
+    lang: str
+    prefix: str
+    top_n: int
+    has_user: bool
+
+
+def list_segments(directory: str | Path) -> list[tuple[int, Path]]:
+    """디렉토리의 질의 로그 세그먼트를 번호 순으로 반환합니다.
+    
+    Args:
+        directory: 로그 디렉토리
+    
+    Returns:
+        (세그먼트 번호, 파일 경로) 튜플 리스트
+    """
+    return list_log_segments(directory, SEGMENT_PREFIX)
+
+
+def iter_segment(path: str | Path) -> Iterator[QueryRecord]:
+    """로그 세그먼트의 질의들을 순서대로 읽습니다. (잘린 마지막 레코드는 무시)
+    
+    Args:
+        path: 로그 세그먼트 경로
+    
+    Yields:
+        QueryRecord
+    """
+    return iter_segment_records(path, lambda fields: QueryRecord(*fields))
+
+
+def read_query_log(directory: str | Path) -> Iterator[QueryRecord]:
+    """디렉토리의 모든 세그먼트에서 질의들을 기록 순서대로 읽습니다. (디렉토리가 없으면 빈 결과)"""
+    if not Path(directory).is_dir():
+        return
+    for _, path in list_segments(directory):
+        yield from iter_segment(path)
+
+
+def frequent_queries(
+    records: Iterable[QueryRecord],
+    count: int,
+    normalize: Callable[[str, str], str] | None = None,
+    include_personalized: bool = False,
+) -> list[tuple[str, str, int]]:
+    """가장 자주 기록된 (언어, 접두사, top_n) 질의들을 고릅니다.
+    
+    Args:
+        records: 기록된 질의들
+        count: 고를 질의 수
+        normalize: (접두사, 언어)를 받아 정규화한 접두사를 반환하는 함수 (None이면 그대로)
+        include_personalized: 사용자가 있던(개인화된) 질의도 셀지 여부
+    
+    Returns:
+        빈도 내림차순 (언어, 접두사, top_n) 리스트
+    """
+    counts: Counter[tuple[str, str, int]] = Counter()
+    for record in records:
+        if record.has_user and not include_personalized:
+            continue
+        prefix = normalize(record.prefix, record.lang) if normalize else record.prefix
+        counts[(record.lang, prefix, record.top_n)] += 1
+    return [query for query, _ in counts.most_common(count)]
+
+
+class QueryLog(SegmentedLog):
+    """추천 질의를 표본 추출하여 기록하는 추가 전용 로그
+    
+    쓰기는 버퍼링되며 데몬 스레드가 flush_interval마다(또는 버퍼가 찰 때) 디스크로
+    내보냅니다. 활성 세그먼트가 segment_bytes를 넘으면 새 세그먼트로 교체하고, 오래된
+    세그먼트는 max_segments개만 남기고 지웁니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        sample_rate: float = 1.0,
+        segment_bytes: int | None = DEFAULT_SEGMENT_BYTES,
+        max_segments: int | None = DEFAULT_MAX_SEGMENTS,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """QueryLog 초기화
+        
+        기존 세그먼트에는 이어 쓰지 않고 항상 새 세그먼트를 엽니다. 이전 실행에서
+        아무것도 기록하지 않은 빈 세그먼트는 지우고 그 번호를 다시 사용합니다.
+        
+        Args:
+            directory: 로그 디렉토리
+            sample_rate: 기록할 질의 비율 (0~1)
+            segment_bytes: 세그먼트를 교체하는 크기 (바이트, None이면 교체하지 않음)
+            max_segments: 보관할 최대 세그먼트 수 (None이면 지우지 않음)
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            flush_interval: 버퍼를 강제로 flush하는 최대 간격 (초)
+        """
+        self.sample_rate: float = sample_rate
+        self.segment_bytes: int | None = segment_bytes
+        self.max_segments: int | None = max_segments
+        self.recorded: int = 0
+        super().__init__(directory, SEGMENT_PREFIX, buffer_size, flush_interval)
+        self._prune()
+
+    def _prune(self) -> None:
+        """보관 개수를 넘는 오래된 세그먼트를 지웁니다. (활성 세그먼트 제외)"""
+        if self.max_segments is None:
+            return
+        closed = [path for seq, path in self.segments() if seq < self.seq]
+        for path in closed[:max(len(closed) - self.max_segments + 1, 0)]:
+            path.unlink(missing_ok=True)
+
+    def maybe_record(self, prefix: str, lang: str, top_n: int, has_user: bool) -> bool:
+        """sample_rate 확률로 질의를 기록합니다.
+        
+        Returns:
+            기록했으면 True
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+        self.append(prefix, lang, top_n, has_user)
+        return True
+
+    def append(self, prefix: str, lang: str, top_n: int, has_user: bool) -> None:
+        """질의를 로그에 추가합니다.
+        
+        Args:
+            prefix: 요청한 접두사 (정규화 전)
+            lang: 언어 코드
+            top_n: 요청한 결과 수
+            has_user: 사용자 ID가 있는(개인화) 요청인지 여부
+        """
+        record = encode_record([round(time.time(), 3), lang, prefix, top_n, has_user])
+        
+        with self._lock:
+            self._write(record)
+            self.recorded += 1
+            
+            rotated = self.segment_bytes is not None and self._segment_bytes >= self.segment_bytes
+            if rotated:
+                self._switch_segment(self.seq + 1)
+        
+        if rotated:
+            self._prune()
+
+    def reopen(self, seq: int) -> None:
+        """fork된 자식 프로세스에서 다른 프로세스와 겹치지 않는 세그먼트로 전환합니다.
+        
+        여러 프로세스가 같은 디렉토리에 쓰는 동안에는 교체한 세그먼트 번호가 다른
+        프로세스와 겹치거나 다른 프로세스의 활성 세그먼트를 지울 수 있으므로
+        세그먼트 교체와 정리를 끕니다. 정리는 다음 시작 시 단일 프로세스에서 진행합니다.
+        
+        Args:
+            seq: 새로 열 세그먼트 번호 (부모와 다른 자식들이 쓰지 않는 번호)
+        """
+        self.segment_bytes = None
+        self.max_segments = None
+        super().reopen(seq)
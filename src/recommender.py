@@ -1,11 +1,229 @@
 """단어 자동완성 추천 시스템 모듈"""
 
+import atexit
+import heapq
+import os
+import threading
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import count, islice
+from typing import NamedTuple
 
+from src.metrics import stage
 from src.romaji_to_hiragana import normalize_japanese_input
+from src.shared_index import SharedPrefixIndex, publish_prefix_index, shared_index_name
+from src.unified_index import UnifiedPrefixIndex
 from src.user_profile import UserProfile
 from src.wordfreq_local import get_frequency_dict, word_frequency
 
+# 모든 언어에서 한 번에 추천하는 언어 코드 (MultiLanguageRecommender.recommend_auto 참고)
+AUTO_LANGUAGE = "auto"
+
+# 인덱스에서 제외할 수 있는 단어 종류 (token_class() 참고)
+TOKEN_CLASSES = ("word", "alphanumeric", "numeric", "symbol")
+
+# 오타 허용 추천에서 편집 한 번마다 빈도에 곱하는 배율
+FUZZY_EDIT_PENALTY = 0.01
+# 오타 허용 추천 한 번의 최대 탐색 단계 수 (힙에서 꺼내는 횟수, 지연 시간 상한)
+FUZZY_MAX_STEPS = 5000
+# 자식 접두사 목록을 캐시하는 접두사 길이 (이보다 짧은 접두사는 자식이 많고 자주 열림)
+FUZZY_CACHED_CHILD_DEPTH = 2
+
+# 오타 허용 추천의 탐색 항목 종류 (recommend_fuzzy 참고)
+_FUZZY_CHILD, _FUZZY_NODE, _FUZZY_MATCH, _FUZZY_SCAN, _FUZZY_WORD = range(5)
+# 접두사로 시작하는 모든 문자열보다 큰 접미사 (정렬된 접두사 목록에서 하위 접두사 건너뛰기용)
+_LAST_CHAR = "\U0010ffff"
+
+
+def token_class(word: str) -> str:
+    """단어의 종류를 구분합니다.
+    
+    Args:
+        word: 단어
+    
+    Returns:
+        "word" (문자만), "alphanumeric" (문자와 숫자, 예: "2nd"),
+        "numeric" (숫자는 있고 문자는 없음, 예: "1,000"),
+        "symbol" (문자와 숫자가 모두 없음, 예: "©", 이모지) 중 하나
+    """
+    has_letter = has_digit = False
+    for char in word:
+        category = unicodedata.category(char)[0]
+        if category in "LM":
+            has_letter = True
+        elif category == "N":
+            has_digit = True
+    if has_letter:
+        return "alphanumeric" if has_digit else "word"
+    return "numeric" if has_digit else "symbol"
+
+
+def frequency_cutoff(candidates: Sequence[tuple[str, float]], min_frequency: float) -> int:
+    """빈도 내림차순 목록에서 빈도가 min_frequency 이상인 앞부분의 길이를 이진 탐색으로 구합니다.
+    
+    Args:
+        candidates: 빈도 내림차순 (단어, 빈도) 목록 (리스트 또는 PostingList)
+        min_frequency: 최소 빈도
+    
+    Returns:
+        candidates[:반환값]이 빈도 min_frequency 이상인 항목들
+    """
+    return bisect_right(candidates, -min_frequency, key=lambda candidate: -candidate[1])
+
+
+def replace_candidate(
+    candidates: Iterable[tuple[str, float]],
+    word: str,
+    frequency: float,
+    old_frequency: float | None = None,
+) -> list[tuple[str, float]]:
+    """빈도 내림차순 목록에서 단어의 항목을 새 빈도로 옮긴 새 목록을 만듭니다. (원래 목록은 그대로)
+    
+    Args:
+        candidates: 빈도 내림차순 (단어, 빈도) 목록 (리스트 또는 PostingList)
+        word: 추가하거나 빈도를 바꿀 단어
+        frequency: 새 빈도
+        old_frequency: 목록에 이미 있는 항목의 빈도 (None이면 새 단어, 소문자가 같은 항목을 교체)
+    
+    Returns:
+        빈도 내림차순이 유지된 새 목록 (같은 빈도의 단어들 중에서는 마지막)
+    """
+    updated = list(candidates)
+    if old_frequency is not None:
+        word_lower = word.lower()
+        start = bisect_left(updated, -old_frequency, key=lambda candidate: -candidate[1])
+        for i in range(start, len(updated)):
+            if updated[i][1] != old_frequency:
+                break
+            if updated[i][0].lower() == word_lower:
+                del updated[i]
+                break
+    updated.insert(frequency_cutoff(updated, frequency), (word, frequency))
+    return updated
+
+
+def next_edit_row(row: list[int], query: str, char: str, length: int, max_edits: int) -> list[int]:
+    """편집 거리 표의 다음 행을 max_edits 이내 구간만 계산합니다.
+    
+    길이 length인 문자열과 query[:j]의 거리는 |length - j| 이상이므로 그 차이가
+    max_edits 이하인 칸만 계산하고, max_edits를 넘는 값은 모두 max_edits + 1로 둡니다.
+    
+    Args:
+        row: 문자열 s에 대한 행 (row[j]는 s와 query[:j]의 편집 거리)
+        query: 입력 문자열
+        char: s 뒤에 붙일 문자
+        length: s + char의 길이
+        max_edits: 정확히 계산할 최대 편집 거리
+    
+    Returns:
+        s + char에 대한 행
+    """
+    limit = max_edits + 1
+    next_row = [limit] * len(row)
+    next_row[0] = min(length, limit)
+    for j in range(max(1, length - max_edits), min(len(query), length + max_edits) + 1):
+        next_row[j] = min(
+            row[j] + 1,
+            next_row[j - 1] + 1,
+            row[j - 1] + (query[j - 1] != char),
+            limit,
+        )
+    return next_row
+
+
+def child_prefixes_in(keys: Sequence[str], prefix: str) -> Iterator[str]:
+    """정렬된 접두사 목록에서 prefix 뒤에 한 글자를 붙인 접두사들을 찾습니다.
+    
+    prefix로 시작하는 구간을 자식 접두사마다 이진 탐색으로 건너뛰므로, 자식 수에
+    비례하는 시간이 걸립니다. (손자 접두사들은 보지 않음)
+    """
+    size = len(keys)
+    child_length = len(prefix) + 1
+    position = bisect_right(keys, prefix)
+    while position < size:
+        key = keys[position]
+        if not key.startswith(prefix):
+            break
+        child = key[:child_length]
+        yield child
+        position = bisect_left(keys, child + _LAST_CHAR, position + 1)
+
+
+class PrefixIndexOverlay(Mapping):
+    """읽기 전용 접두사 인덱스(공유 메모리 인덱스 등) 위에 바뀐 접두사 목록만 덮어쓰는 인덱스
+    
+    덮어쓴 목록은 이 프로세스에만 있으며, 바뀌지 않은 접두사는 원래 인덱스에서 읽습니다.
+    """
+
+    def __init__(self, base: Mapping[str, Sequence[tuple[str, float]]]):
+        self.base: Mapping[str, Sequence[tuple[str, float]]] = base
+        self.overrides: dict[str, list[tuple[str, float]]] = {}
+        # base에 없고 덮어쓰기로 새로 생긴 접두사 수와 그 접두사들의 정렬된 목록
+        # (목록은 add_prefixes()로 한 번에 교체)
+        self._added: int = 0
+        self.added_prefixes: list[str] = []
+
+    def __getitem__(self, prefix: str) -> Sequence[tuple[str, float]]:
+        candidates = self.overrides.get(prefix)
+        if candidates is not None:
+            return candidates
+        return self.base[prefix]
+
+    def __setitem__(self, prefix: str, candidates: list[tuple[str, float]]) -> None:
+        if prefix not in self.overrides and prefix not in self.base:
+            self._added += 1
+        self.overrides[prefix] = candidates
+
+    def __contains__(self, prefix: object) -> bool:
+        return prefix in self.overrides or prefix in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for prefix in list(self.overrides):
+            if prefix not in self.base:
+                yield prefix
+
+    def __len__(self) -> int:
+        return len(self.base) + self._added
+
+    def add_prefixes(self, prefixes: Iterable[str]) -> None:
+        """덮어쓰기로 새로 생긴 접두사들을 정렬된 목록에 넣습니다.
+        
+        조회 중인 스레드가 있으므로 새로 정렬한 목록으로 교체합니다.
+        """
+        self.added_prefixes = sorted([*self.added_prefixes, *prefixes])
+
+
+class IndexBuildOptions(NamedTuple):
+    """접두사 인덱스 구축 옵션 (기본값은 모든 단어와 모든 접두사를 인덱싱)
+    
+    Attributes:
+        min_frequency: 이 빈도 미만의 단어는 인덱싱하지 않음
+        max_vocab: 빈도 상위 이 개수의 단어만 인덱싱
+        exclude_token_classes: 인덱싱하지 않을 단어 종류 (예: {"numeric", "symbol"})
+        max_prefix_depth: 이 길이까지의 접두사만 인덱싱
+            (더 긴 접두사는 이 길이 접두사의 목록을 걸러서 조회)
+    """
+    
+    min_frequency: float | None = None
+    max_vocab: int | None = None
+    exclude_token_classes: frozenset[str] = frozenset()
+    max_prefix_depth: int | None = None
+
+    def select_words(self, freq_dict: Mapping[str, float]) -> Iterator[tuple[str, float]]:
+        """빈도 내림차순 단어-빈도 딕셔너리에서 인덱싱할 (단어, 빈도)를 고릅니다."""
+        words: Iterable[tuple[str, float]] = freq_dict.items()
+        if self.min_frequency is not None:
+            words = ((word, freq) for word, freq in words if freq >= self.min_frequency)
+        if self.exclude_token_classes:
+            excluded = self.exclude_token_classes
+            words = ((word, freq) for word, freq in words if token_class(word) not in excluded)
+        if self.max_vocab is not None:
+            words = islice(words, self.max_vocab)
+        return iter(words)
+
 
 class WordRecommender:
     """접두사 기반 단어 추천 클래스
@@ -14,34 +232,145 @@ class WordRecommender:
     접두사로 시작하는 단어들을 빈도 순으로 정렬하여 반환합니다.
     """
 
-    def __init__(self, lang: str = "en", wordlist: str = "best"):
+    def __init__(
+        self,
+        lang: str = "en",
+        wordlist: str = "best",
+        prefix_index: Mapping[str, Sequence[tuple[str, float]]] | None = None,
+        build_options: IndexBuildOptions | None = None,
+    ):
         """WordRecommender 초기화
         
         Args:
             lang: 언어 코드 (예: 'en', 'it', 'ja')
             wordlist: wordfreq의 wordlist 옵션 ('best', 'small', 'large')
+            prefix_index: 이미 구축된 접두사 인덱스 (None이면 새로 구축)
+            build_options: 인덱스 구축 옵션 (None이면 가지치기 없음, prefix_index를
+                넘기는 경우에는 그 인덱스의 max_prefix_depth를 알리는 데 사용)
         """
         self.lang: str = lang
         self.wordlist: str = wordlist
-        self.prefix_index: dict[str, list[tuple[str, float]]] = defaultdict(list)
-        self._build_prefix_index()
+        self.build_options: IndexBuildOptions = build_options or IndexBuildOptions()
+        self.max_prefix_depth: int | None = self.build_options.max_prefix_depth
+        if prefix_index is not None:
+            self.prefix_index: Mapping[str, Sequence[tuple[str, float]]] = prefix_index
+        else:
+            self.prefix_index = defaultdict(list)
+            self._build_prefix_index()
+        # 정렬된 접두사 목록과 짧은 접두사의 자식 목록 (오타 허용 추천에서 처음 사용할 때 만듦)
+        self._sorted_keys: list[str] | None = None
+        self._children_cache: dict[str, list[tuple[str, float]]] = {}
+        # 단어 추가(add_words)는 한 번에 하나씩 (조회는 락 없이 진행, 추가 중 캐시 갱신에서 다시 잡음)
+        self._write_lock = threading.RLock()
+        # add_words로 추가하거나 바꾼 단어(소문자)의 빈도 (get_word_frequency가 wordfreq보다 우선)
+        self._added_frequencies: dict[str, float] = {}
+
+    @classmethod
+    def from_shared_index(
+        cls, lang: str = "en", wordlist: str = "best", name: str | None = None
+    ) -> "WordRecommender":
+        """다른 프로세스가 게시한 공유 메모리 인덱스에 연결하여 생성합니다.
+        
+        Args:
+            lang: 언어 코드
+            wordlist: wordfreq의 wordlist 옵션
+            name: 세그먼트 이름 (None이면 언어와 wordlist로 결정)
+        
+        Returns:
+            공유 인덱스를 읽기 전용으로 사용하는 WordRecommender
+        
+        Raises:
+            FileNotFoundError: 게시된 세그먼트가 없는 경우
+        """
+        name = name or shared_index_name(lang, wordlist)
+        index = SharedPrefixIndex.attach(name)
+        options = IndexBuildOptions(max_prefix_depth=index.max_prefix_depth)
+        return cls(lang, wordlist, prefix_index=index, build_options=options)
+
+    def publish_shared_index(self, name: str | None = None) -> SharedPrefixIndex:
+        """접두사 인덱스를 공유 메모리에 게시하고 이후 게시한 인덱스를 사용합니다.
+        
+        프로세스별 인덱스는 해제되며, 세그먼트는 이 프로세스가 종료될 때 삭제됩니다.
+        (이미 연결한 다른 프로세스는 계속 사용할 수 있음)
+        
+        Args:
+            name: 세그먼트 이름 (None이면 언어와 wordlist로 결정)
+        
+        Returns:
+            게시된 SharedPrefixIndex
+        
+        Raises:
+            FileExistsError: 같은 이름의 세그먼트가 이미 있는 경우
+        """
+        name = name or shared_index_name(self.lang, self.wordlist)
+        shm = publish_prefix_index(self.prefix_index, name, self.max_prefix_depth)
+        owner_pid = os.getpid()
+
+        @atexit.register
+        def unlink_segment() -> None:
+            # fork된 자식 프로세스가 종료될 때는 지우지 않음
+            if os.getpid() == owner_pid:
+                shm.unlink()
+        
+        self.prefix_index = SharedPrefixIndex(shm)
+        self._sorted_keys = None
+        self._children_cache = {}
+        return self.prefix_index
+
+    @classmethod
+    def shared(
+        cls,
+        lang: str = "en",
+        wordlist: str = "best",
+        build_options: IndexBuildOptions | None = None,
+    ) -> "WordRecommender":
+        """공유 인덱스가 있으면 연결하고, 없으면 구축하여 게시합니다.
+        
+        이미 게시된 세그먼트에 연결하는 경우 build_options는 사용되지 않습니다.
+        
+        Args:
+            lang: 언어 코드
+            wordlist: wordfreq의 wordlist 옵션
+            build_options: 새로 구축할 때의 인덱스 구축 옵션
+        
+        Returns:
+            공유 인덱스를 사용하는 WordRecommender
+        """
+        try:
+            recommender = cls.from_shared_index(lang, wordlist)
+            print(f"[{lang}] 공유 인덱스 연결: {len(recommender.prefix_index)}개 접두사")
+            return recommender
+        except (FileNotFoundError, ValueError):
+            pass
+        
+        recommender = cls(lang, wordlist, build_options=build_options)
+        try:
+            recommender.publish_shared_index()
+            print(f"[{lang}] 공유 인덱스 게시: {shared_index_name(lang, wordlist)}")
+        except FileExistsError:
+            # 다른 프로세스가 먼저 게시한 경우 그 세그먼트를 사용
+            return cls.from_shared_index(lang, wordlist)
+        return recommender
 
     def _build_prefix_index(self) -> None:
         """접두사별 인덱스 구축
         
-        모든 단어에 대해 가능한 접두사들을 생성하고,
-        각 접두사에 대해 (단어, 빈도) 튜플을 저장합니다.
+        build_options로 고른 단어들에 대해 가능한 접두사들을 생성하고
+        (max_prefix_depth가 있으면 그 길이까지), 각 접두사에 대해
+        (단어, 빈도) 튜플을 저장합니다.
         """
         print(f"[{self.lang}] 접두사 인덱스 구축 중...")
         
-        # 전체 단어-빈도 딕셔너리 가져오기
+        # 전체 단어-빈도 딕셔너리 가져오기 (빈도 내림차순)
         freq_dict = get_frequency_dict(self.lang, self.wordlist)
+        depth = self.max_prefix_depth
         
         # 각 단어에 대해 접두사 인덱스 구축
-        for word, frequency in freq_dict.items():
+        for word, frequency in self.build_options.select_words(freq_dict):
             word_lower = word.lower()
-            # 단어의 모든 접두사 생성 (최소 1글자부터)
-            for i in range(1, len(word_lower) + 1):
+            length = len(word_lower) if depth is None else min(len(word_lower), depth)
+            # 단어의 접두사 생성 (최소 1글자부터)
+            for i in range(1, length + 1):
                 prefix = word_lower[:i]
                 self.prefix_index[prefix].append((word, frequency))
         
@@ -51,6 +380,56 @@ class WordRecommender:
         
         print(f"[{self.lang}] 인덱스 구축 완료: {len(self.prefix_index)}개 접두사")
 
+    def _candidates(self, prefix_lower: str) -> Sequence[tuple[str, float]]:
+        """접두사로 시작하는 (단어, 빈도) 목록 (빈도 내림차순)
+        
+        max_prefix_depth보다 긴 접두사는 인덱스에 없으므로 그 길이 접두사의
+        목록에서 접두사로 시작하는 단어만 골라 반환합니다.
+        """
+        depth = self.max_prefix_depth
+        if depth is None or len(prefix_lower) <= depth:
+            return self.prefix_index.get(prefix_lower, [])
+        return [
+            (word, freq)
+            for word, freq in self.prefix_index.get(prefix_lower[:depth], [])
+            if word.lower().startswith(prefix_lower)
+        ]
+
+    def _sorted_prefixes(self) -> list[Sequence[str]]:
+        """인덱스의 접두사들을 정렬한 목록들 (서로 겹치지 않으며 합치면 전체 접두사)
+        
+        공유 인덱스는 복사 없이 세그먼트에서 읽고, 그 위에 단어를 추가했으면 새로 생긴
+        접두사들의 정렬된 목록을 함께 반환합니다. 그 밖의 인덱스는 한 번 정렬해 둡니다.
+        """
+        index = self.prefix_index
+        if isinstance(index, PrefixIndexOverlay) and isinstance(index.base, SharedPrefixIndex):
+            return [index.base.sorted_prefixes(), index.added_prefixes]
+        if isinstance(index, SharedPrefixIndex):
+            return [index.sorted_prefixes()]
+        if self._sorted_keys is None:
+            # 단어 추가 도중에 만든 목록에 새 접두사가 빠지지 않도록 쓰기 락을 잡고 만듦
+            with self._write_lock:
+                if self._sorted_keys is None:
+                    self._sorted_keys = sorted(self.prefix_index)
+        return [self._sorted_keys]
+
+    def _child_prefixes(self, prefix: str) -> Iterator[str]:
+        """인덱스에서 prefix 뒤에 한 글자를 붙인 접두사들을 찾습니다. (child_prefixes_in 참고)
+        
+        정렬된 접두사 목록이 여러 개이면 목록마다 찾고, 겹치는 자식은 한 번만 반환합니다.
+        """
+        runs = self._sorted_prefixes()
+        if len(runs) == 1:
+            yield from child_prefixes_in(runs[0], prefix)
+            return
+        
+        seen: set[str] = set()
+        for keys in runs:
+            for child in child_prefixes_in(keys, prefix):
+                if child not in seen:
+                    seen.add(child)
+                    yield child
+
     def recommend(
         self,
         prefix: str,
@@ -73,29 +452,362 @@ class WordRecommender:
         """
         prefix_lower = prefix.lower()
         
-        # 접두사로 시작하는 단어들 가져오기
-        candidates = self.prefix_index.get(prefix_lower, [])
+        with stage("lookup"):
+            # 접두사로 시작하는 단어들 가져오기
+            candidates = self._candidates(prefix_lower)
+            
+            # 최소 빈도 필터링: 빈도 내림차순이므로 candidates[:end]만 임계값 이상
+            if min_frequency is not None:
+                end = frequency_cutoff(candidates, min_frequency)
+            else:
+                end = len(candidates)
+            
+            # 사용자 프로필이 없으면 기본 빈도 순으로 정렬
+            if not user_profile:
+                stop = min(top_n, end) if top_n >= 0 else max(end + top_n, 0)
+                return list(candidates[:stop])
         
-        # 최소 빈도 필터링
-        if min_frequency is not None:
-            candidates = [(word, freq) for word, freq in candidates if freq >= min_frequency]
-        
-        # 사용자 프로필이 있으면 개인화된 점수 계산
-        if user_profile:
-            scored_candidates = []
-            for word, base_freq in candidates:
-                personalized_score = user_profile.get_word_score(word, base_freq)
-                scored_candidates.append((word, personalized_score))
+        # 사용자 프로필이 있으면 개인화된 점수로 상위 top_n개 선택
+        with stage("personalize"):
+            return self._recommend_personalized(
+                candidates, prefix_lower, top_n, user_profile, min_frequency, end
+            )
+
+    def _recommend_personalized(
+        self,
+        candidates: list[tuple[str, float]],
+        prefix_lower: str,
+        top_n: int,
+        user_profile: UserProfile,
+        min_frequency: float | None = None,
+        end: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """빈도 내림차순 후보 목록의 앞 end개에서 개인화 점수 상위 top_n개를 선택합니다.
+        
+        개인화 점수는 사용하지 않은 단어에서는 기본 빈도와 같고, 사용한 단어에서는
+        기본 빈도 * 배율입니다. 접두사로 시작하는 사용 단어들(get_word_boosts)은
+        후보 목록의 위치와 관계없이 인덱스 빈도로 점수를 미리 계산해 두고, 현재 후보의
+        빈도가 k번째 점수 이하이고 아직 만나지 않은 이 단어들의 점수도 k번째 점수보다
+        작으면 탐색을 멈춥니다. 멈춘 뒤의 후보는 모두 k번째 점수를 넘지 못하므로 결과는
+        전체 후보를 점수순으로 정렬한 것과 같으며, O(접두사로 시작하는 사용 단어 수 +
+        훑은 후보 수)입니다.
+        """
+        if top_n <= 0:
+            return []
+        
+        boosts = user_profile.get_word_boosts(prefix_lower)
+        
+        # 아직 만나지 않은 사용 단어들의 점수 (최대 힙, 인덱스에 없는 단어는 제외)
+        pending: list[tuple[float, str]] = []
+        for word_lower, boost in boosts.items():
+            frequency = self._lookup_frequency(word_lower)
+            if frequency > 0 and (min_frequency is None or frequency >= min_frequency):
+                pending.append((-frequency * boost, word_lower))
+        heapq.heapify(pending)
+        visited: set[str] = set()
+        
+        # (점수, -순서, 단어) 최소 힙: 점수가 같으면 앞선 후보가 우선
+        top: list[tuple[float, int, str]] = []
+        for index, (word, base_freq) in enumerate(islice(candidates, end)):
+            if len(top) >= top_n:
+                threshold = top[0][0]
+                if base_freq <= threshold:
+                    while pending and pending[0][1] in visited:
+                        heapq.heappop(pending)
+                    if not pending or -pending[0][0] < threshold:
+                        break
+            
+            word_lower = word.lower()
+            boost = boosts.get(word_lower)
+            if boost is None:
+                score = base_freq  # 사용하지 않은 단어 (배율 1)
+            else:
+                score = base_freq * boost
+                visited.add(word_lower)
             
-            # 개인화된 점수로 정렬
-            scored_candidates.sort(key=lambda x: x[1], reverse=True)
-            return scored_candidates[:top_n]
+            item = (score, -index, word)
+            if len(top) < top_n:
+                heapq.heappush(top, item)
+            elif item > top[0]:
+                heapq.heapreplace(top, item)
+        
+        top.sort(reverse=True)
+        return [(word, score) for score, _, word in top]
+
+    def _children_by_frequency(self, prefix: str) -> list[tuple[str, float]]:
+        """prefix의 자식 접두사들을 (자식 접두사, 그 아래 단어들의 최대 빈도)로 최대 빈도 내림차순 반환
+        
+        접두사 목록의 첫 항목이 그 접두사로 시작하는 단어들의 최대 빈도입니다.
+        FUZZY_CACHED_CHILD_DEPTH보다 짧은 접두사의 결과는 캐시합니다.
+        """
+        # 단어 추가로 캐시가 교체되어도 읽기 시작한 캐시에 저장 (교체된 캐시에 오래된 목록을 넣지 않음)
+        cache = self._children_cache
+        children = cache.get(prefix)
+        if children is not None:
+            return children
         
-        # 사용자 프로필이 없으면 기본 빈도 순으로 정렬
-        return candidates[:top_n]
+        children = self._collect_children(prefix)
+        if len(prefix) < FUZZY_CACHED_CHILD_DEPTH:
+            cache[prefix] = children
+        return children
+
+    def _collect_children(self, prefix: str) -> list[tuple[str, float]]:
+        """인덱스에서 prefix의 자식 접두사들과 최대 빈도를 모읍니다. (캐시하지 않음)"""
+        index = self.prefix_index
+        children = [(child, index[child][0][1]) for child in self._child_prefixes(prefix)]
+        children.sort(key=lambda child: child[1], reverse=True)
+        return children
+
+    def prepare_fuzzy(self) -> None:
+        """오타 허용 추천에 쓰는 정렬된 접두사 목록과 짧은 접두사들의 자식 목록을 미리 만듭니다.
+        
+        fork 전에 호출하면 워커들이 첫 요청에서 각자 만들지 않고 공유합니다.
+        """
+        pending = [""]
+        while pending:
+            prefix = pending.pop()
+            children = self._children_by_frequency(prefix)
+            if len(prefix) + 1 < FUZZY_CACHED_CHILD_DEPTH:
+                pending.extend(child for child, _ in children)
+
+    def recommend_fuzzy(
+        self,
+        prefix: str,
+        top_n: int = 10,
+        max_edits: int = 1,
+        min_frequency: float | None = None,
+        max_steps: int | None = FUZZY_MAX_STEPS,
+    ) -> list[tuple[str, float]]:
+        """오타를 허용하여 접두사와 편집 거리 max_edits 이내인 접두사를 가진 단어들을 추천
+        
+        단어의 편집 거리는 단어의 접두사들과 입력 접두사의 편집 거리(레벤슈타인) 중
+        가장 작은 값이며, 점수는 빈도 * FUZZY_EDIT_PENALTY ** 편집 거리입니다.
+        따라서 입력과 정확히 일치하는 접두사의 단어가 흔한 단어라면 먼저 나옵니다.
+        
+        인덱스의 접두사들을 트라이처럼 따라가며 접두사마다 편집 거리 표의 행을
+        계산하고(레벤슈타인 오토마톤), 행의 최솟값이 max_edits를 넘는 가지는 버립니다.
+        각 접두사 목록의 첫 항목이 그 아래 단어들의 최대 빈도이므로, 형제 접두사들을
+        최대 빈도 순으로 하나씩 열고 가지와 후보를 점수 상한 순으로 꺼내는 최선 우선
+        탐색으로 top_n개를 채우면, 상한이 낮은 나머지 가지는 열어 보지 않습니다.
+        
+        일치하는 단어들이 드물면 점수 하한이 낮아 많은 가지를 열게 되므로(특히 글자
+        종류가 많은 일본어), 탐색 단계가 max_steps에 닿으면 그때까지 찾은 단어만
+        반환합니다. 반환한 단어들은 항상 점수 상위 순서 그대로이며 개수만 적을 수 있습니다.
+        
+        Args:
+            prefix: 검색할 접두사 (오타 포함 가능)
+            top_n: 반환할 최대 단어 개수
+            max_edits: 허용할 최대 편집 거리 (0이면 recommend와 같음)
+            min_frequency: 최소 빈도 임계값 (None이면 제한 없음)
+            max_steps: 최대 탐색 단계 수 (None이면 제한 없음)
+        
+        Returns:
+            (단어, 점수) 튜플의 리스트, 점수 순으로 정렬됨
+        """
+        if max_edits <= 0:
+            return self.recommend(prefix, top_n, min_frequency)
+        query = prefix.lower()
+        if top_n <= 0 or not query:
+            return []
+        
+        floor = min_frequency if min_frequency is not None else 0.0
+        penalties = [FUZZY_EDIT_PENALTY ** distance for distance in range(max_edits + 1)]
+        query_length = len(query)
+        depth = self.max_prefix_depth
+        
+        # (-점수 상한, 순서, 종류, 목록 또는 단어, 위치, 상태) 최소 힙
+        #   _FUZZY_CHILD (자식 목록, 위치, (부모 행, 먼저 연 글자)): 최대 빈도 순 형제 중 다음 자식
+        #   _FUZZY_NODE  (접두사, None, 행): 행을 계산했지만 아직 열지 않은 가지
+        #   _FUZZY_MATCH (단어 목록, 위치, 거리): 입력과 거리 이내인 접두사 목록의 다음 단어
+        #   _FUZZY_SCAN  (단어 목록, 위치, 행): max_prefix_depth에서 끊긴 가지의 다음 단어
+        #   _FUZZY_WORD  (단어, None, None): 점수가 정해진 단어
+        heap: list[tuple] = []
+        order = count()
+        index = self.prefix_index
+
+        def push_entry(
+            kind: int, entries: Sequence[tuple[str, float]], position: int, state, distance: int
+        ) -> None:
+            """빈도 내림차순 목록의 position 항목을 (빈도 * 거리 배율) 상한으로 넣습니다."""
+            if position < len(entries):
+                frequency = entries[position][1]
+                if frequency >= floor:
+                    score = frequency * penalties[distance]
+                    heapq.heappush(heap, (-score, next(order), kind, entries, position, state))
+
+        def push_node(node: str, parent_row: list[int], frequency: float) -> None:
+            """자식 접두사의 행을 계산하여 정확한 상한으로 넣습니다."""
+            row = next_edit_row(parent_row, query, node[-1], len(node), max_edits)
+            distance = min(row)
+            if distance <= max_edits:
+                score = frequency * penalties[distance]
+                heapq.heappush(heap, (-score, next(order), _FUZZY_NODE, node, None, row))
+
+        def open_node(node: str, row: list[int]) -> None:
+            """접두사의 자식들을 넣습니다.
+            
+            자식의 행 최솟값이 부모와 같으려면 부모 행의 최솟값 칸 j에서 query[j]로
+            이어져야 하므로, 그런 글자의 자식만 바로 찾아 넣고 나머지 자식들은 거리가
+            1 늘어난 상한으로 최대 빈도 순으로 하나씩 엽니다.
+            """
+            distance = min(row)
+            continuing = {query[j] for j in range(query_length) if row[j] == distance}
+            for char in continuing:
+                postings = index.get(node + char)
+                if postings and postings[0][1] >= floor:
+                    push_node(node + char, row, postings[0][1])
+            if distance < max_edits:
+                children = self._children_by_frequency(node)
+                push_entry(_FUZZY_CHILD, children, 0, (row, continuing), distance + 1)
+        
+        open_node("", list(range(query_length + 1)))
+        
+        results: list[tuple[str, float]] = []
+        seen: set[str] = set()
+        steps = 0
+        while heap and len(results) < top_n:
+            if max_steps is not None and steps >= max_steps:
+                break
+            steps += 1
+            negative_score, _, kind, item, position, state = heapq.heappop(heap)
+            
+            if kind == _FUZZY_NODE:
+                row = state
+                distance = row[query_length]
+                postings = index[item]
+                if distance <= max_edits:
+                    push_entry(_FUZZY_MATCH, postings, 0, distance, distance)
+                if depth is None or len(item) < depth:
+                    open_node(item, row)
+                elif min(row) < distance:
+                    # 더 긴 접두사가 인덱스에 없으므로 단어마다 나머지 글자로 거리를 계산
+                    push_entry(_FUZZY_SCAN, postings, 0, row, min(row))
+                continue
+            
+            if kind == _FUZZY_WORD:
+                if item not in seen:
+                    seen.add(item)
+                    results.append((item, -negative_score))
+                continue
+            
+            name, frequency = item[position]
+            
+            if kind == _FUZZY_CHILD:
+                parent_row, continuing = state
+                push_entry(kind, item, position + 1, state, min(parent_row) + 1)
+                if name[-1] not in continuing:
+                    push_node(name, parent_row, frequency)
+            elif kind == _FUZZY_MATCH:
+                push_entry(kind, item, position + 1, state, state)
+                if name not in seen:
+                    seen.add(name)
+                    results.append((name, -negative_score))
+            else:
+                # _FUZZY_SCAN: 끊긴 접두사 뒤의 글자들로 행을 이어 가며 가장 작은 거리를 찾음
+                push_entry(kind, item, position + 1, state, min(state))
+                if name in seen:
+                    continue
+                row = state
+                best = row[query_length]
+                for length, char in enumerate(name.lower()[depth:], depth + 1):
+                    row = next_edit_row(row, query, char, length, max_edits)
+                    best = min(best, row[query_length])
+                    if min(row) > max_edits or best == 0:
+                        break
+                if best <= max_edits:
+                    score = frequency * penalties[best]
+                    heapq.heappush(heap, (-score, next(order), _FUZZY_WORD, name, None, None))
+        
+        return results
+
+    def add_words(self, words: Iterable[tuple[str, float]]) -> int:
+        """단어들을 인덱스에 추가하거나 빈도를 바꿉니다. (인덱스를 다시 구축하지 않음)
+        
+        단어의 접두사들(max_prefix_depth까지)의 목록만 새로 만들어 통째로 교체하므로
+        (copy-on-write), 락 없이 조회하는 다른 스레드는 교체 전이나 후의 온전한 빈도
+        내림차순 목록을 봅니다. 추가는 락으로 한 번에 하나씩 진행합니다.
+        소문자가 같은 단어가 이미 있으면 그 항목을 새 빈도로 옮깁니다. 공유 메모리
+        인덱스는 읽기 전용이므로 바뀐 접두사 목록만 이 프로세스에 덮어씁니다.
+        
+        Args:
+            words: (단어, 빈도) 튜플들
+        
+        Returns:
+            교체한 접두사 목록 수
+        
+        Raises:
+            ValueError: 빈 단어이거나 빈도가 0 이하인 경우 (이 경우 아무것도 바꾸지 않음)
+        """
+        updates = [(word, float(frequency)) for word, frequency in words]
+        for word, frequency in updates:
+            if not word or not frequency > 0:
+                raise ValueError(f"단어는 비어 있지 않고 빈도는 0보다 커야 합니다: {word!r}, {frequency}")
+        
+        depth = self.max_prefix_depth
+        with self._write_lock:
+            if not isinstance(self.prefix_index, dict):
+                self.prefix_index = PrefixIndexOverlay(self.prefix_index)
+            index = self.prefix_index
+            
+            replaced = 0
+            new_prefixes: list[str] = []
+            for word, frequency in updates:
+                word_lower = word.lower()
+                old_frequency = self._lookup_frequency(word_lower) or None
+                length = len(word_lower) if depth is None else min(len(word_lower), depth)
+                for i in range(1, length + 1):
+                    prefix = word_lower[:i]
+                    candidates = index.get(prefix)
+                    if candidates is None:
+                        candidates = ()
+                        new_prefixes.append(prefix)
+                    index[prefix] = replace_candidate(candidates, word, frequency, old_frequency)
+                    replaced += 1
+                self._added_frequencies[word_lower] = frequency
+            
+            self._refresh_fuzzy_caches(new_prefixes, [word.lower() for word, _ in updates])
+        return replaced
+
+    def _refresh_fuzzy_caches(self, new_prefixes: list[str], words_lower: list[str]) -> None:
+        """단어 추가 후 오타 허용 추천의 정렬된 접두사 목록과 자식 목록 캐시를 갱신합니다.
+        
+        조회 중인 스레드가 있으므로 둘 다 복사본을 고친 뒤 교체합니다. 정렬된 접두사
+        목록을 먼저 교체해야 새 캐시에서 다시 만드는 자식 목록에 새 접두사가 들어갑니다.
+        """
+        if new_prefixes and isinstance(self.prefix_index, PrefixIndexOverlay):
+            self.prefix_index.add_prefixes(new_prefixes)
+        if new_prefixes and self._sorted_keys is not None:
+            keys = list(self._sorted_keys)
+            for prefix in new_prefixes:
+                insort(keys, prefix)
+            self._sorted_keys = keys
+        
+        # 캐시된 짧은 접두사 중 추가한 단어의 조상은 자식 목록(최대 빈도 포함)이 바뀜
+        stale = {word[:i] for word in words_lower for i in range(FUZZY_CACHED_CHILD_DEPTH)}
+        cache = dict(self._children_cache)
+        for prefix in stale & cache.keys():
+            cache[prefix] = self._collect_children(prefix)
+        self._children_cache = cache
+
+    def _lookup_frequency(self, word_lower: str) -> float:
+        """인덱스에서 단어(소문자)의 빈도를 찾습니다. 없으면 0.0을 반환합니다.
+        
+        add_words로 추가하거나 바꾼 단어는 그 빈도를 바로 반환하고, 나머지는 단어의
+        접두사 목록(max_prefix_depth까지)을 앞에서부터 찾습니다. (목록을 복사하지 않음)
+        """
+        added = self._added_frequencies.get(word_lower)
+        if added is not None:
+            return added
+        
+        depth = self.max_prefix_depth
+        prefix = word_lower if depth is None else word_lower[:depth]
+        for word, frequency in self.prefix_index.get(prefix, ()):
+            if word.lower() == word_lower:
+                return frequency
+        return 0.0
 
     def get_word_frequency(self, word: str) -> float:
-        """특정 단어의 빈도 조회
+        """특정 단어의 빈도 조회 (add_words로 추가하거나 바꾼 단어는 그 빈도)
         
         Args:
             word: 조회할 단어
@@ -103,6 +815,9 @@ class WordRecommender:
         Returns:
             단어의 빈도 (0.0 ~ 1.0 사이의 값)
         """
+        added = self._added_frequencies.get(word.lower())
+        if added is not None:
+            return added
         return word_frequency(word, self.lang, self.wordlist)
 
 
@@ -112,15 +827,31 @@ class MultiLanguageRecommender:
     여러 언어를 동시에 지원하는 추천 시스템입니다.
     """
 
-    def __init__(self, languages: list[str] | None = None, wordlist: str = "best"):
+    def __init__(
+        self,
+        languages: list[str] | None = None,
+        wordlist: str = "best",
+        shared_memory: bool | None = None,
+        build_options: IndexBuildOptions | None = None,
+        unified_index: bool | None = None,
+    ):
         """MultiLanguageRecommender 초기화
         
         Args:
             languages: 지원할 언어 코드 리스트 (기본값: ['en', 'it', 'ja'])
             wordlist: wordfreq의 wordlist 옵션
+            shared_memory: 언어별 인덱스를 공유 메모리로 다른 프로세스와 공유할지 여부
+                (None이면 환경 변수 WORD_TRAIL_SHARED_INDEX가 "1"일 때 공유)
+            build_options: 모든 언어에 적용할 인덱스 구축 옵션 (None이면 가지치기 없음)
+            unified_index: lang="auto" 질의용 다국어 통합 인덱스를 구축할지 여부
+                (None이면 환경 변수 WORD_TRAIL_UNIFIED_INDEX가 "1"일 때 구축)
         """
         if languages is None:
             languages = ["en", "it", "ja"]
+        if shared_memory is None:
+            shared_memory = os.environ.get("WORD_TRAIL_SHARED_INDEX") == "1"
+        if unified_index is None:
+            unified_index = os.environ.get("WORD_TRAIL_UNIFIED_INDEX") == "1"
         
         self.languages: list[str] = languages
         self.wordlist: str = wordlist
@@ -129,7 +860,21 @@ class MultiLanguageRecommender:
         # 각 언어별로 Recommender 생성
         for lang in languages:
             print(f"\n언어 '{lang}' 초기화 중...")
-            self.recommenders[lang] = WordRecommender(lang, wordlist)
+            if shared_memory:
+                self.recommenders[lang] = WordRecommender.shared(lang, wordlist, build_options)
+            else:
+                self.recommenders[lang] = WordRecommender(lang, wordlist, build_options=build_options)
+        
+        # 통합 인덱스는 언어별 인덱스와 같은 구축 옵션으로 단어를 고름
+        self.unified_index: UnifiedPrefixIndex | None = None
+        if unified_index:
+            print("\n다국어 통합 인덱스 구축 중...")
+            options = build_options or IndexBuildOptions()
+            self.unified_index = UnifiedPrefixIndex.build(
+                {lang: options.select_words(get_frequency_dict(lang, wordlist)) for lang in languages},
+                options.max_prefix_depth,
+            )
+            print(f"통합 인덱스 구축 완료: {len(self.unified_index)}개 접두사")
 
     def recommend(
         self,
@@ -141,9 +886,11 @@ class MultiLanguageRecommender:
     ) -> list[tuple[str, float]]:
         """특정 언어에 대해 단어 추천
         
+        lang이 AUTO_LANGUAGE면 모든 언어에서 추천합니다. (recommend_auto 참고, 개인화하지 않음)
+        
         Args:
             prefix: 검색할 접두사
-            lang: 언어 코드
+            lang: 언어 코드 또는 AUTO_LANGUAGE
             top_n: 반환할 최대 단어 개수
             min_frequency: 최소 빈도 임계값
             user_profile: 사용자 프로필 (개인화 추천용, 선택사항)
@@ -151,14 +898,142 @@ class MultiLanguageRecommender:
         Returns:
             (단어, 점수) 튜플의 리스트
         """
+        if lang == AUTO_LANGUAGE:
+            return [
+                (word, score) for word, score, _ in self.recommend_auto(prefix, top_n, min_frequency)
+            ]
+        if lang not in self.recommenders:
+            raise ValueError(f"지원하지 않는 언어: {lang}. 지원 언어: {self.languages}")
+        
+        with stage("normalize"):
+            prefix = self.normalize_prefix(prefix, lang)
+        return self.recommenders[lang].recommend(prefix, top_n, min_frequency, user_profile)
+
+    def recommend_auto(
+        self,
+        prefix: str,
+        top_n: int = 10,
+        min_frequency: float | None = None,
+        languages: list[str] | None = None,
+    ) -> list[tuple[str, float, str]]:
+        """언어를 모르는 접두사에 대해 여러 언어의 추천을 합쳐 반환
+        
+        단어의 점수는 언어별 빈도 중 최댓값입니다. 통합 인덱스가 있으면 한 번의 조회로
+        답하고, 없으면 언어별 상위 top_n개를 모아 합칩니다. 접두사는 소문자로만 바꾸며
+        일본어 로마자 입력은 변환하지 않습니다.
+        
+        Args:
+            prefix: 검색할 접두사
+            top_n: 반환할 최대 단어 개수
+            min_frequency: 최소 빈도 임계값
+            languages: 대상 언어 코드 리스트 (None이면 모든 언어)
+        
+        Returns:
+            (단어, 점수, 언어) 튜플의 리스트, 점수 순으로 정렬됨
+        
+        Raises:
+            ValueError: 지원하지 않는 언어가 있는 경우
+        """
+        if languages is None:
+            languages = self.languages
+        for lang in languages:
+            if lang not in self.recommenders:
+                raise ValueError(f"지원하지 않는 언어: {lang}. 지원 언어: {self.languages}")
+        
+        with stage("normalize"):
+            prefix = prefix.lower()
+        if top_n <= 0:
+            return []
+        if self.unified_index is not None:
+            with stage("lookup"):
+                results = self.unified_index.recommend(prefix, top_n, languages)
+        else:
+            # 어떤 언어의 상위 top_n에도 없는 단어는 합친 상위 top_n에도 들 수 없음
+            merged: dict[str, tuple[float, str]] = {}
+            for lang in languages:
+                for word, frequency in self.recommenders[lang].recommend(prefix, top_n):
+                    if word not in merged or frequency > merged[word][0]:
+                        merged[word] = (frequency, lang)
+            ranked = sorted(merged.items(), key=lambda item: item[1][0], reverse=True)
+            results = [(word, frequency, lang) for word, (frequency, lang) in ranked[:top_n]]
+        
+        # 점수 내림차순이므로 임계값 미만이 나오면 이후도 모두 미만
+        if min_frequency is not None:
+            results = results[:frequency_cutoff(results, min_frequency)]
+        return results
+
+    def recommend_fuzzy(
+        self,
+        prefix: str,
+        lang: str,
+        top_n: int = 10,
+        max_edits: int = 1,
+        min_frequency: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """특정 언어에 대해 오타를 허용하여 단어 추천 (WordRecommender.recommend_fuzzy 참고)
+        
+        Args:
+            prefix: 검색할 접두사 (오타 포함 가능)
+            lang: 언어 코드
+            top_n: 반환할 최대 단어 개수
+            max_edits: 허용할 최대 편집 거리
+            min_frequency: 최소 빈도 임계값
+        
+        Returns:
+            (단어, 점수) 튜플의 리스트
+        """
+        if lang not in self.recommenders:
+            raise ValueError(f"지원하지 않는 언어: {lang}. 지원 언어: {self.languages}")
+        
+        with stage("normalize"):
+            prefix = self.normalize_prefix(prefix, lang)
+        with stage("fuzzy"):
+            return self.recommenders[lang].recommend_fuzzy(prefix, top_n, max_edits, min_frequency)
+
+    def prepare_fuzzy(self) -> None:
+        """모든 언어의 오타 허용 추천 자료를 미리 만듭니다."""
+        for recommender in self.recommenders.values():
+            recommender.prepare_fuzzy()
+
+    def add_words(self, lang: str, words: Iterable[tuple[str, float]]) -> int:
+        """특정 언어의 인덱스(통합 인덱스 포함)에 단어들을 추가하거나 빈도를 바꿉니다.
+        
+        WordRecommender.add_words 참고. 이 프로세스의 인덱스만 바뀌므로 미리 만든
+        응답(HotResponseCache)은 호출한 쪽에서 무효화해야 합니다.
+        
+        Args:
+            lang: 언어 코드
+            words: (단어, 빈도) 튜플들
+        
+        Returns:
+            교체한 접두사 목록 수
+        
+        Raises:
+            ValueError: 지원하지 않는 언어이거나 단어/빈도가 올바르지 않은 경우
+        """
         if lang not in self.recommenders:
             raise ValueError(f"지원하지 않는 언어: {lang}. 지원 언어: {self.languages}")
         
+        words = list(words)
+        replaced = self.recommenders[lang].add_words(words)
+        if self.unified_index is not None:
+            self.unified_index.add_words(lang, words)
+        return replaced
+
+    def normalize_prefix(self, prefix: str, lang: str) -> str:
+        """입력 접두사를 인덱스 조회에 사용하는 형태로 변환합니다.
+        
+        Args:
+            prefix: 입력 접두사
+            lang: 언어 코드
+        
+        Returns:
+            소문자로 바꾼 접두사 (일본어는 로마자 입력을 히라가나로 변환한 뒤)
+        """
         # 일본어인 경우 로마자 입력을 히라가나로 변환
         if lang == "ja":
             prefix = normalize_japanese_input(prefix)
-        
-        return self.recommenders[lang].recommend(prefix, top_n, min_frequency, user_profile)
+        return prefix.lower()
 
     def get_word_frequency(self, word: str, lang: str) -> float:
         """특정 언어에서 단어의 빈도 조회
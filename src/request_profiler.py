@@ -0,0 +1,128 @@
+"""실행 중인 서버의 요청을 필요할 때만 cProfile로 프로파일링하는 모듈
+
+관리자가 특정 경로의 다음 N개 요청을 프로파일링하도록 예약하거나, 요청 헤더로
+요청 하나를 프로파일링하게 할 수 있습니다. 결과는 pstats 바이너리(.prof)와
+누적 시간 순 요약(.txt)으로 저장합니다. 예약이 없을 때는 사전 조회 한 번 외에
+추가 비용이 없습니다.
+
+Python 3.12부터 cProfile은 프로세스 전체(모든 스레드)를 대상으로 하며 동시에
+하나만 켤 수 있으므로, 한 번에 한 요청만 프로파일링합니다. 그 사이 다른 스레드가
+처리한 요청의 호출도 결과에 함께 나타날 수 있습니다.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# 요약 파일에 기록할 함수 수
+DEFAULT_SUMMARY_LINES = 40
+
+
+class RequestProfiler:
+    """경로별 프로파일링 예약과 결과 저장을 관리합니다."""
+
+    def __init__(self, output_dir: str | Path, summary_lines: int = DEFAULT_SUMMARY_LINES):
+        """RequestProfiler 초기화
+        
+        Args:
+            output_dir: 프로파일 결과를 저장할 디렉토리
+            summary_lines: 요약 파일에 기록할 함수 수
+        """
+        self.output_dir: Path = Path(output_dir)
+        self.summary_lines: int = summary_lines
+        # 경로 -> 남은 프로파일링 요청 수
+        self.budgets: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # cProfile은 동시에 하나만 켤 수 있음
+        self._profile_lock = threading.Lock()
+        self._local = threading.local()
+
+    def arm(self, path: str, count: int) -> None:
+        """path로 들어오는 다음 count개 요청을 프로파일링하도록 예약합니다. (0이면 취소)"""
+        with self._lock:
+            if count > 0:
+                self.budgets[path] = count
+            else:
+                self.budgets.pop(path, None)
+
+    def _claim(self, path: str) -> bool:
+        """path에 남은 예약이 있으면 하나를 사용합니다."""
+        with self._lock:
+            remaining = self.budgets.get(path, 0)
+            if remaining <= 0:
+                return False
+            if remaining == 1:
+                del self.budgets[path]
+            else:
+                self.budgets[path] = remaining - 1
+            return True
+
+    def maybe_start(self, path: str, forced: bool = False) -> bool:
+        """path에 예약이 있거나 forced이면 현재 스레드의 요청 프로파일링을 시작합니다.
+        
+        다른 요청을 프로파일링 중이면 예약을 사용하지 않고 건너뜁니다.
+        
+        Args:
+            path: 요청 경로
+            forced: 예약과 관계없이 프로파일링할지 여부 (요청 헤더로 지정한 경우)
+        
+        Returns:
+            프로파일링을 시작했으면 True
+        """
+        if not forced and not self.budgets:
+            return False
+        if not self._profile_lock.acquire(blocking=False):
+            return False
+        if not forced and not self._claim(path):
+            self._profile_lock.release()
+            return False
+        
+        profile = cProfile.Profile()
+        self._local.profile = profile
+        profile.enable()
+        return True
+
+    def active(self) -> bool:
+        """현재 스레드의 요청을 프로파일링 중인지 여부"""
+        return getattr(self._local, "profile", None) is not None
+
+    def stop(self, label: str) -> Path | None:
+        """프로파일링을 끝내고 결과를 저장합니다.
+        
+        Args:
+            label: 파일 이름에 쓸 요청 이름 (예: 엔드포인트 이름)
+        
+        Returns:
+            저장한 .prof 파일 경로 (프로파일링 중이 아니었으면 None)
+        """
+        profile = getattr(self._local, "profile", None)
+        if profile is None:
+            return None
+        profile.disable()
+        self._local.profile = None
+        self._profile_lock.release()
+        
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{label}-{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns() % 1_000_000:06d}"
+        path = self.output_dir / f"{stem}.prof"
+        profile.dump_stats(path)
+        
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats("cumulative").print_stats(self.summary_lines)
+        path.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+        return path
+
+    def saved_profiles(self) -> list[dict[str, Any]]:
+        """저장된 프로파일 목록 (최신순)"""
+        if not self.output_dir.exists():
+            return []
+        paths = sorted(self.output_dir.glob("*.prof"), key=lambda p: p.stat().st_mtime, reverse=True)
+        return [
+            {"name": path.stem, "size": path.stat().st_size, "summary": path.with_suffix(".txt").name}
+            for path in paths
+        ]
@@ -0,0 +1,154 @@
+"""자주 요청되는 접두사의 추천 응답을 미리 인코딩해 두는 모듈
+
+개인화하지 않은 추천 결과는 인덱스가 바뀌지 않는 한 항상 같으므로,
+입력 빈도가 높은 짧은 접두사들의 응답 본문(JSON 바이트)을 미리 만들어 두고
+요청 시 인코딩 없이 그대로 돌려줍니다. 질의 로그에 자주 기록된 질의들도
+함께 미리 만들어 둘 수 있습니다.
+"""
+
+import heapq
+import threading
+from collections.abc import Callable, Iterable
+
+from src.recommender import MultiLanguageRecommender, WordRecommender
+
+# 미리 인코딩할 언어별 접두사 수, 최대 접두사 길이, top_n 값
+DEFAULT_HOT_PREFIXES = 2000
+DEFAULT_MAX_PREFIX_LENGTH = 3
+DEFAULT_TOP_NS = (5, 10)
+
+
+def hot_prefixes(
+    recommender: WordRecommender, count: int, max_length: int = DEFAULT_MAX_PREFIX_LENGTH
+) -> list[str]:
+    """입력될 가능성이 높은 짧은 접두사들을 고릅니다.
+    
+    접두사로 시작하는 단어들의 빈도 합(단어를 입력할 때 그 접두사를 거칠 확률)이
+    큰 순서로 고릅니다.
+    
+    Args:
+        recommender: 접두사 인덱스를 가진 단일 언어 추천기
+        count: 고를 접두사 수
+        max_length: 고려할 최대 접두사 길이
+    
+    Returns:
+        빈도 합 내림차순 접두사 리스트
+    """
+    masses = (
+        (sum(frequency for _, frequency in candidates), prefix)
+        for prefix, candidates in recommender.prefix_index.items()
+        if len(prefix) <= max_length
+    )
+    return [prefix for _, prefix in heapq.nlargest(count, masses)]
+
+
+class HotResponseCache:
+    """(언어, 정규화된 접두사, top_n)별로 미리 인코딩한 추천 응답 본문 캐시
+    
+    build() 이후에는 읽기만 하므로 여러 스레드에서 락 없이 조회할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        max_prefixes: int = DEFAULT_HOT_PREFIXES,
+        max_prefix_length: int = DEFAULT_MAX_PREFIX_LENGTH,
+        top_ns: Iterable[int] = DEFAULT_TOP_NS,
+    ):
+        """HotResponseCache 초기화
+        
+        Args:
+            max_prefixes: 언어별로 미리 인코딩할 접두사 수
+            max_prefix_length: 미리 인코딩할 최대 접두사 길이
+            top_ns: 미리 인코딩할 top_n 값들
+        """
+        self.max_prefixes: int = max_prefixes
+        self.max_prefix_length: int = max_prefix_length
+        self.top_ns: tuple[int, ...] = tuple(top_ns)
+        self.recommender: MultiLanguageRecommender | None = None
+        self.bodies: dict[tuple[str, str, int], bytes] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+    def build(
+        self,
+        recommender: MultiLanguageRecommender,
+        encode: Callable[[list[tuple[str, float]]], bytes],
+        extra_queries: Iterable[tuple[str, str, int]] = (),
+    ) -> None:
+        """언어별 인기 접두사의 응답 본문을 만듭니다.
+        
+        Args:
+            recommender: 다국어 추천 시스템
+            encode: 추천 결과를 응답 본문 바이트로 변환하는 함수
+            extra_queries: 함께 미리 만들 (언어, 정규화된 접두사, top_n) 질의들
+                (예: 질의 로그에 자주 기록된 질의, 길이와 top_n 제한 없음)
+        """
+        bodies = {}
+        for lang, word_recommender in recommender.recommenders.items():
+            for prefix in hot_prefixes(word_recommender, self.max_prefixes, self.max_prefix_length):
+                for top_n in self.top_ns:
+                    recommendations = word_recommender.recommend(prefix, top_n)
+                    bodies[(lang, prefix, top_n)] = encode(recommendations)
+        
+        for lang, prefix, top_n in extra_queries:
+            word_recommender = recommender.recommenders.get(lang)
+            if word_recommender is None or (lang, prefix, top_n) in bodies:
+                continue
+            bodies[(lang, prefix, top_n)] = encode(word_recommender.recommend(prefix, top_n))
+        
+        with self._lock:
+            self.recommender = recommender
+            self.bodies = bodies
+
+    def get(self, lang: str, prefix: str, top_n: int) -> bytes | None:
+        """미리 인코딩한 응답 본문을 찾습니다.
+        
+        Args:
+            lang: 언어 코드
+            prefix: 요청한 접두사 (정규화 전)
+            top_n: 요청한 결과 수
+        
+        Returns:
+            응답 본문 (캐시에 없으면 None)
+        """
+        body = None
+        if self.recommender is not None and lang in self.recommender.recommenders:
+            key = (lang, self.recommender.normalize_prefix(prefix, lang), top_n)
+            body = self.bodies.get(key)
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    def invalidate(self, lang: str, words: Iterable[str]) -> int:
+        """단어가 추가되거나 빈도가 바뀌어 결과가 달라질 수 있는 응답들을 지웁니다.
+        
+        조회 중인 스레드가 있으므로 남길 응답만으로 새 딕셔너리를 만들어 교체합니다.
+        
+        Args:
+            lang: 언어 코드
+            words: 추가하거나 빈도를 바꾼 단어들
+        
+        Returns:
+            지운 응답 수
+        """
+        prefixes = {
+            word_lower[:i]
+            for word_lower in (word.lower() for word in words)
+            for i in range(1, len(word_lower) + 1)
+        }
+        with self._lock:
+            bodies = {
+                key: body
+                for key, body in self.bodies.items()
+                if key[0] != lang or key[1] not in prefixes
+            }
+            removed = len(self.bodies) - len(bodies)
+            self.bodies = bodies
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """캐시 항목 수와 적중/미스 횟수"""
+        return {"entries": len(self.bodies), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,217 @@
+"""세그먼트로 나뉜 추가 전용 레코드 로그 모듈
+
+선택 이벤트 로그(selection_log)와 추천 질의 로그(query_log)가 함께 사용하는
+세그먼트 파일 이름 규칙, 레코드 읽기, 버퍼링된 쓰기를 제공합니다.
+
+세그먼트 파일은 "<접두사><6자리 번호>.log" 형식이며 번호 순으로 읽습니다.
+각 레코드는 4바이트 길이(리틀 엔디언) + msgpack 페이로드이고, 페이로드를
+레코드 값으로 바꾸는 방법(decode)은 각 로그 모듈이 정합니다.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import msgpack
+
+RECORD_HEADER = struct.Struct("<I")
+SEGMENT_SUFFIX = ".log"
+
+# 기본 쓰기 버퍼 크기 및 강제 flush 간격 (초)
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+def segment_path(directory: Path, prefix: str, seq: int) -> Path:
+    """세그먼트 번호에 해당하는 로그 파일 경로를 반환합니다."""
+    return directory / f"{prefix}{seq:06d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str | Path, prefix: str) -> list[tuple[int, Path]]:
+    """디렉토리의 로그 세그먼트를 번호 순으로 반환합니다.
+    
+    Args:
+        directory: 로그 디렉토리
+        prefix: 세그먼트 파일 이름 접두사 (예: "selections.")
+    
+    Returns:
+        (세그먼트 번호, 파일 경로) 튜플 리스트
+    """
+    segments = []
+    for path in Path(directory).glob(f"{prefix}*{SEGMENT_SUFFIX}"):
+        seq_text = path.name[len(prefix):-len(SEGMENT_SUFFIX)]
+        if seq_text.isdigit():
+            segments.append((int(seq_text), path))
+    segments.sort()
+    return segments
+
+
+def encode_record(fields: list[Any]) -> bytes:
+    """레코드 필드들을 길이 헤더가 붙은 msgpack 레코드 바이트로 만듭니다."""
+    payload = msgpack.packb(fields)
+    return RECORD_HEADER.pack(len(payload)) + payload
+
+
+def iter_segment_records[T](path: str | Path, decode: Callable[[list[Any]], T]) -> Iterator[T]:
+    """로그 세그먼트의 레코드들을 순서대로 읽습니다.
+    
+    비정상 종료로 마지막 레코드가 잘린 경우 그 레코드는 무시합니다.
+    
+    Args:
+        path: 로그 세그먼트 경로
+        decode: msgpack 페이로드(필드 리스트)를 레코드 값으로 바꾸는 함수
+    
+    Yields:
+        decode가 반환한 레코드 값
+    """
+    with open(path, "rb") as infile:
+        data = infile.read()
+    
+    view = memoryview(data)
+    header_size = RECORD_HEADER.size
+    offset = 0
+    end = len(data)
+    while offset + header_size <= end:
+        (length,) = RECORD_HEADER.unpack_from(view, offset)
+        start = offset + header_size
+        if start + length > end:
+            break  # 잘린 레코드
+        yield decode(msgpack.unpackb(view[start:start + length], raw=False))
+        offset = start + length
+
+
+class SegmentedLog:
+    """번호가 붙은 세그먼트 파일에 레코드를 추가하는 버퍼링된 로그
+    
+    쓰기는 버퍼링되며 데몬 스레드가 flush_interval마다(또는 버퍼가 찰 때) 디스크로
+    내보냅니다. 세그먼트 교체 시점과 오래된 세그먼트 정리는 하위 클래스가 정합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_prefix: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        min_seq: int = 0,
+    ):
+        """SegmentedLog 초기화
+        
+        기존 세그먼트에는 이어 쓰지 않고 항상 새 세그먼트를 엽니다. 이전 실행에서
+        아무것도 기록하지 않은 빈 세그먼트는 지우고 그 번호를 다시 사용합니다.
+        
+        Args:
+            directory: 로그 디렉토리
+            segment_prefix: 세그먼트 파일 이름 접두사
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            flush_interval: 버퍼를 flush하는 간격 (초, 0 이하이면 주기적으로 flush하지 않음)
+            min_seq: 이미 사용한 것으로 볼 마지막 세그먼트 번호 (새 세그먼트는 이보다 큼)
+        """
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_prefix: str = segment_prefix
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float = flush_interval
+        
+        self._lock = threading.Lock()
+        last_seq = min_seq
+        for seq, path in self.segments():
+            if path.stat().st_size == 0:
+                path.unlink(missing_ok=True)
+            else:
+                last_seq = max(last_seq, seq)
+        self._open_segment(last_seq + 1)
+        self.start_flusher()
+
+    def segments(self) -> list[tuple[int, Path]]:
+        """로그 디렉토리의 세그먼트들 (번호 순)"""
+        return list_segments(self.directory, self.segment_prefix)
+
+    def _open_segment(self, seq: int) -> None:
+        """새 활성 세그먼트를 엽니다. (락을 잡은 상태에서 호출)"""
+        self.seq: int = seq
+        # 파일은 세그먼트를 교체하거나 로그를 닫을 때까지 열어 둠 (_switch_segment, close)
+        self._file = open(  # noqa: SIM115
+            segment_path(self.directory, self.segment_prefix, seq), "ab", buffering=self.buffer_size
+        )
+        self._segment_bytes: int = 0
+
+    def start_flusher(self) -> None:
+        """flush_interval마다 버퍼를 내보내는 데몬 스레드를 시작합니다."""
+        self._closed = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if self.flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name=f"{self.segment_prefix}flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        """flush 스레드를 멈추고 끝날 때까지 기다린 뒤 버퍼를 내보냅니다.
+        
+        fork하기 전에 호출하여 자식이 flush 스레드가 잡고 있던 락을 물려받지 않게
+        합니다. 이후에는 start_flusher()(자식에서는 reopen())로 다시 시작합니다.
+        """
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _flush_periodically(self) -> None:
+        """로그가 닫힐 때까지 flush_interval마다 flush합니다. (flush 스레드 본문)"""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def _write(self, record: bytes) -> None:
+        """인코딩된 레코드를 활성 세그먼트에 씁니다. (락을 잡은 상태에서 호출)"""
+        self._file.write(record)
+        self._segment_bytes += len(record)
+
+    def _switch_segment(self, seq: int) -> None:
+        """활성 세그먼트를 닫고 seq 세그먼트를 엽니다. (락을 잡은 상태에서 호출)"""
+        self._file.close()
+        self._open_segment(seq)
+
+    def flush(self) -> None:
+        """버퍼에 남은 레코드를 디스크로 내보냅니다."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def rotate(self) -> int:
+        """활성 세그먼트를 닫고 새 세그먼트를 엽니다.
+        
+        Returns:
+            닫힌 세그먼트 번호
+        """
+        with self._lock:
+            closed_seq = self.seq
+            self._switch_segment(closed_seq + 1)
+        return closed_seq
+
+    def reopen(self, seq: int) -> None:
+        """fork된 자식 프로세스에서 다른 프로세스와 겹치지 않는 세그먼트로 전환합니다.
+        
+        부모는 fork하기 전에 stop_flusher()를 호출해야 하며, 자식의 flush 스레드는
+        여기서 새로 시작합니다.
+        
+        Args:
+            seq: 새로 열 세그먼트 번호 (부모와 다른 자식들이 쓰지 않는 번호)
+        """
+        # 부모의 락과 flush 스레드는 자식에서 의미가 없으므로 새로 만듦
+        self._lock = threading.Lock()
+        self._switch_segment(seq)
+        self.start_flusher()
+
+    def close(self) -> None:
+        """로그를 flush하고 닫습니다."""
+        self._closed.set()
+        with self._lock:
+            self._file.close()
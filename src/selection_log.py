@@ -0,0 +1,288 @@
+"""사용자 선택 이벤트 로그 모듈
+
+record_selection()으로 들어오는 단어 선택 이벤트를 추가 전용(append-only)
+바이너리 로그에 기록하고, 재시작 시 스냅샷과 로그 재생으로 프로필을 복원합니다.
+
+로그 디렉토리 구성:
+    snapshot.msgpack        압축(compaction)된 이벤트 프로필 스냅샷
+    selections.000001.log   로그 세그먼트 (번호 순으로 재생)
+
+각 레코드는 segment_log 형식(4바이트 길이 + msgpack 페이로드)의
+[user_id, word, prefix, count, timestamp]입니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from src.segment_log import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    SegmentedLog,
+    encode_record,
+    iter_segment_records,
+)
+from src.segment_log import list_segments as list_log_segments
+from src.user_profile import UserProfileManager, read_snapshot_metadata
+
+SNAPSHOT_NAME = "snapshot.msgpack"
+SEGMENT_PREFIX = "selections."
+
+
+def list_segments(directory: str | Path) -> list[tuple[int, Path]]:
+    """디렉토리의 선택 로그 세그먼트를 번호 순으로 반환합니다.
+    
+    Args:
+        directory: 로그 디렉토리
+    
+    Returns:
+        (세그먼트 번호, 파일 경로) 튜플 리스트
+    """
+    return list_log_segments(directory, SEGMENT_PREFIX)
+
+
+def iter_records(path: str | Path) -> Iterator[tuple[str, str, str, int, float]]:
+    """로그 세그먼트의 레코드들을 순서대로 읽습니다. (잘린 마지막 레코드는 무시)
+    
+    Args:
+        path: 로그 세그먼트 경로
+    
+    Yields:
+        (user_id, word, prefix, count, timestamp) 튜플
+    """
+    return iter_segment_records(path, tuple)
+
+
+def replay_segment(manager: UserProfileManager, path: str | Path) -> int:
+    """로그 세그먼트의 이벤트들을 프로필 매니저에 적용합니다.
+    
+    Args:
+        manager: 이벤트를 적용할 프로필 매니저
+        path: 로그 세그먼트 경로
+    
+    Returns:
+        적용한 이벤트 수
+    """
+    applied = 0
+    for user_id, word, prefix, count, timestamp in iter_records(path):
+        manager.get_profile(user_id).record_word_selection(
+            word, prefix, count, datetime.fromtimestamp(timestamp)
+        )
+        applied += 1
+    return applied
+
+
+def _snapshot_log_seq(snapshot: Path) -> int:
+    """스냅샷에 이미 반영된 마지막 세그먼트 번호 (스냅샷이 없으면 0)"""
+    if not snapshot.exists():
+        return 0
+    return read_snapshot_metadata(snapshot).get("log_seq", 0)
+
+
+def load_event_profiles(
+    directory: str | Path, upto_seq: int | None = None
+) -> tuple[UserProfileManager, int]:
+    """스냅샷과 그 이후 세그먼트들로부터 이벤트 프로필을 복원합니다.
+    
+    Args:
+        directory: 로그 디렉토리
+        upto_seq: 이 번호까지의 세그먼트만 재생 (None이면 전부)
+    
+    Returns:
+        (이벤트만으로 구성된 UserProfileManager, 마지막으로 반영된 세그먼트 번호)
+    """
+    directory = Path(directory)
+    snapshot = directory / SNAPSHOT_NAME
+    
+    log_seq = _snapshot_log_seq(snapshot)
+    if snapshot.exists():
+        manager = UserProfileManager.load_snapshot(snapshot)
+    else:
+        manager = UserProfileManager()
+    
+    for seq, path in list_segments(directory):
+        if seq <= log_seq:
+            continue  # 이미 스냅샷에 반영된 세그먼트 (압축 중 중단된 경우)
+        if upto_seq is not None and seq > upto_seq:
+            break
+        replay_segment(manager, path)
+        log_seq = seq
+    
+    return manager, log_seq
+
+
+def compact_segments(directory: str | Path, upto_seq: int) -> Path:
+    """닫힌 세그먼트들을 스냅샷에 합치고 삭제합니다.
+    
+    기존 스냅샷에 upto_seq 이하 세그먼트를 재생한 결과를 새 스냅샷으로
+    저장한 뒤 세그먼트를 지웁니다. 스냅샷 메타데이터에 반영된 세그먼트
+    번호를 기록하므로, 삭제 전에 중단되어도 이벤트가 중복 적용되지 않습니다.
+    
+    Args:
+        directory: 로그 디렉토리
+        upto_seq: 합칠 마지막 세그먼트 번호
+    
+    Returns:
+        새 스냅샷 경로
+    """
+    directory = Path(directory)
+    snapshot = directory / SNAPSHOT_NAME
+    
+    manager, log_seq = load_event_profiles(directory, upto_seq)
+    manager.save_snapshot(snapshot, {"log_seq": max(log_seq, upto_seq)})
+    
+    for seq, path in list_segments(directory):
+        if seq <= upto_seq:
+            path.unlink(missing_ok=True)
+    
+    return snapshot
+
+
+class SelectionLog(SegmentedLog):
+    """사용자 선택 이벤트를 기록하는 추가 전용 로그
+    
+    쓰기는 버퍼링되며 데몬 스레드가 flush_interval마다(또는 버퍼가 찰 때) 디스크로
+    내보냅니다. 활성 세그먼트가 compact_threshold 바이트를 넘으면 세그먼트를 교체하고
+    백그라운드 스레드에서 이전 세그먼트들을 스냅샷으로 압축합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_threshold: int | None = None,
+    ):
+        """SelectionLog 초기화
+        
+        기존 세그먼트에는 이어 쓰지 않고 항상 새 세그먼트를 엽니다. 이전 실행에서
+        아무것도 기록하지 않은 빈 세그먼트는 지우고 그 번호를 다시 사용합니다.
+        
+        Args:
+            directory: 로그 디렉토리
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            flush_interval: 버퍼를 강제로 flush하는 최대 간격 (초)
+            compact_threshold: 자동 압축을 시작할 활성 세그먼트 크기 (None이면 자동 압축 안 함)
+        """
+        self.compact_threshold: int | None = compact_threshold
+        self._compaction: threading.Thread | None = None
+        super().__init__(
+            directory,
+            SEGMENT_PREFIX,
+            buffer_size,
+            flush_interval,
+            min_seq=_snapshot_log_seq(Path(directory) / SNAPSHOT_NAME),
+        )
+
+    def append(
+        self,
+        user_id: str,
+        word: str,
+        prefix: str = "",
+        count: int = 1,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """선택 이벤트를 로그에 추가합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            word: 선택된 단어
+            prefix: 입력했던 접두사
+            count: 선택 횟수
+            timestamp: 선택 시각 (None이면 현재 시각)
+        """
+        stamp = (timestamp or datetime.now()).timestamp()
+        record = encode_record([user_id, word, prefix, count, stamp])
+        
+        with self._lock:
+            self._write(record)
+            should_compact = (
+                self.compact_threshold is not None
+                and self._segment_bytes >= self.compact_threshold
+                and not self.is_compacting()
+            )
+        
+        if should_compact:
+            self.compact()
+
+    def reopen(self, seq: int) -> None:
+        """fork된 자식 프로세스에서 다른 프로세스와 겹치지 않는 세그먼트로 전환합니다.
+        
+        여러 프로세스가 같은 디렉토리에 쓰는 동안에는 다른 프로세스의 활성
+        세그먼트를 지울 수 있으므로 자동 압축을 끕니다. 압축은 다음 시작 시
+        단일 프로세스에서 진행합니다.
+        
+        Args:
+            seq: 새로 열 세그먼트 번호 (부모와 다른 자식들이 쓰지 않는 번호)
+        """
+        # 부모의 압축 스레드는 자식에서 의미가 없음
+        self._compaction = None
+        self.compact_threshold = None
+        super().reopen(seq)
+
+    def is_compacting(self) -> bool:
+        """백그라운드 압축이 진행 중인지 여부"""
+        return self._compaction is not None and self._compaction.is_alive()
+
+    def compact(self, background: bool = True) -> threading.Thread | None:
+        """활성 세그먼트를 교체하고 닫힌 세그먼트들을 스냅샷으로 압축합니다.
+        
+        Args:
+            background: True면 데몬 스레드에서 압축하고 스레드를 반환
+        
+        Returns:
+            압축 스레드 (동기 실행이거나 이미 압축 중이면 None)
+        """
+        if self.is_compacting():
+            return None
+        
+        closed_seq = self.rotate()
+        if not background:
+            compact_segments(self.directory, closed_seq)
+            return None
+        
+        self._compaction = threading.Thread(
+            target=compact_segments,
+            args=(self.directory, closed_seq),
+            name="selection-log-compaction",
+            daemon=True,
+        )
+        self._compaction.start()
+        return self._compaction
+
+    def close(self) -> None:
+        """로그를 flush하고 닫습니다. 진행 중인 압축은 끝날 때까지 기다립니다."""
+        super().close()
+        if self._compaction is not None:
+            self._compaction.join()
+
+
+def open_selection_log(
+    manager: UserProfileManager,
+    directory: str | Path,
+    **log_options,
+) -> SelectionLog:
+    """저장된 선택 이벤트를 프로필 매니저에 복원하고 새 로그를 연결합니다.
+    
+    이벤트 스냅샷과 이후 세그먼트를 재생한 결과를 manager의 기존
+    프로필(예: 문장 파일로 구축한 프로필)에 합친 뒤, 이후의
+    record_selection() 호출이 새 로그 세그먼트에 기록되도록 설정합니다.
+    
+    Args:
+        manager: 이벤트를 복원하고 로그를 연결할 프로필 매니저
+        directory: 로그 디렉토리
+        **log_options: SelectionLog 생성 옵션
+    
+    Returns:
+        manager에 연결된 SelectionLog
+    """
+    events, _ = load_event_profiles(directory)
+    for profile in events.profiles.values():
+        manager.merge_profile(profile)
+    
+    log = SelectionLog(directory, **log_options)
+    manager.event_log = log
+    return log
@@ -0,0 +1,325 @@
+"""공유 메모리 접두사 인덱스 모듈
+
+WordRecommender의 접두사 인덱스를 평탄한 배열로 변환하여
+multiprocessing.shared_memory 세그먼트에 게시하고, 같은 호스트의 다른
+프로세스가 이름으로 읽기 전용 연결(attach)하여 인덱스를 복제하지 않고 사용합니다.
+
+세그먼트 구성 (각 구역은 8바이트 정렬):
+    헤더               매직, 형식 버전, 각 배열의 길이, 최대 접두사 길이
+    word_freqs         float64[단어 수]       단어별 빈도
+    word_offsets       uint32[단어 수 + 1]    word_blob에서 단어의 시작 위치
+    prefix_offsets     uint32[접두사 수 + 1]  prefix_blob에서 접두사의 시작 위치
+    posting_offsets    uint32[접두사 수 + 1]  postings에서 접두사 목록의 시작 위치
+    postings           uint32[게시 항목 수]   접두사별 단어 ID (빈도 내림차순)
+    word_blob          UTF-8 단어들
+    prefix_blob        UTF-8 접두사들 (정렬되어 있어 이진 탐색 가능)
+"""
+
+import atexit
+import struct
+import time
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from multiprocessing import shared_memory
+
+SEGMENT_MAGIC = b"WTPREFIX"
+SEGMENT_VERSION = 2
+# 매직, 버전, 단어 수, 접두사 수, 게시 항목 수, word_blob 크기, prefix_blob 크기,
+# 인덱싱한 최대 접두사 길이 (0이면 제한 없음)
+SEGMENT_HEADER = struct.Struct("<8sIIIIIII")
+HEADER_SIZE = 64
+
+# 다른 프로세스가 세그먼트를 채우는 중일 때 기다리는 최대 시간 (초)
+ATTACH_WAIT_SECONDS = 10.0
+
+
+def shared_index_name(lang: str, wordlist: str = "best") -> str:
+    """언어와 wordlist에 해당하는 공유 메모리 세그먼트 이름"""
+    return f"word_trail_{lang}_{wordlist}"
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _layout(
+    n_words: int, n_prefixes: int, n_postings: int, word_blob_size: int, prefix_blob_size: int
+) -> tuple[list[int], int]:
+    """각 구역의 시작 위치와 전체 크기를 계산합니다."""
+    sizes = [
+        8 * n_words,
+        4 * (n_words + 1),
+        4 * (n_prefixes + 1),
+        4 * (n_prefixes + 1),
+        4 * n_postings,
+        word_blob_size,
+        prefix_blob_size,
+    ]
+    offsets = []
+    offset = HEADER_SIZE
+    for size in sizes:
+        offsets.append(offset)
+        offset = _align(offset + size)
+    return offsets, offset
+
+
+def publish_prefix_index(
+    prefix_index: Mapping[str, Sequence[tuple[str, float]]],
+    name: str,
+    max_prefix_depth: int | None = None,
+) -> shared_memory.SharedMemory:
+    """접두사 인덱스를 공유 메모리 세그먼트에 게시합니다.
+    
+    세그먼트를 모두 채운 뒤 마지막에 헤더를 기록하므로, 연결하는 쪽은
+    헤더가 보이면 완성된 세그먼트로 간주할 수 있습니다.
+    게시한 프로세스가 종료 시 unlink()를 호출해야 합니다.
+    
+    Args:
+        prefix_index: 접두사 -> 빈도 내림차순 (단어, 빈도) 리스트
+        name: 세그먼트 이름
+        max_prefix_depth: 인덱스를 구축할 때 제한한 최대 접두사 길이 (None이면 제한 없음)
+    
+    Returns:
+        생성된 SharedMemory
+    
+    Raises:
+        FileExistsError: 같은 이름의 세그먼트가 이미 있는 경우
+    """
+    word_ids: dict[str, int] = {}
+    word_freqs = array("d")
+    word_offsets = array("I", [0])
+    word_blob = bytearray()
+    
+    prefixes = sorted(prefix_index)
+    prefix_offsets = array("I", [0])
+    prefix_blob = bytearray()
+    posting_offsets = array("I", [0])
+    postings = array("I")
+    
+    for prefix in prefixes:
+        for word, frequency in prefix_index[prefix]:
+            word_id = word_ids.get(word)
+            if word_id is None:
+                word_id = word_ids[word] = len(word_freqs)
+                word_freqs.append(frequency)
+                word_blob += word.encode("utf-8")
+                word_offsets.append(len(word_blob))
+            postings.append(word_id)
+        posting_offsets.append(len(postings))
+        prefix_blob += prefix.encode("utf-8")
+        prefix_offsets.append(len(prefix_blob))
+    
+    offsets, total_size = _layout(
+        len(word_freqs), len(prefixes), len(postings), len(word_blob), len(prefix_blob)
+    )
+    shm = shared_memory.SharedMemory(name=name, create=True, size=total_size)
+    buf = shm.buf
+    sections = [
+        word_freqs, word_offsets, prefix_offsets, posting_offsets, postings, word_blob, prefix_blob
+    ]
+    for offset, section in zip(offsets, sections, strict=True):
+        data = memoryview(section).cast("B")
+        buf[offset:offset + len(data)] = data
+    
+    SEGMENT_HEADER.pack_into(
+        buf,
+        0,
+        SEGMENT_MAGIC,
+        SEGMENT_VERSION,
+        len(word_freqs),
+        len(prefixes),
+        len(postings),
+        len(word_blob),
+        len(prefix_blob),
+        max_prefix_depth or 0,
+    )
+    return shm
+
+
+class PostingList(Sequence):
+    """공유 세그먼트의 접두사 하나에 대한 (단어, 빈도) 읽기 전용 목록
+    
+    리스트처럼 인덱싱, 슬라이싱, 순회할 수 있으며 항목은 접근할 때 복원합니다.
+    """
+    
+    __slots__ = ("_index", "_start", "_stop")
+
+    def __init__(self, index: "SharedPrefixIndex", start: int, stop: int):
+        self._index = index
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._index._entry(i) for i in range(self._start, self._stop)[item]]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("posting index out of range")
+        return self._index._entry(self._start + item)
+
+    def __iter__(self) -> Iterator[tuple[str, float]]:
+        entry = self._index._entry
+        for i in range(self._start, self._stop):
+            yield entry(i)
+
+    def __repr__(self) -> str:
+        return f"PostingList({len(self)} entries)"
+
+
+class SortedPrefixes(Sequence):
+    """공유 세그먼트의 접두사들에 대한 정렬된 읽기 전용 목록
+    
+    UTF-8 바이트 순서는 코드 포인트 순서와 같으므로 sorted(index)와 같은 순서이며,
+    bisect로 탐색할 수 있습니다. 항목은 접근할 때 복원합니다.
+    """
+    
+    __slots__ = ("_index",)
+
+    def __init__(self, index: "SharedPrefixIndex"):
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index._n_prefixes
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._index._prefix_at(i).decode("utf-8") for i in range(len(self))[item]]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("prefix index out of range")
+        return self._index._prefix_at(item).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"SortedPrefixes({len(self)} prefixes)"
+
+
+class SharedPrefixIndex(Mapping):
+    """공유 메모리 세그먼트 위의 읽기 전용 접두사 인덱스
+    
+    dict 기반 prefix_index와 같은 방식(get, in, 인덱싱)으로 사용할 수 있으며,
+    접두사는 정렬된 접두사 배열에서 이진 탐색으로 찾습니다.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        """SharedPrefixIndex 초기화
+        
+        Args:
+            shm: publish_prefix_index()로 채워진 세그먼트
+        
+        Raises:
+            ValueError: 세그먼트 형식이 맞지 않는 경우
+        """
+        (
+            magic, version, n_words, n_prefixes, n_postings, word_blob_size, prefix_blob_size, depth
+        ) = SEGMENT_HEADER.unpack_from(shm.buf, 0)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f"공유 인덱스 세그먼트 형식이 아닙니다: {shm.name}")
+        
+        self.shm = shm
+        self.name: str = shm.name
+        # 인덱싱한 최대 접두사 길이 (None이면 제한 없음)
+        self.max_prefix_depth: int | None = depth or None
+        offsets, _ = _layout(n_words, n_prefixes, n_postings, word_blob_size, prefix_blob_size)
+        buf = shm.buf
+        self._word_freqs = buf[offsets[0]:offsets[0] + 8 * n_words].cast("d")
+        self._word_offsets = buf[offsets[1]:offsets[1] + 4 * (n_words + 1)].cast("I")
+        self._prefix_offsets = buf[offsets[2]:offsets[2] + 4 * (n_prefixes + 1)].cast("I")
+        self._posting_offsets = buf[offsets[3]:offsets[3] + 4 * (n_prefixes + 1)].cast("I")
+        self._postings = buf[offsets[4]:offsets[4] + 4 * n_postings].cast("I")
+        self._word_blob = buf[offsets[5]:offsets[5] + word_blob_size]
+        self._prefix_blob = buf[offsets[6]:offsets[6] + prefix_blob_size]
+        self._n_prefixes: int = n_prefixes
+        # 종료 시 배열 뷰를 먼저 해제해야 세그먼트를 닫을 수 있음
+        atexit.register(self.close)
+
+    @classmethod
+    def attach(cls, name: str, wait: float = ATTACH_WAIT_SECONDS) -> "SharedPrefixIndex":
+        """이름으로 공유 세그먼트에 연결합니다.
+        
+        다른 프로세스가 아직 세그먼트를 채우는 중이면 최대 wait초 기다립니다.
+        연결한 프로세스가 종료되어도 세그먼트는 지워지지 않습니다.
+        
+        Args:
+            name: 세그먼트 이름
+            wait: 세그먼트가 완성될 때까지 기다리는 최대 시간 (초)
+        
+        Returns:
+            연결된 SharedPrefixIndex
+        
+        Raises:
+            FileNotFoundError: 세그먼트가 없는 경우
+            ValueError: 세그먼트가 완성되지 않았거나 형식이 맞지 않는 경우
+        """
+        shm = shared_memory.SharedMemory(name=name, track=False)
+        deadline = time.monotonic() + wait
+        while bytes(shm.buf[:len(SEGMENT_MAGIC)]) != SEGMENT_MAGIC:
+            if time.monotonic() >= deadline:
+                shm.close()
+                raise ValueError(f"공유 인덱스 세그먼트가 완성되지 않았습니다: {name}")
+            time.sleep(0.05)
+        return cls(shm)
+
+    def _entry(self, position: int) -> tuple[str, float]:
+        """postings의 position 위치 항목을 (단어, 빈도)로 복원합니다."""
+        word_id = self._postings[position]
+        start = self._word_offsets[word_id]
+        end = self._word_offsets[word_id + 1]
+        return str(self._word_blob[start:end], "utf-8"), self._word_freqs[word_id]
+
+    def _prefix_at(self, position: int) -> bytes:
+        return bytes(
+            self._prefix_blob[self._prefix_offsets[position]:self._prefix_offsets[position + 1]]
+        )
+
+    def _find(self, prefix: str) -> int:
+        """접두사의 위치를 이진 탐색으로 찾습니다. (없으면 -1)"""
+        key = prefix.encode("utf-8")
+        lo, hi = 0, self._n_prefixes
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._prefix_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n_prefixes and self._prefix_at(lo) == key:
+            return lo
+        return -1
+
+    def __getitem__(self, prefix: str) -> PostingList:
+        position = self._find(prefix) if isinstance(prefix, str) else -1
+        if position < 0:
+            raise KeyError(prefix)
+        return PostingList(
+            self, self._posting_offsets[position], self._posting_offsets[position + 1]
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._n_prefixes):
+            yield self._prefix_at(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._n_prefixes
+
+    def sorted_prefixes(self) -> SortedPrefixes:
+        """접두사들을 정렬된 순서로 복사 없이 보는 목록"""
+        return SortedPrefixes(self)
+
+    def close(self) -> None:
+        """세그먼트 연결을 닫습니다. (이후 인덱스를 사용할 수 없음)"""
+        for view in (
+            self._word_freqs,
+            self._word_offsets,
+            self._prefix_offsets,
+            self._posting_offsets,
+            self._postings,
+            self._word_blob,
+            self._prefix_blob,
+        ):
+            view.release()
+        self.shm.close()
+        atexit.unregister(self.close)
@@ -0,0 +1,134 @@
+"""무거운 작업을 별도 워커 풀에서 실행하는 모듈
+
+문장 자동완성 테스트처럼 오래 걸리는 작업을 요청 스레드 밖의 프로세스(또는 스레드)
+풀로 보내 가벼운 추천 요청의 지연 시간이 영향을 받지 않도록 합니다.
+동시에 실행 중이거나 대기 중인 작업 수를 제한하고(backpressure),
+요청별 제한 시간을 적용합니다.
+"""
+
+import multiprocessing
+import signal
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+
+def _reset_worker_signals() -> None:
+    """fork한 부모의 종료 신호 처리기를 물려받지 않도록 기본 동작으로 되돌립니다."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+class PoolBusyError(RuntimeError):
+    """대기 중인 작업이 한도에 도달하여 새 작업을 받을 수 없을 때 발생"""
+
+
+class TaskTimeoutError(TimeoutError):
+    """작업이 제한 시간 안에 끝나지 않았을 때 발생"""
+
+
+class BoundedTaskPool:
+    """동시 작업 수가 제한된 워커 풀
+    
+    kind가 "process"이면 fork로 워커 프로세스를 만들어, 풀을 만들기 전에
+    로드한 인덱스를 복사 없이 공유합니다. fork를 지원하지 않는 플랫폼에서는
+    스레드 풀을 사용합니다. 프로세스 풀은 다른 스레드들이 생기기 전에 start()로
+    워커를 미리 띄워야 합니다. (다른 스레드가 잡고 있던 락을 자식이 물려받지 않도록)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int | None = None,
+        kind: str = "thread",
+    ):
+        """BoundedTaskPool 초기화
+        
+        Args:
+            workers: 워커 수
+            max_pending: 실행 중 + 대기 중 작업의 최대 개수 (기본값: 워커 수의 2배)
+            kind: "process" 또는 "thread"
+        """
+        if workers <= 0:
+            raise ValueError("워커 수는 1 이상이어야 합니다")
+        if kind not in ("process", "thread"):
+            raise ValueError(f"지원하지 않는 풀 종류: {kind}")
+        
+        if kind == "process" and "fork" not in multiprocessing.get_all_start_methods():
+            kind = "thread"
+        
+        self.workers: int = workers
+        self.max_pending: int = max_pending if max_pending is not None else workers * 2
+        self.kind: str = kind
+        
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor: Executor
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_reset_worker_signals,
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="heavy")
+
+    def start(self) -> None:
+        """프로세스 풀의 워커 프로세스를 지금 모두 띄웁니다. (스레드 풀은 아무것도 하지 않음)"""
+        if self.kind == "process":
+            # fork 방식 풀은 첫 작업을 받을 때 워커를 한꺼번에 띄움
+            self._executor.submit(int).result()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """작업을 풀에 제출합니다.
+        
+        Args:
+            fn: 실행할 함수 (프로세스 풀이면 모듈 수준 함수여야 함)
+            *args: 함수 인자
+        
+        Returns:
+            작업의 Future
+        
+        Raises:
+            PoolBusyError: 대기 중인 작업이 한도에 도달한 경우
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PoolBusyError("작업 대기열이 가득 찼습니다")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # 작업이 실제로 끝나거나 취소되어야 자리를 반환 (제한 시간이 지난 뒤 계속 실행되는 작업 포함)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """작업을 풀에서 실행하고 결과를 기다립니다.
+        
+        제한 시간이 지나면 아직 시작하지 않은 작업만 취소됩니다. 이미 실행 중인
+        작업은 중단할 수 없으므로 끝까지 실행되며, 끝날 때까지 대기열 자리
+        (max_pending)를 계속 차지합니다.
+        
+        Args:
+            fn: 실행할 함수
+            *args: 함수 인자
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        
+        Returns:
+            함수의 반환값
+        
+        Raises:
+            PoolBusyError: 대기 중인 작업이 한도에 도달한 경우
+            TaskTimeoutError: 제한 시간 안에 끝나지 않은 경우
+        """
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()  # 아직 시작하지 않았으면 취소
+            raise TaskTimeoutError(f"작업이 {timeout}초 안에 끝나지 않았습니다") from None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀을 종료합니다."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
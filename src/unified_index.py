@@ -0,0 +1,267 @@
+"""다국어 통합 접두사 인덱스 모듈
+
+여러 언어의 단어를 하나의 접두사 인덱스에 모읍니다. en과 it처럼 같은 문자를 쓰는
+언어들의 공통 접두사는 키와 목록을 한 번만 저장하고, 여러 언어에 있는 단어도 항목
+하나로 저장합니다. 항목마다 언어별 빈도와 단어가 있는 언어의 비트 마스크를 두며,
+한 단어의 항목 객체를 그 단어의 모든 접두사 목록이 공유합니다.
+
+접두사 목록은 항목의 최대 빈도(언어별 빈도 중 최댓값) 내림차순이므로, 모든 언어를
+대상으로 하는 질의(lang="auto")는 목록 앞에서 top_n개를 읽기만 하면 됩니다. 일부
+언어만 대상으로 하는 질의는 목록을 앞에서부터 훑다가, 다음 항목의 최대 빈도가 지금까지
+고른 top_n번째 점수 이하가 되면 멈춥니다. (언어별 빈도는 최대 빈도를 넘지 않으므로)
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import islice
+from typing import NamedTuple
+
+
+class UnifiedEntry(NamedTuple):
+    """통합 인덱스의 단어 항목
+    
+    Attributes:
+        word: 단어 (원래 표기)
+        frequency: 언어별 빈도 중 최댓값 (접두사 목록의 정렬 기준)
+        mask: 단어가 있는 언어들의 비트 마스크 (언어 순서대로 1 << 위치)
+        frequencies: 언어 순서대로의 빈도 (없는 언어는 0.0)
+    """
+
+    word: str
+    frequency: float
+    mask: int
+    frequencies: tuple[float, ...]
+
+
+class UnifiedPrefixIndex:
+    """여러 언어가 접두사와 단어 항목을 공유하는 접두사 인덱스
+    
+    build()로 언어별 (단어, 빈도)에서 구축합니다. 조회는 접두사를 소문자로만 바꾸며
+    일본어 로마자 입력 변환은 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        languages: Sequence[str],
+        prefix_index: Mapping[str, Sequence[UnifiedEntry]],
+        max_prefix_depth: int | None = None,
+    ):
+        """UnifiedPrefixIndex 초기화 (build() 사용 권장)
+        
+        Args:
+            languages: 언어 코드 목록 (순서가 마스크 비트 위치)
+            prefix_index: 접두사 -> 최대 빈도 내림차순 항목 목록
+            max_prefix_depth: 인덱싱한 최대 접두사 길이 (None이면 제한 없음)
+        """
+        self.languages: list[str] = list(languages)
+        self.prefix_index: Mapping[str, Sequence[UnifiedEntry]] = prefix_index
+        self.max_prefix_depth: int | None = max_prefix_depth
+        self.all_languages_mask: int = (1 << len(self.languages)) - 1
+        self._write_lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        words_by_language: Mapping[str, Iterable[tuple[str, float]]],
+        max_prefix_depth: int | None = None,
+    ) -> "UnifiedPrefixIndex":
+        """언어별 (단어, 빈도)에서 통합 인덱스를 구축합니다.
+        
+        Args:
+            words_by_language: 언어 코드 -> 인덱싱할 (단어, 빈도)
+            max_prefix_depth: 이 길이까지의 접두사만 인덱싱 (None이면 모든 접두사)
+        
+        Returns:
+            구축된 UnifiedPrefixIndex
+        """
+        languages = list(words_by_language)
+        
+        # 단어 -> [마스크, 언어별 빈도]
+        found: dict[str, list] = {}
+        for position, lang in enumerate(languages):
+            for word, frequency in words_by_language[lang]:
+                values = found.get(word)
+                if values is None:
+                    values = found[word] = [0, [0.0] * len(languages)]
+                values[0] |= 1 << position
+                values[1][position] = frequency
+        
+        entries = [
+            UnifiedEntry(word, max(frequencies), mask, tuple(frequencies))
+            for word, (mask, frequencies) in found.items()
+        ]
+        del found
+        entries.sort(key=lambda entry: entry.frequency, reverse=True)
+        
+        # 빈도 내림차순으로 추가하므로 접두사 목록은 따로 정렬하지 않아도 됨
+        prefix_index: defaultdict[str, list[UnifiedEntry]] = defaultdict(list)
+        for entry in entries:
+            word_lower = entry.word.lower()
+            length = len(word_lower) if max_prefix_depth is None else min(len(word_lower), max_prefix_depth)
+            for i in range(1, length + 1):
+                prefix_index[word_lower[:i]].append(entry)
+        
+        return cls(languages, dict(prefix_index), max_prefix_depth)
+
+    def __len__(self) -> int:
+        return len(self.prefix_index)
+
+    def language_mask(self, languages: Iterable[str] | None = None) -> int:
+        """언어 코드들의 비트 마스크 (None이면 모든 언어)
+        
+        Raises:
+            ValueError: 인덱스에 없는 언어가 있는 경우
+        """
+        if languages is None:
+            return self.all_languages_mask
+        mask = 0
+        for lang in languages:
+            if lang not in self.languages:
+                raise ValueError(f"지원하지 않는 언어: {lang}. 지원 언어: {self.languages}")
+            mask |= 1 << self.languages.index(lang)
+        return mask
+
+    def _candidates(self, prefix_lower: str) -> Iterable[UnifiedEntry]:
+        """접두사로 시작하는 항목들 (최대 빈도 내림차순)
+        
+        max_prefix_depth보다 긴 접두사는 그 길이 접두사의 목록을 걸러서 차례로 반환합니다.
+        """
+        depth = self.max_prefix_depth
+        if depth is None or len(prefix_lower) <= depth:
+            return self.prefix_index.get(prefix_lower, ())
+        return (
+            entry
+            for entry in self.prefix_index.get(prefix_lower[:depth], ())
+            if entry.word.lower().startswith(prefix_lower)
+        )
+
+    def recommend(
+        self, prefix: str, top_n: int = 10, languages: Iterable[str] | None = None
+    ) -> list[tuple[str, float, str]]:
+        """접두사로 시작하는 단어들을 대상 언어들에서의 빈도 순으로 추천
+        
+        단어의 점수는 대상 언어별 빈도 중 최댓값이며, 그 빈도의 언어를 함께 반환합니다.
+        
+        Args:
+            prefix: 검색할 접두사
+            top_n: 반환할 최대 단어 개수
+            languages: 대상 언어 코드들 (None이면 모든 언어)
+        
+        Returns:
+            (단어, 점수, 언어) 튜플의 리스트, 점수 순으로 정렬됨
+        
+        Raises:
+            ValueError: 인덱스에 없는 언어가 있는 경우
+        """
+        mask = self.language_mask(languages)
+        if top_n <= 0:
+            return []
+        candidates = self._candidates(prefix.lower())
+        
+        # 모든 언어가 대상이면 점수가 곧 정렬 기준이므로 앞에서 top_n개
+        if mask == self.all_languages_mask:
+            return [
+                (entry.word, entry.frequency, self.languages[entry.frequencies.index(entry.frequency)])
+                for entry in islice(candidates, top_n)
+            ]
+        
+        positions = [position for position in range(len(self.languages)) if mask >> position & 1]
+        # (점수, -순서, 단어, 언어) 최소 힙: 점수가 같으면 목록에서 앞선 단어 우선
+        heap: list[tuple[float, int, str, str]] = []
+        for order, entry in enumerate(candidates):
+            if len(heap) >= top_n and entry.frequency <= heap[0][0]:
+                break
+            if not entry.mask & mask:
+                continue
+            # 빈도가 같으면 앞 순서 언어
+            score, language = max((entry.frequencies[position], -position) for position in positions)
+            item = (score, -order, entry.word, self.languages[-language])
+            if len(heap) < top_n:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        
+        heap.sort(reverse=True)
+        return [(word, score, lang) for score, _, word, lang in heap]
+
+    def add_words(self, lang: str, words: Iterable[tuple[str, float]]) -> None:
+        """한 언어의 단어들을 추가하거나 그 언어의 빈도를 바꿉니다.
+        
+        WordRecommender.add_words와 같이 단어의 접두사 목록만 새로 만들어 교체하므로
+        락 없이 조회하는 스레드는 교체 전이나 후의 온전한 목록을 봅니다.
+        
+        Args:
+            lang: 언어 코드
+            words: (단어, 빈도) 튜플들 (빈도는 0보다 커야 함)
+        
+        Raises:
+            ValueError: 인덱스에 없는 언어인 경우
+        """
+        bit = self.language_mask([lang])
+        position = self.languages.index(lang)
+        depth = self.max_prefix_depth
+        with self._write_lock:
+            for word, frequency in words:
+                word_lower = word.lower()
+                old = self._find_entry(word_lower)
+                if old is None:
+                    frequencies = [0.0] * len(self.languages)
+                    frequencies[position] = frequency
+                    entry = UnifiedEntry(word, frequency, bit, tuple(frequencies))
+                else:
+                    frequencies = list(old.frequencies)
+                    frequencies[position] = frequency
+                    entry = UnifiedEntry(old.word, max(frequencies), old.mask | bit, tuple(frequencies))
+                
+                length = len(word_lower) if depth is None else min(len(word_lower), depth)
+                for i in range(1, length + 1):
+                    prefix = word_lower[:i]
+                    self.prefix_index[prefix] = _replace_entry(self.prefix_index.get(prefix, ()), entry, old)
+
+    def _find_entry(self, word_lower: str) -> UnifiedEntry | None:
+        """소문자가 word_lower인 단어의 항목 (없으면 None)"""
+        for entry in self._candidates(word_lower):
+            if entry.word.lower() == word_lower:
+                return entry
+        return None
+
+    def stats(self) -> dict[str, int]:
+        """접두사 수, 단어 항목 수, 게시 항목 수와 여러 언어에 걸친 접두사/단어 수"""
+        words: set[int] = set()
+        shared_words = postings = shared_prefixes = 0
+        for entries in self.prefix_index.values():
+            postings += len(entries)
+            prefix_mask = 0
+            for entry in entries:
+                prefix_mask |= entry.mask
+                if id(entry) not in words:
+                    words.add(id(entry))
+                    shared_words += entry.mask & (entry.mask - 1) != 0
+            shared_prefixes += prefix_mask & (prefix_mask - 1) != 0
+        return {
+            "prefixes": len(self.prefix_index),
+            "words": len(words),
+            "postings": postings,
+            "shared_prefixes": shared_prefixes,
+            "shared_words": shared_words,
+        }
+
+
+def _replace_entry(
+    entries: Iterable[UnifiedEntry], entry: UnifiedEntry, old: UnifiedEntry | None
+) -> list[UnifiedEntry]:
+    """최대 빈도 내림차순 목록에서 old를 빼고 entry를 넣은 새 목록 (원래 목록은 그대로)"""
+    updated = list(entries)
+    if old is not None:
+        start = bisect_left(updated, -old.frequency, key=lambda item: -item.frequency)
+        for i in range(start, len(updated)):
+            if updated[i] is old:
+                del updated[i]
+                break
+            if updated[i].frequency != old.frequency:
+                break
+    updated.insert(bisect_right(updated, -entry.frequency, key=lambda item: -item.frequency), entry)
+    return updated
@@ -1,42 +1,202 @@
 """사용자 프로필 및 피드백 관리 모듈"""
 
-from collections import defaultdict
-from datetime import datetime
+import heapq
+import sys
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import msgpack
+
+if TYPE_CHECKING:
+    from src.profile_store import SQLiteProfileStore
+    from src.selection_log import SelectionLog
+
+# 프로필 스냅샷 파일 형식 (헤더의 format/version으로 검증)
+SNAPSHOT_FORMAT = "word-trail-profiles"
+SNAPSHOT_VERSION = 2
+# 읽을 수 있는 이전 스냅샷 버전 (1: 타임스탬프 원본 저장)
+SUPPORTED_SNAPSHOT_VERSIONS = (1, 2)
+
+# 단어별 사용 히스토리를 보관하는 기본 기간 (일)
+# 기본 감쇠 계수 0.95에서 365일 전 사용의 가중치는 1e-8 수준이므로 점수에 영향이 없습니다.
+DEFAULT_MAX_HISTORY_DAYS = 365
+
+# 접두사별로 미리 정렬해 두는 최다 선택 단어 수
+PREFIX_TOP_K = 10
 
 
 class UserProfile:
     """사용자별 단어 사용 히스토리를 관리하는 클래스
     
     사용자가 선택한 단어들을 기록하고, 이를 바탕으로 개인화된 추천을 제공합니다.
+    
+    많은 사용자를 메모리에 유지할 수 있도록 __slots__를 사용하고,
+    단어와 접두사 문자열은 intern하여 프로필 간에 공유합니다.
+    사용 시각은 개별 datetime 대신 날짜별 사용 횟수 히스토그램으로 저장합니다.
     """
+    
+    __slots__ = (
+        "max_history_days",
+        "prefix_selections",
+        "prefix_top",
+        "used_words",
+        "user_id",
+        "word_counts",
+        "word_days",
+    )
 
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, max_history_days: int | None = DEFAULT_MAX_HISTORY_DAYS):
         """UserProfile 초기화
         
         Args:
             user_id: 사용자 고유 ID
+            max_history_days: 단어별 사용 히스토리 보관 기간 (일, None이면 무제한)
         """
         self.user_id: str = user_id
+        self.max_history_days: int | None = max_history_days
         # 단어별 사용 횟수 (전체 기간)
-        self.word_counts: dict[str, int] = defaultdict(int)
-        # 단어별 최근 사용 시간 (시간 기반 가중치 계산용)
-        self.word_timestamps: dict[str, list[datetime]] = defaultdict(list)
-        # 접두사별 선택된 단어 기록
-        self.prefix_selections: dict[str, list[str]] = defaultdict(list)
+        self.word_counts: dict[str, int] = {}
+        # 사용한 단어들 (정렬됨, 접두사로 시작하는 사용 단어를 이진 탐색으로 찾는 용도)
+        self.used_words: list[str] = []
+        # 단어별 날짜(ordinal)별 사용 횟수 (시간 기반 가중치 계산용)
+        self.word_days: dict[str, dict[int, int]] = {}
+        # 접두사별로 선택된 단어와 선택 횟수
+        self.prefix_selections: dict[str, dict[str, int]] = {}
+        # 접두사별 선택 횟수 상위 PREFIX_TOP_K개 단어 (횟수 내림차순, 같으면 단어순)
+        self.prefix_top: dict[str, list[str]] = {}
 
-    def record_word_selection(self, word: str, prefix: str = "") -> None:
+    def record_word_selection(
+        self,
+        word: str,
+        prefix: str = "",
+        count: int = 1,
+        timestamp: datetime | None = None,
+    ) -> int:
         """사용자가 단어를 선택했을 때 기록합니다.
         
         Args:
             word: 선택된 단어
             prefix: 입력했던 접두사 (선택사항)
+            count: 선택 횟수 (같은 선택을 여러 번 기록할 때 사용, 기본값 1)
+            timestamp: 선택 시각 (None이면 현재 시각, 로그 재생 시 원래 시각 사용)
+        
+        Returns:
+            memory_usage() 추정 크기의 증가분 (바이트)
         """
-        word_lower = word.lower()
-        self.word_counts[word_lower] += 1
-        self.word_timestamps[word_lower].append(datetime.now())
+        day = (timestamp or datetime.now()).toordinal()
+        return self._record(word, prefix, count, day)
+
+    def record_word_selections(self, selections: Iterable[tuple[str, str, int]]) -> None:
+        """여러 선택을 (단어, 접두사, 횟수) 단위로 한 번에 기록합니다.
         
+        같은 선택이 반복되는 대량 데이터를 기록할 때 호출 횟수를
+        고유한 (단어, 접두사) 쌍의 수로 줄이기 위해 사용합니다.
+        
+        Args:
+            selections: (선택된_단어, 접두사, 횟수) 튜플들
+        """
+        today = date.today().toordinal()
+        for word, prefix, count in selections:
+            self._record(word, prefix, count, today)
+
+    def _record(self, word: str, prefix: str, count: int, day: int) -> int:
+        """선택 기록의 공통 처리 (횟수만큼 가중치 적용)
+        
+        Returns:
+            memory_usage() 추정 크기의 증가분 (바이트)
+        """
+        if count <= 0:
+            return 0
+        
+        word_lower = sys.intern(word.lower())
+        prefix_lower = sys.intern(prefix.lower()) if prefix else ""
+        size_before = self._entry_size(word_lower, prefix_lower)
+        
+        self._add_word_count(word_lower, count)
+        self._add_day_count(word_lower, day, count)
+        if prefix_lower:
+            self._add_prefix_count(prefix_lower, word_lower, count)
+        
+        return self._entry_size(word_lower, prefix_lower) - size_before
+
+    def _entry_size(self, word: str, prefix: str) -> int:
+        """선택 하나가 바꿀 수 있는 컨테이너들의 크기 합 (memory_usage()와 같은 기준, O(1))"""
+        size = (
+            sys.getsizeof(self.word_counts)
+            + sys.getsizeof(self.used_words)
+            + sys.getsizeof(self.word_days)
+            + sys.getsizeof(self.prefix_selections)
+            + sys.getsizeof(self.prefix_top)
+        )
+        days = self.word_days.get(word)
+        if days is not None:
+            size += sys.getsizeof(days)
         if prefix:
-            self.prefix_selections[prefix.lower()].append(word_lower)
+            selections = self.prefix_selections.get(prefix)
+            if selections is not None:
+                size += sys.getsizeof(selections)
+            top = self.prefix_top.get(prefix)
+            if top is not None:
+                size += sys.getsizeof(top)
+        return size
+
+    def _add_word_count(self, word: str, count: int) -> None:
+        """단어의 전체 사용 횟수를 더합니다. (처음 사용한 단어는 정렬된 목록에 추가)"""
+        previous = self.word_counts.get(word)
+        if previous is None:
+            insort(self.used_words, word)
+            previous = 0
+        self.word_counts[word] = previous + count
+
+    def _add_prefix_count(self, prefix: str, word: str, count: int) -> None:
+        """접두사별 선택 횟수를 더하고 상위 단어 목록을 갱신합니다.
+        
+        선택 횟수는 증가만 하므로, 횟수가 늘어난 단어만 상위 목록의
+        마지막 단어와 비교하면 상위 목록을 정확하게 유지할 수 있습니다.
+        """
+        selections = self.prefix_selections.setdefault(prefix, {})
+        selections[word] = selections.get(word, 0) + count
+        
+        top = self.prefix_top.get(prefix)
+        if top is None:
+            self.prefix_top[prefix] = [word]
+            return
+
+        def rank(w: str) -> tuple[int, str]:
+            return (-selections[w], w)
+        
+        if word not in top:
+            if len(top) >= PREFIX_TOP_K:
+                if rank(word) >= rank(top[-1]):
+                    return
+                top.pop()
+            top.append(word)
+        top.sort(key=rank)
+
+    def _add_day_count(self, word: str, day: int, count: int) -> None:
+        """날짜별 히스토그램에 사용 횟수를 더하고 보관 기간이 지난 날짜를 제거합니다."""
+        days = self.word_days.get(word)
+        if days is None:
+            self.word_days[word] = {day: count}
+            return
+        
+        if day in days:
+            days[day] += count
+            return
+        
+        if self.max_history_days is not None:
+            cutoff = max(day, max(days)) - self.max_history_days
+            if day < cutoff:
+                return  # 보관 기간보다 오래된 기록
+            for old_day in [d for d in days if d < cutoff]:
+                del days[old_day]
+        
+        days[day] = count
 
     def get_word_score(
         self, word: str, base_frequency: float, time_decay_factor: float = 0.95
@@ -62,53 +222,327 @@ class UserProfile:
         if usage_count == 0:
             return base_score
         
+        # 개인화 점수 = 기본 빈도 * (1 + 사용자 가중치)
+        # 사용자 가중치는 기본 빈도에 비례하여 적용
+        today = date.today().toordinal()
+        boost = self._word_boost(word_lower, usage_count, time_decay_factor, today)
+        personalized_score = base_score * boost
+        
+        return personalized_score
+
+    def get_word_boosts(self, prefix: str = "", time_decay_factor: float = 0.95) -> dict[str, float]:
+        """접두사로 시작하는 사용 단어들의 점수 배율을 반환합니다.
+        
+        get_word_score(word, f)는 사용한 단어에 대해 f * 배율과 같고,
+        사용하지 않은 단어는 f를 그대로 반환하므로 배율은 1입니다.
+        추천 시 점수 상한을 계산하는 데 사용합니다.
+        
+        어떤 접두사로 선택했는지와 관계없이 접두사로 시작하는 사용 단어를 모두 고르며,
+        정렬된 사용 단어 목록을 이진 탐색하므로 고른 단어 수에 비례하는 시간이 걸립니다.
+        
+        Args:
+            prefix: 접두사
+            time_decay_factor: 시간 감쇠 계수 (get_word_score와 같은 값 사용)
+        
+        Returns:
+            단어를 키로 하고 점수 배율을 값으로 하는 딕셔너리
+        """
+        prefix_lower = prefix.lower()
+        words = self.used_words
+        today = date.today().toordinal()
+        boosts: dict[str, float] = {}
+        for position in range(bisect_left(words, prefix_lower), len(words)):
+            word = words[position]
+            if not word.startswith(prefix_lower):
+                break
+            boosts[word] = self._word_boost(word, self.word_counts[word], time_decay_factor, today)
+        return boosts
+
+    def _word_boost(
+        self, word_lower: str, usage_count: int, time_decay_factor: float, today: int
+    ) -> float:
+        """사용 횟수와 최근 사용 시점으로 단어의 점수 배율을 계산합니다."""
         # 시간 기반 가중치 계산 (최근 사용일수록 높은 가중치)
         time_weight = 0.0
-        now = datetime.now()
         
-        for timestamp in self.word_timestamps.get(word_lower, []):
+        for day, count in self.word_days.get(word_lower, {}).items():
             # 시간 차이 (일 단위)
-            days_ago = (now - timestamp).days
+            days_ago = max(today - day, 0)
             
-            # 지수 감쇠: 최근 사용일수록 높은 가중치
+            # 지수 감쇠: 최근 사용일수록 높은 가중치 (같은 날 사용 횟수만큼 누적)
             decay = time_decay_factor ** days_ago
-            time_weight += decay
+            time_weight += decay * count
         
         # 사용 횟수와 시간 가중치를 결합
         # 사용 횟수가 많을수록, 최근 사용일수록 높은 점수
         user_weight = usage_count * (1 + time_weight * 0.1)
         
-        # 개인화 점수 = 기본 빈도 * (1 + 사용자 가중치)
-        # 사용자 가중치는 기본 빈도에 비례하여 적용
-        personalized_score = base_score * (1 + user_weight * 10)
-        
-        return personalized_score
+        return 1 + user_weight * 10
 
-    def get_prefix_history(self, prefix: str) -> dict[str, int]:
+    def get_prefix_history(self, prefix: str, top_n: int | None = None) -> dict[str, int]:
         """특정 접두사에 대해 사용자가 선택한 단어들의 히스토리를 반환합니다.
         
         Args:
             prefix: 접두사
+            top_n: 지정하면 선택 횟수 상위 top_n개 단어만 반환
+                (PREFIX_TOP_K 이하이면 미리 정렬된 목록을 사용)
         
         Returns:
-            단어별 선택 횟수 딕셔너리
+            단어별 선택 횟수 딕셔너리 (top_n 지정 시 횟수 내림차순)
         """
         prefix_lower = prefix.lower()
-        selections = self.prefix_selections.get(prefix_lower, [])
+        selections = self.prefix_selections.get(prefix_lower, {})
+        if top_n is None:
+            return dict(selections)
+        
+        return {word: selections[word] for word in self.get_prefix_top(prefix_lower, top_n)}
+
+    def get_prefix_top(self, prefix: str, top_n: int = PREFIX_TOP_K) -> list[str]:
+        """특정 접두사에서 가장 많이 선택한 단어들을 반환합니다.
         
-        history: dict[str, int] = defaultdict(int)
-        for word in selections:
-            history[word] += 1
+        top_n이 PREFIX_TOP_K 이하이면 미리 정렬된 목록을 잘라서 반환하므로
+        선택 기록의 양과 관계없이 O(접두사 길이 + top_n)입니다.
         
-        return dict(history)
+        Args:
+            prefix: 접두사
+            top_n: 반환할 최대 단어 수
+        
+        Returns:
+            선택 횟수 내림차순 단어 리스트
+        """
+        prefix_lower = prefix.lower()
+        if top_n <= PREFIX_TOP_K:
+            return self.prefix_top.get(prefix_lower, [])[:top_n]
+        
+        selections = self.prefix_selections.get(prefix_lower, {})
+        return heapq.nsmallest(top_n, selections, key=lambda w: (-selections[w], w))
+
+    def memory_usage(self) -> int:
+        """프로필이 차지하는 메모리 크기(바이트)를 추정합니다.
+        
+        객체와 내부 컨테이너(딕셔너리)의 크기를 합산합니다.
+        intern된 단어/접두사 문자열은 여러 프로필이 공유하므로 제외합니다.
+        
+        Returns:
+            추정 메모리 사용량 (바이트)
+        """
+        total = sys.getsizeof(self)
+        total += sys.getsizeof(self.word_counts)
+        total += sys.getsizeof(self.used_words)
+        total += sys.getsizeof(self.word_days)
+        total += sys.getsizeof(self.prefix_selections)
+        for days in self.word_days.values():
+            total += sys.getsizeof(days)
+        total += sys.getsizeof(self.prefix_top)
+        for selections in self.prefix_selections.values():
+            total += sys.getsizeof(selections)
+        for top in self.prefix_top.values():
+            total += sys.getsizeof(top)
+        return total
+
+    def merge(self, other: "UserProfile") -> None:
+        """다른 프로필의 기록을 이 프로필에 합칩니다.
+        
+        Args:
+            other: 합칠 프로필 (같은 사용자의 다른 출처 기록)
+        """
+        for word, count in other.word_counts.items():
+            self._add_word_count(word, count)
+        for word, days in other.word_days.items():
+            for day, count in days.items():
+                self._add_day_count(word, day, count)
+        for prefix, selections in other.prefix_selections.items():
+            for word, count in selections.items():
+                self._add_prefix_count(prefix, word, count)
+
+    def to_dict(self) -> dict[str, Any]:
+        """프로필을 직렬화 가능한 딕셔너리로 변환합니다.
+        
+        날짜별 히스토그램은 [날짜, 횟수, 날짜, 횟수, ...] 형태의 평탄한 리스트로 저장합니다.
+        
+        Returns:
+            msgpack으로 저장 가능한 딕셔너리
+        """
+        return {
+            "user_id": self.user_id,
+            "max_history_days": self.max_history_days,
+            "word_counts": self.word_counts,
+            "word_days": {
+                word: [value for item in days.items() for value in item]
+                for word, days in self.word_days.items()
+            },
+            "prefix_selections": self.prefix_selections,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "UserProfile":
+        """to_dict()로 만든 딕셔너리에서 프로필을 복원합니다.
+        
+        이전 형식(버전 1)의 타임스탬프 기록은 날짜별 히스토그램으로 변환합니다.
+        
+        Args:
+            data: 직렬화된 프로필 딕셔너리
+        
+        Returns:
+            복원된 UserProfile
+        """
+        profile = cls(data["user_id"], data.get("max_history_days", DEFAULT_MAX_HISTORY_DAYS))
+        intern = sys.intern
+        profile.word_counts = {intern(word): count for word, count in data["word_counts"].items()}
+        profile.used_words = sorted(profile.word_counts)
+        
+        if "word_days" in data:
+            for word, flat in data["word_days"].items():
+                profile.word_days[intern(word)] = dict(zip(flat[::2], flat[1::2], strict=True))
+        else:
+            for word, runs in data.get("word_timestamps", {}).items():
+                for value, count in runs:
+                    day = datetime.fromtimestamp(value).toordinal()
+                    profile._add_day_count(intern(word), day, count)
+        
+        for prefix, counts in data["prefix_selections"].items():
+            selections = {intern(word): count for word, count in counts.items()}
+            prefix = intern(prefix)
+            profile.prefix_selections[prefix] = selections
+            profile.prefix_top[prefix] = heapq.nsmallest(
+                PREFIX_TOP_K, selections, key=lambda w: (-selections[w], w)
+            )
+        
+        return profile
 
 
 class UserProfileManager:
-    """여러 사용자 프로필을 관리하는 클래스"""
+    """여러 사용자 프로필을 관리하는 클래스
+    
+    기본적으로 모든 프로필을 메모리에 유지합니다. set_capacity()로 한도를
+    설정하면 가장 오래 사용되지 않은(LRU) 프로필부터 디스크 저장소로
+    내보내고, 다시 접근할 때 읽어옵니다.
+    """
+
+    def __init__(
+        self,
+        max_history_days: int | None = DEFAULT_MAX_HISTORY_DAYS,
+        max_profiles: int | None = None,
+        max_memory_bytes: int | None = None,
+        spill_path: str | Path | None = None,
+    ):
+        """UserProfileManager 초기화
+        
+        Args:
+            max_history_days: 새로 만드는 프로필의 히스토리 보관 기간 (일, None이면 무제한)
+            max_profiles: 메모리에 유지할 최대 프로필 수 (None이면 무제한)
+            max_memory_bytes: 메모리에 유지할 프로필들의 최대 추정 크기 (None이면 무제한)
+            spill_path: 한도를 넘은 프로필을 보관할 SQLite 파일 경로
+        """
+        self.max_history_days: int | None = max_history_days
+        # 메모리에 있는 프로필 (앞쪽일수록 오래 전에 사용됨)
+        self.profiles: OrderedDict[str, UserProfile] = OrderedDict()
+        # 선택 이벤트 로그 (설정되면 record_selection()이 이벤트를 기록)
+        self.event_log: SelectionLog | None = None
+        
+        self.max_profiles: int | None = None
+        self.max_memory_bytes: int | None = None
+        self.spill_store: SQLiteProfileStore | None = None
+        # 메모리에 있는 프로필별 추정 크기 (선택을 기록할 때 증가분만큼 갱신)
+        self._sizes: dict[str, int] = {}
+        self._resident_bytes: int = 0
+        self._stats: dict[str, int] = {
+            "hits": 0, "misses": 0, "faults": 0, "creates": 0, "evictions": 0
+        }
+        self._lock = threading.RLock()
+        
+        if max_profiles is not None or max_memory_bytes is not None:
+            self.set_capacity(max_profiles, max_memory_bytes, spill_path)
+
+    def set_capacity(
+        self,
+        max_profiles: int | None = None,
+        max_memory_bytes: int | None = None,
+        spill_path: str | Path | None = None,
+    ) -> None:
+        """메모리에 유지할 프로필 한도를 설정하고 초과분을 디스크로 내보냅니다.
+        
+        디스크 저장소는 프로세스가 사용하는 임시 공간이므로 열 때 비웁니다.
+        영구 저장은 스냅샷과 선택 로그가 담당합니다.
+        
+        Args:
+            max_profiles: 메모리에 유지할 최대 프로필 수 (None이면 무제한)
+            max_memory_bytes: 메모리에 유지할 프로필들의 최대 추정 크기 (None이면 무제한)
+            spill_path: 내보낸 프로필을 보관할 SQLite 파일 경로
+        
+        Raises:
+            ValueError: 한도를 설정하면서 spill_path를 지정하지 않은 경우
+        """
+        from src.profile_store import SQLiteProfileStore
+        
+        if (max_profiles is not None or max_memory_bytes is not None) and spill_path is None:
+            raise ValueError("프로필 한도를 설정하려면 spill_path가 필요합니다")
+        
+        with self._lock:
+            self.max_profiles = max_profiles
+            self.max_memory_bytes = max_memory_bytes
+            if spill_path is not None and (
+                self.spill_store is None or self.spill_store.path != Path(spill_path)
+            ):
+                self.spill_store = SQLiteProfileStore(spill_path)
+                self.spill_store.clear()
+            
+            self._sizes = {user_id: p.memory_usage() for user_id, p in self.profiles.items()}
+            self._resident_bytes = sum(self._sizes.values())
+            self._enforce_capacity()
 
-    def __init__(self):
-        """UserProfileManager 초기화"""
-        self.profiles: dict[str, UserProfile] = {}
+    def _over_capacity(self) -> bool:
+        if self.max_profiles is not None and len(self.profiles) > self.max_profiles:
+            return True
+        return self.max_memory_bytes is not None and self._resident_bytes > self.max_memory_bytes
+
+    def _enforce_capacity(self) -> None:
+        """한도를 넘는 동안 가장 오래 사용되지 않은 프로필을 디스크로 내보냅니다."""
+        # 방금 사용한 프로필(맨 뒤) 하나는 항상 메모리에 남김
+        while len(self.profiles) > 1 and self._over_capacity():
+            user_id, profile = self.profiles.popitem(last=False)
+            self._resident_bytes -= self._sizes.pop(user_id, 0)
+            self.spill_store.put(profile)
+            self._stats["evictions"] += 1
+
+    def _admit(self, profile: UserProfile) -> None:
+        """프로필을 메모리에 올리고 한도를 적용합니다."""
+        self.profiles[profile.user_id] = profile
+        self._resize(profile.user_id, profile.memory_usage())
+
+    def _resize(self, user_id: str, growth: int) -> None:
+        """메모리에 있는 프로필의 추정 크기에 증가분을 더하고 한도를 적용합니다."""
+        self._sizes[user_id] = self._sizes.get(user_id, 0) + growth
+        self._resident_bytes += growth
+        self._enforce_capacity()
+
+    def find_profile(self, user_id: str) -> UserProfile | None:
+        """사용자 프로필을 가져옵니다. 없으면 생성하지 않고 None을 반환합니다.
+        
+        디스크로 내보낸 프로필이면 메모리로 다시 읽어옵니다.
+        
+        Args:
+            user_id: 사용자 ID
+        
+        Returns:
+            UserProfile 인스턴스 (없으면 None)
+        """
+        with self._lock:
+            profile = self.profiles.get(user_id)
+            if profile is not None:
+                self._stats["hits"] += 1
+                self.profiles.move_to_end(user_id)
+                return profile
+            
+            self._stats["misses"] += 1
+            if self.spill_store is None:
+                return None
+            
+            profile = self.spill_store.pop(user_id)
+            if profile is not None:
+                self._stats["faults"] += 1
+                self._admit(profile)
+            return profile
 
     def get_profile(self, user_id: str) -> UserProfile:
         """사용자 프로필을 가져오거나 생성합니다.
@@ -119,9 +553,86 @@ class UserProfileManager:
         Returns:
             UserProfile 인스턴스
         """
-        if user_id not in self.profiles:
-            self.profiles[user_id] = UserProfile(user_id)
-        return self.profiles[user_id]
+        with self._lock:
+            profile = self.find_profile(user_id)
+            if profile is None:
+                profile = UserProfile(user_id, self.max_history_days)
+                self._stats["creates"] += 1
+                self._admit(profile)
+            return profile
+
+    def add_profile(self, profile: UserProfile) -> None:
+        """구축된 프로필을 등록합니다. (같은 사용자의 기존 프로필은 교체)
+        
+        Args:
+            profile: 등록할 프로필
+        """
+        with self._lock:
+            old_profile = self.profiles.pop(profile.user_id, None)
+            if old_profile is not None:
+                self._resident_bytes -= self._sizes.pop(profile.user_id, 0)
+            elif self.spill_store is not None:
+                self.spill_store.pop(profile.user_id)
+            self._admit(profile)
+
+    def has_profile(self, user_id: str) -> bool:
+        """사용자 프로필이 있는지 확인합니다. (디스크에 있는 프로필 포함)"""
+        with self._lock:
+            if user_id in self.profiles:
+                return True
+            return self.spill_store is not None and user_id in self.spill_store
+
+    def user_ids(self) -> list[str]:
+        """메모리와 디스크에 있는 모든 프로필의 사용자 ID 리스트"""
+        with self._lock:
+            user_ids = list(self.profiles.keys())
+            if self.spill_store is not None:
+                user_ids.extend(self.spill_store.user_ids())
+        return user_ids
+
+    def iter_profiles(self) -> Iterator[UserProfile]:
+        """메모리와 디스크에 있는 모든 프로필을 순회합니다.
+        
+        디스크에 있는 프로필은 메모리로 올리지 않고 하나씩 복원해서 반환합니다.
+        """
+        with self._lock:
+            resident = list(self.profiles.values())
+        yield from resident
+        if self.spill_store is not None:
+            yield from self.spill_store.iter_profiles()
+
+    def stats(self) -> dict[str, int]:
+        """프로필 캐시 통계를 반환합니다.
+        
+        Returns:
+            hits(메모리 적중), misses(메모리에 없음), faults(디스크에서 읽음),
+            creates(새로 생성), evictions(디스크로 내보냄), resident(메모리 프로필 수),
+            spilled(디스크 프로필 수), resident_bytes(메모리 프로필 추정 크기)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["resident"] = len(self.profiles)
+            stats["spilled"] = len(self.spill_store) if self.spill_store is not None else 0
+            stats["resident_bytes"] = self._resident_bytes
+        return stats
+
+    def record_selection(
+        self, user_id: str, word: str, prefix: str = "", count: int = 1
+    ) -> None:
+        """사용자의 단어 선택을 프로필에 반영하고, 이벤트 로그가 있으면 기록합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            word: 선택된 단어
+            prefix: 입력했던 접두사 (선택사항)
+            count: 선택 횟수
+        """
+        timestamp = datetime.now()
+        with self._lock:
+            profile = self.get_profile(user_id)
+            self._resize(user_id, profile.record_word_selection(word, prefix, count, timestamp))
+        if self.event_log is not None:
+            self.event_log.append(user_id, word, prefix, count, timestamp)
 
     def simulate_user_behavior(
         self, user_id: str, word_selections: list[tuple[str, str]]
@@ -132,7 +643,130 @@ class UserProfileManager:
             user_id: 사용자 ID
             word_selections: (접두사, 선택된_단어) 튜플 리스트
         """
-        profile = self.get_profile(user_id)
-        for prefix, word in word_selections:
-            profile.record_word_selection(word, prefix)
+        with self._lock:
+            profile = self.get_profile(user_id)
+            growth = 0
+            for prefix, word in word_selections:
+                growth += profile.record_word_selection(word, prefix)
+            self._resize(user_id, growth)
+
+    def merge_profile(self, profile: UserProfile) -> None:
+        """같은 사용자의 다른 출처 기록을 그 사용자의 프로필에 합칩니다. (없으면 생성)
+        
+        Args:
+            profile: 합칠 프로필
+        """
+        with self._lock:
+            target = self.get_profile(profile.user_id)
+            size_before = target.memory_usage()
+            target.merge(profile)
+            self._resize(profile.user_id, target.memory_usage() - size_before)
+
+    def memory_usage(self) -> dict[str, int]:
+        """메모리에 있는 프로필별 추정 메모리 사용량을 반환합니다.
+        
+        Returns:
+            사용자 ID를 키로 하고 메모리 사용량(바이트)을 값으로 하는 딕셔너리
+        """
+        with self._lock:
+            profiles = list(self.profiles.items())
+        return {user_id: profile.memory_usage() for user_id, profile in profiles}
+
+    def save_snapshot(self, path: str | Path, metadata: dict[str, Any] | None = None) -> None:
+        """모든 프로필을 msgpack 바이너리 스냅샷으로 저장합니다.
+        
+        임시 파일에 먼저 쓴 뒤 교체하므로 저장 도중 중단되어도
+        기존 스냅샷이 손상되지 않습니다. 디스크로 내보낸 프로필도 포함하며,
+        프로필을 하나씩 기록하므로 전체를 한 번에 메모리에 올리지 않습니다.
+        
+        Args:
+            path: 저장할 파일 경로
+            metadata: 스냅샷과 함께 저장할 부가 정보 (예: 원본 파일 정보)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "metadata": metadata or {},
+        }
+        packer = msgpack.Packer()
+        
+        tmp_path = path.with_name(path.name + ".tmp")
+        # 저장하는 동안 프로필이 메모리와 디스크 사이를 옮겨가지 않도록 락을 유지
+        with self._lock, open(tmp_path, "wb") as outfile:
+            outfile.write(packer.pack_array_header(len(self.user_ids()) + 1))
+            outfile.write(packer.pack(header))
+            outfile.writelines(packer.pack(profile.to_dict()) for profile in self.iter_profiles())
+        tmp_path.replace(path)
+
+    @classmethod
+    def load_snapshot(cls, path: str | Path, **options: Any) -> "UserProfileManager":
+        """save_snapshot()으로 저장한 스냅샷에서 프로필들을 복원합니다.
+        
+        Args:
+            path: 스냅샷 파일 경로
+            **options: UserProfileManager 생성 옵션 (예: max_profiles, spill_path)
+        
+        Returns:
+            프로필이 채워진 UserProfileManager
+        
+        Raises:
+            ValueError: 스냅샷 헤더가 예상한 형식이 아닌 경우
+        """
+        _, profiles = read_snapshot(path)
+        manager = cls(**options)
+        for profile_data in profiles:
+            manager.add_profile(UserProfile.from_dict(profile_data))
+        return manager
+
+
+def read_snapshot(path: str | Path) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """스냅샷 파일을 읽고 헤더를 검증합니다.
+    
+    Args:
+        path: 스냅샷 파일 경로
+    
+    Returns:
+        (헤더, 프로필 딕셔너리 리스트) 튜플
+    
+    Raises:
+        ValueError: 스냅샷 헤더가 예상한 형식이 아닌 경우
+    """
+    with open(path, "rb") as infile:
+        unpacker = msgpack.Unpacker(infile, raw=False)
+        length = unpacker.read_array_header()
+        header = _check_snapshot_header(unpacker.unpack() if length else None)
+        profiles = [unpacker.unpack() for _ in range(length - 1)]
+    return header, profiles
+
+
+def read_snapshot_metadata(path: str | Path) -> dict[str, Any]:
+    """스냅샷 파일의 헤더만 읽어서 메타데이터를 반환합니다.
+    
+    Args:
+        path: 스냅샷 파일 경로
+    
+    Returns:
+        save_snapshot()에 전달했던 메타데이터
+    
+    Raises:
+        ValueError: 스냅샷 헤더가 예상한 형식이 아닌 경우
+    """
+    with open(path, "rb") as infile:
+        unpacker = msgpack.Unpacker(infile, raw=False)
+        length = unpacker.read_array_header()
+        header = _check_snapshot_header(unpacker.unpack() if length else None)
+    return header["metadata"]
+
 
+def _check_snapshot_header(header: Any) -> dict[str, Any]:
+    """스냅샷 헤더의 형식과 버전을 검증합니다."""
+    if (
+        not isinstance(header, dict)
+        or header.get("format") != SNAPSHOT_FORMAT
+        or header.get("version") not in SUPPORTED_SNAPSHOT_VERSIONS
+    ):
+        raise ValueError(f"Unexpected snapshot header: {header!r}")
+    return header
@@ -0,0 +1,87 @@
+"""다음 단어 예측 모델(CSR 테이블 + stupid backoff) 테스트"""
+
+import random
+from collections import Counter, defaultdict
+
+import pytest
+
+from src.next_word import BACKOFF_WEIGHT, SENTENCE_START, NextWordModel
+
+
+def naive_scores(
+    sentences: list[list[str]], previous_words: list[str], prefix: str = ""
+) -> dict[str, float]:
+    """단어 튜플별 Counter로 직접 계산한 stupid backoff 점수 (잘라내기 없음)"""
+    bigrams: defaultdict[str, Counter[str]] = defaultdict(Counter)
+    trigrams: defaultdict[tuple[str, str], Counter[str]] = defaultdict(Counter)
+    for sentence in sentences:
+        words = [SENTENCE_START] + [word.lower() for word in sentence]
+        for i in range(1, len(words)):
+            bigrams[words[i - 1]][words[i]] += 1
+            if i >= 2:
+                trigrams[words[i - 2], words[i - 1]][words[i]] += 1
+
+    vocabulary = {word for counts in bigrams.values() for word in counts}
+    context = [SENTENCE_START] + [word.lower() for word in previous_words[-2:]]
+    if context[-1] not in vocabulary | {SENTENCE_START}:
+        return {}
+
+    scores: dict[str, float] = {}
+    weight = 1.0
+    if len(context) >= 2:
+        counts = trigrams.get((context[-2], context[-1]), Counter())
+        total = sum(counts.values())
+        for word, count in counts.items():
+            if word.startswith(prefix):
+                scores[word] = count / total
+        weight = BACKOFF_WEIGHT
+    counts = bigrams.get(context[-1], Counter())
+    total = sum(counts.values())
+    for word, count in counts.items():
+        if word.startswith(prefix) and word not in scores:
+            scores[word] = weight * count / total
+    return scores
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[list[str]]:
+    rng = random.Random(3)
+    vocabulary = ["the", "cat", "sat", "on", "mat", "a", "dog", "ran", "to", "them", "then"]
+    return [
+        [rng.choice(vocabulary) for _ in range(rng.randint(1, 8))] for _ in range(300)
+    ]
+
+
+def test_predict_matches_naive_backoff(corpus):
+    model = NextWordModel.build(corpus, max_successors=1000)
+    contexts = [[], ["the"], ["cat", "sat"], ["dog", "the"], ["unknown", "the"], ["the", "unknown"]]
+    contexts += [list(sentence[:length]) for sentence in corpus[:50] for length in (1, 2, 3)]
+
+    for previous_words in contexts:
+        for prefix in ("", "t", "the", "m"):
+            predicted = model.predict(previous_words, top_n=1000, prefix=prefix)
+            expected = naive_scores(corpus, previous_words, prefix)
+            assert dict(predicted) == pytest.approx(expected), (previous_words, prefix)
+            scores = [score for _, score in predicted]
+            assert scores == sorted(scores, reverse=True)
+
+
+def test_top_n_returns_highest_scores(corpus):
+    model = NextWordModel.build(corpus, max_successors=1000)
+
+    for previous_words in ([], ["the"], ["cat", "sat"]):
+        expected = naive_scores(corpus, previous_words)
+        predicted = model.predict(previous_words, top_n=3)
+        assert len(predicted) == min(3, len(expected))
+        cutoff = sorted(expected.values(), reverse=True)[len(predicted) - 1]
+        assert all(score >= cutoff for _, score in predicted)
+
+
+def test_max_successors_keeps_most_frequent(corpus):
+    full = NextWordModel.build(corpus, max_successors=1000)
+    truncated = NextWordModel.build(corpus, max_successors=2)
+
+    predicted = truncated.predict(["the"], top_n=10)
+    assert len(predicted) <= 2 * 2  # 트라이그램 2개 + 바이그램 2개
+    for word, score in predicted:
+        assert score == pytest.approx(dict(full.predict(["the"], top_n=1000))[word])
@@ -0,0 +1,73 @@
+"""공유 메모리 인덱스 위에 단어를 추가했을 때의 조회 테스트"""
+
+import os
+from collections import defaultdict
+
+import pytest
+
+from src.recommender import PrefixIndexOverlay, WordRecommender
+from src.shared_index import SharedPrefixIndex, publish_prefix_index
+
+WORDS = {
+    "the": 5e-2,
+    "there": 3e-3,
+    "these": 2e-3,
+    "theory": 4e-4,
+    "tea": 3e-4,
+    "team": 2e-4,
+    "ten": 1e-4,
+    "apple": 5e-5,
+}
+ADDED = [("thermos", 1e-3), ("tensor", 5e-4), ("zebra", 2e-5), ("team", 4e-3)]
+
+
+def build_index(words: dict[str, float]) -> dict[str, list[tuple[str, float]]]:
+    index: defaultdict[str, list[tuple[str, float]]] = defaultdict(list)
+    for word, frequency in words.items():
+        for i in range(1, len(word) + 1):
+            index[word[:i]].append((word, frequency))
+    for candidates in index.values():
+        candidates.sort(key=lambda item: item[1], reverse=True)
+    return dict(index)
+
+
+@pytest.fixture
+def shared_recommender():
+    shm = publish_prefix_index(build_index(WORDS), f"word_trail_test_{os.getpid()}")
+    index = SharedPrefixIndex(shm)
+    yield WordRecommender("en", prefix_index=index)
+    index.close()
+    shm.unlink()
+
+
+def test_added_words_on_shared_index_match_dict_index(shared_recommender):
+    local = WordRecommender("en", prefix_index=build_index(WORDS))
+    for recommender in (local, shared_recommender):
+        recommender.prepare_fuzzy()
+        recommender.add_words(ADDED)
+
+    overlay = shared_recommender.prefix_index
+    assert isinstance(overlay, PrefixIndexOverlay)
+    # 정렬된 접두사는 세그먼트 목록과 새로 생긴 접두사 목록으로 나뉘며 전체를 복사하지 않음
+    base_keys, added_keys = shared_recommender._sorted_prefixes()
+    assert len(base_keys) == len(overlay.base)
+    assert added_keys == sorted(set(overlay) - set(overlay.base))
+    assert sorted([*base_keys, *added_keys]) == local._sorted_prefixes()[0]
+
+    for prefix in ["", "t", "te", "the", "ther", "z", "a"]:
+        assert sorted(shared_recommender._child_prefixes(prefix)) == sorted(
+            local._child_prefixes(prefix)
+        )
+        if prefix:
+            assert shared_recommender.recommend(prefix, 5) == local.recommend(prefix, 5)
+    for query in ["thermo", "tenso", "zebr", "taem"]:
+        assert shared_recommender.recommend_fuzzy(query, 5, 1) == local.recommend_fuzzy(query, 5, 1)
+
+
+def test_lookup_frequency_prefers_added_words(shared_recommender):
+    shared_recommender.add_words(ADDED)
+
+    assert shared_recommender._lookup_frequency("team") == 4e-3
+    assert shared_recommender._lookup_frequency("thermos") == 1e-3
+    assert shared_recommender._lookup_frequency("there") == 3e-3
+    assert shared_recommender._lookup_frequency("missing") == 0.0
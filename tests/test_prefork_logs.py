@@ -0,0 +1,68 @@
+"""fork 전후의 선택 로그 처리와 워커별 프로필 동작 테스트"""
+
+import os
+import threading
+
+import pytest
+
+from src.selection_log import open_selection_log
+from src.user_profile import UserProfileManager
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork가 필요합니다")
+
+
+def flusher_threads() -> list[threading.Thread]:
+    return [thread for thread in threading.enumerate() if thread.name.endswith("flush")]
+
+
+def run_in_child(target) -> int:
+    """fork한 자식에서 target을 실행하고 종료 코드를 반환합니다."""
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            target()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def test_stop_flusher_joins_thread_and_flushes(tmp_path):
+    manager = UserProfileManager()
+    log = open_selection_log(manager, tmp_path, flush_interval=0.05)
+    assert flusher_threads()
+
+    manager.record_selection("alice", "hello", "he")
+    log.stop_flusher()
+
+    assert not flusher_threads()
+    assert os.path.getsize(tmp_path / f"selections.{log.seq:06d}.log") > 0
+
+    log.start_flusher()
+    assert flusher_threads()
+    log.close()
+
+
+def test_worker_selections_reach_other_processes_only_after_replay(tmp_path):
+    manager = UserProfileManager()
+    manager.record_selection("alice", "hello", "he")
+    log = open_selection_log(manager, tmp_path)
+    log.stop_flusher()
+
+    def worker() -> None:
+        log.reopen(log.seq + 1)
+        manager.record_selection("alice", "help", "he", count=3)
+        log.close()
+
+    assert run_in_child(worker) == 0
+
+    # 워커의 선택은 마스터(다른 워커들)의 프로필 사본에 반영되지 않음
+    assert "help" not in manager.get_profile("alice").word_counts
+    log.close()
+
+    # 워커가 남긴 로그 세그먼트는 다음 시작 때 재생됨
+    restarted = UserProfileManager()
+    open_selection_log(restarted, tmp_path).close()
+    assert restarted.get_profile("alice").word_counts.get("help") == 3
@@ -0,0 +1,112 @@
+"""개인화 추천의 조기 종료가 전체 정렬과 같은 결과를 내는지 확인하는 테스트"""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.recommender import IndexBuildOptions, WordRecommender
+from src.user_profile import UserProfile
+
+WORDS = {
+    "know": 1e-3,
+    "keep": 8e-4,
+    "kind": 7e-4,
+    "known": 6e-4,
+    "kids": 5e-4,
+    "key": 4e-4,
+    "kept": 3e-4,
+    "kitchen": 2e-4,
+    "keyboard": 4e-5,
+    "kubernetes": 1e-6,
+}
+
+
+def build_recommender(
+    words: dict[str, float], max_prefix_depth: int | None = None
+) -> WordRecommender:
+    """단어-빈도 딕셔너리로 작은 접두사 인덱스를 만들어 추천기를 생성합니다."""
+    index: defaultdict[str, list[tuple[str, float]]] = defaultdict(list)
+    for word, frequency in words.items():
+        length = len(word) if max_prefix_depth is None else min(len(word), max_prefix_depth)
+        for i in range(1, length + 1):
+            index[word[:i]].append((word, frequency))
+    for candidates in index.values():
+        candidates.sort(key=lambda item: item[1], reverse=True)
+    options = IndexBuildOptions(max_prefix_depth=max_prefix_depth)
+    return WordRecommender("en", prefix_index=dict(index), build_options=options)
+
+
+def full_sort(
+    recommender: WordRecommender,
+    prefix: str,
+    top_n: int,
+    profile: UserProfile,
+    min_frequency: float | None = None,
+) -> list[tuple[str, float]]:
+    """모든 후보의 개인화 점수를 계산해 정렬한 기준 결과 (같은 점수는 빈도순)"""
+    candidates = [
+        (word, freq)
+        for word, freq in recommender._candidates(prefix)
+        if min_frequency is None or freq >= min_frequency
+    ]
+    scored = [
+        (profile.get_word_score(word, freq), -index, word)
+        for index, (word, freq) in enumerate(candidates)
+    ]
+    scored.sort(reverse=True)
+    return [(word, score) for score, _, word in scored[:top_n]]
+
+
+def test_words_selected_under_other_prefixes_are_ranked():
+    recommender = build_recommender(WORDS)
+    profile = UserProfile("user")
+    profile.record_word_selection("kubernetes", "kub", count=50)
+    profile.record_word_selection("keyboard", "key", count=3)
+
+    result = recommender.recommend("k", top_n=5, user_profile=profile)
+
+    assert {"kubernetes", "keyboard"} <= {word for word, _ in result}
+    assert result == full_sort(recommender, "k", 5, profile)
+
+
+def test_pending_scores_use_index_frequency():
+    recommender = build_recommender(WORDS)
+    # 인덱스 빈도가 wordfreq 빈도와 다르더라도 인덱스 빈도로 점수를 매김
+    recommender.add_words([("kubernetes", 5e-4)])
+    profile = UserProfile("user")
+    profile.record_word_selection("kubernetes", "ku", count=2)
+
+    result = recommender.recommend("k", top_n=3, user_profile=profile)
+
+    assert result == full_sort(recommender, "k", 3, profile)
+    assert result[0][0] == "kubernetes"
+
+
+@pytest.mark.parametrize("max_prefix_depth", [None, 2])
+def test_matches_full_sort_on_random_profiles(max_prefix_depth):
+    rng = random.Random(7)
+    alphabet = "abc"
+    words: dict[str, float] = {}
+    while len(words) < 300:
+        word = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+        words.setdefault(word, rng.random() ** 4)
+    recommender = build_recommender(words, max_prefix_depth)
+    vocabulary = sorted(words)
+    now = datetime.now()
+
+    for user in range(20):
+        profile = UserProfile(f"user{user}")
+        for _ in range(rng.randint(1, 40)):
+            word = rng.choice(vocabulary)
+            prefix = word[: rng.randint(0, len(word))]
+            timestamp = now - timedelta(days=rng.randint(0, 60))
+            profile.record_word_selection(word, prefix, rng.randint(1, 5), timestamp)
+
+        for prefix in ["", "a", "b", "ab", "bca", "cc", "abca"]:
+            for top_n in (1, 3, 10):
+                for min_frequency in (None, 0.05):
+                    expected = full_sort(recommender, prefix, top_n, profile, min_frequency)
+                    actual = recommender.recommend(prefix, top_n, min_frequency, profile)
+                    assert actual == expected, (user, prefix, top_n, min_frequency)
@@ -0,0 +1,91 @@
+"""프로필 스냅샷 저장/복원 테스트"""
+
+from datetime import datetime
+
+import msgpack
+import pytest
+
+from src.user_profile import (
+    SNAPSHOT_FORMAT,
+    SNAPSHOT_VERSION,
+    UserProfile,
+    UserProfileManager,
+    read_snapshot_metadata,
+)
+
+
+def _profile_state(profile: UserProfile) -> tuple:
+    return (
+        profile.user_id,
+        profile.max_history_days,
+        profile.word_counts,
+        profile.word_days,
+        profile.prefix_selections,
+        profile.prefix_top,
+    )
+
+
+def test_snapshot_round_trip(tmp_path):
+    manager = UserProfileManager()
+    alice = manager.get_profile("alice")
+    alice.record_word_selection("Hello", "he", timestamp=datetime(2024, 5, 1, 9))
+    alice.record_word_selection("hello", "hel", count=3, timestamp=datetime(2024, 5, 2, 9))
+    alice.record_word_selection("help", "he", count=2, timestamp=datetime(2024, 5, 2, 18))
+    manager.get_profile("bob").record_word_selection("world", timestamp=datetime(2024, 1, 1))
+
+    path = tmp_path / "profiles.msgpack"
+    manager.save_snapshot(path, metadata={"source": "test"})
+    loaded = UserProfileManager.load_snapshot(path)
+
+    assert read_snapshot_metadata(path) == {"source": "test"}
+    assert sorted(loaded.user_ids()) == ["alice", "bob"]
+    for user_id in ("alice", "bob"):
+        assert _profile_state(loaded.get_profile(user_id)) == _profile_state(
+            manager.get_profile(user_id)
+        )
+
+
+def test_load_version_1_snapshot(tmp_path):
+    first = datetime(2024, 5, 1, 9)
+    second = datetime(2024, 5, 1, 21)
+    third = datetime(2024, 5, 3, 12)
+    expected = UserProfile("alice")
+    expected.record_word_selection("hello", "he", count=2, timestamp=first)
+    expected.record_word_selection("hello", "he", timestamp=second)
+    expected.record_word_selection("help", "hel", timestamp=third)
+
+    # 버전 1은 단어별 사용 시각을 (타임스탬프, 횟수) 런으로 저장
+    profile_v1 = {
+        "user_id": "alice",
+        "max_history_days": expected.max_history_days,
+        "word_counts": {"hello": 3, "help": 1},
+        "word_timestamps": {
+            "hello": [[first.timestamp(), 2], [second.timestamp(), 1]],
+            "help": [[third.timestamp(), 1]],
+        },
+        "prefix_selections": {"he": {"hello": 3}, "hel": {"help": 1}},
+    }
+    header = {"format": SNAPSHOT_FORMAT, "version": 1, "metadata": {}}
+    path = tmp_path / "profiles_v1.msgpack"
+    path.write_bytes(msgpack.packb([header, profile_v1]))
+
+    loaded = UserProfileManager.load_snapshot(path)
+
+    assert _profile_state(loaded.get_profile("alice")) == _profile_state(expected)
+
+    # 다시 저장하면 현재 버전으로 기록되고 내용은 그대로 유지
+    resaved = tmp_path / "profiles_v2.msgpack"
+    loaded.save_snapshot(resaved)
+    with open(resaved, "rb") as infile:
+        assert msgpack.unpackb(infile.read(), raw=False)[0]["version"] == SNAPSHOT_VERSION
+    assert _profile_state(UserProfileManager.load_snapshot(resaved).get_profile("alice")) == (
+        _profile_state(expected)
+    )
+
+
+def test_unknown_snapshot_version_is_rejected(tmp_path):
+    path = tmp_path / "profiles.msgpack"
+    path.write_bytes(msgpack.packb([{"format": SNAPSHOT_FORMAT, "version": 99, "metadata": {}}]))
+
+    with pytest.raises(ValueError):
+        UserProfileManager.load_snapshot(path)
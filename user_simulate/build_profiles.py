@@ -1,6 +1,7 @@
 """사용자 문장 파일을 읽어서 프로필을 구축하는 스크립트"""
 
 import re
+from collections import Counter
 from pathlib import Path
 
 import sys
@@ -9,8 +10,16 @@ from pathlib import Path
 # 상위 디렉토리를 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.next_word import NextWordModel
 from src.recommender import MultiLanguageRecommender
-from src.user_profile import UserProfile, UserProfileManager
+from src.user_profile import UserProfile, UserProfileManager, read_snapshot_metadata
+
+# 사용자 문장 파일과 프로필 스냅샷이 저장되는 폴더
+SENTENCES_DIR = Path(__file__).parent / "sentences"
+PROFILE_SNAPSHOT_DIR = Path(__file__).parent / "profiles"
+
+DEFAULT_LANGUAGES = ["en", "it", "ja"]
+DEFAULT_USER_IDS = ["developer", "writer", "business", "student", "general"]
 
 
 def extract_words_from_sentence(sentence: str, lang: str) -> list[str]:
@@ -78,7 +87,10 @@ def extract_words_from_sentence(sentence: str, lang: str) -> list[str]:
 
 
 def build_user_profile_from_sentences(
-    user_id: str, sentences: list[str], lang: str, recommender: MultiLanguageRecommender
+    user_id: str,
+    sentences: list[str],
+    lang: str,
+    recommender: MultiLanguageRecommender | None = None,
 ) -> UserProfile:
     """문장 리스트로부터 사용자 프로필을 구축합니다.
     
@@ -86,26 +98,53 @@ def build_user_profile_from_sentences(
         user_id: 사용자 ID
         sentences: 사용자가 작성한 문장 리스트
         lang: 언어 코드
-        recommender: 추천 시스템 (접두사 추출용)
+        recommender: 추천 시스템 (사용하지 않음, 하위 호환성)
     
     Returns:
         구축된 UserProfile
     """
     profile = UserProfile(user_id)
     
-    for sentence in sentences:
-        words = extract_words_from_sentence(sentence, lang)
-        
-        for word in words:
-            # 각 단어의 접두사를 생성하여 기록
-            max_prefix_len = min(len(word) + 1, 4)  # 최대 3글자 접두사
-            for prefix_len in range(1, max_prefix_len):
-                prefix = word[:prefix_len]
-                profile.record_word_selection(word, prefix)
+    # 동일한 문장은 한 번만 분리하고 등장 횟수를 가중치로 사용
+    word_counts: Counter[str] = Counter()
+    for sentence, multiplicity in Counter(sentences).items():
+        for word in extract_words_from_sentence(sentence, lang):
+            word_counts[word] += multiplicity
+    
+    # 고유 단어마다 최대 3글자 접두사를 생성하여 (단어, 접두사, 횟수)로 일괄 기록
+    selections = [
+        (word, word[:prefix_len], count)
+        for word, count in word_counts.items()
+        for prefix_len in range(1, min(len(word) + 1, 4))
+    ]
+    
+    profile.record_word_selections(selections)
     
     return profile
 
 
+def find_sentence_file(user_id: str, lang: str) -> Path | None:
+    """사용자 문장 파일 경로를 찾습니다.
+    
+    Args:
+        user_id: 사용자 ID
+        lang: 언어 코드
+    
+    Returns:
+        문장 파일 경로 (없으면 None)
+    """
+    sentence_file = SENTENCES_DIR / f"{user_id}_{lang}_sentences.txt"
+    if sentence_file.exists():
+        return sentence_file
+    
+    # 하위 호환성: 기존 파일명도 확인
+    old_file = SENTENCES_DIR / f"{user_id}_sentences.txt"
+    if old_file.exists():
+        return old_file
+    
+    return None
+
+
 def load_user_sentences(user_id: str, lang: str) -> list[str]:
     """사용자 문장 파일을 읽어옵니다.
     
@@ -116,17 +155,12 @@ def load_user_sentences(user_id: str, lang: str) -> list[str]:
     Returns:
         문장 리스트
     """
-    data_dir = Path(__file__).parent / "sentences"
-    sentence_file = data_dir / f"{user_id}_{lang}_sentences.txt"
-    
-    if not sentence_file.exists():
-        # 하위 호환성: 기존 파일명도 확인
-        old_file = data_dir / f"{user_id}_sentences.txt"
-        if old_file.exists():
-            sentence_file = old_file
-        else:
-            print(f"경고: 파일을 찾을 수 없습니다: {sentence_file}")
-            return []
+    sentence_file = find_sentence_file(user_id, lang)
+    
+    if sentence_file is None:
+        expected_file = SENTENCES_DIR / f"{user_id}_{lang}_sentences.txt"
+        print(f"경고: 파일을 찾을 수 없습니다: {expected_file}")
+        return []
     
     sentences = []
     with open(sentence_file, "r", encoding="utf-8") as f:
@@ -138,14 +172,181 @@ def load_user_sentences(user_id: str, lang: str) -> list[str]:
     return sentences
 
 
+def get_sentence_sources(lang: str, user_ids: list[str]) -> dict[str, list[int]]:
+    """프로필 구축에 사용되는 문장 파일들의 변경 감지 정보를 반환합니다.
+    
+    Args:
+        lang: 언어 코드
+        user_ids: 사용자 ID 리스트
+    
+    Returns:
+        사용자 ID를 키로 하고 [파일 크기, 수정 시각(ns)]을 값으로 하는 딕셔너리
+        (파일이 없는 사용자는 제외)
+    """
+    sources: dict[str, list[int]] = {}
+    for user_id in user_ids:
+        sentence_file = find_sentence_file(user_id, lang)
+        if sentence_file is not None:
+            stat = sentence_file.stat()
+            sources[user_id] = [stat.st_size, stat.st_mtime_ns]
+    return sources
+
+
+def get_snapshot_path(lang: str) -> Path:
+    """언어별 프로필 스냅샷 파일 경로를 반환합니다."""
+    return PROFILE_SNAPSHOT_DIR / f"{lang}_profiles.msgpack"
+
+
+def build_profile_manager(
+    lang: str, user_ids: list[str], verbose: bool = False
+) -> UserProfileManager:
+    """문장 파일들로부터 한 언어의 프로필 매니저를 구축합니다.
+    
+    Args:
+        lang: 언어 코드
+        user_ids: 사용자 ID 리스트
+        verbose: True면 사용자별 통계 출력
+    
+    Returns:
+        구축된 UserProfileManager
+    """
+    profile_manager = UserProfileManager()
+    
+    for user_id in user_ids:
+        if verbose:
+            print(f"\n[{user_id}] 프로필 구축 중...")
+        
+        # 문장 로드
+        sentences = load_user_sentences(user_id, lang)
+        
+        if not sentences:
+            if verbose:
+                print(f"  경고: {user_id}의 {lang} 문장 데이터가 없습니다.")
+            continue
+        
+        # 프로필 구축
+        profile = build_user_profile_from_sentences(user_id, sentences, lang)
+        profile_manager.add_profile(profile)
+        
+        if not verbose:
+            continue
+        
+        # 통계 출력
+        total_words = sum(profile.word_counts.values())
+        unique_words = len(profile.word_counts)
+        
+        print(f"  문장 수: {len(sentences)}")
+        print(f"  총 단어 사용 횟수: {total_words}")
+        print(f"  고유 단어 수: {unique_words}")
+        print(f"  프로필 메모리: {profile.memory_usage() / 1024:.1f} KB")
+        
+        # 가장 많이 사용한 단어 Top 5
+        top_words = sorted(
+            profile.word_counts.items(), key=lambda x: x[1], reverse=True
+        )[:5]
+        print(f"  가장 많이 사용한 단어:")
+        for word, count in top_words:
+            print(f"    - {word}: {count}회")
+    
+    return profile_manager
+
+
+def load_or_build_profile_managers(
+    languages: list[str] | None = None, user_ids: list[str] | None = None
+) -> dict[str, UserProfileManager]:
+    """언어별 프로필 스냅샷을 로드하고, 없거나 오래된 경우에만 다시 구축합니다.
+    
+    스냅샷에 저장된 문장 파일 정보(크기, 수정 시각)가 현재 파일과 같으면
+    스냅샷을 그대로 사용합니다. 다르면 문장 파일로부터 프로필을 다시
+    구축하고 스냅샷을 갱신합니다. 추천 시스템은 생성하지 않습니다.
+    
+    Args:
+        languages: 언어 코드 리스트 (기본값: en, it, ja)
+        user_ids: 사용자 ID 리스트 (기본값: 시뮬레이션 사용자 전체)
+    
+    Returns:
+        언어별 UserProfileManager 딕셔너리
+    """
+    if languages is None:
+        languages = DEFAULT_LANGUAGES
+    if user_ids is None:
+        user_ids = DEFAULT_USER_IDS
+    
+    profile_managers: dict[str, UserProfileManager] = {}
+    
+    for lang in languages:
+        snapshot_path = get_snapshot_path(lang)
+        sources = get_sentence_sources(lang, user_ids)
+        
+        if snapshot_path.exists():
+            try:
+                metadata = read_snapshot_metadata(snapshot_path)
+                if metadata.get("sources") == sources:
+                    profile_managers[lang] = UserProfileManager.load_snapshot(snapshot_path)
+                    continue
+            except Exception as e:
+                print(f"[{lang}] 프로필 스냅샷 로드 실패, 다시 구축합니다: {e}")
+        
+        print(f"[{lang}] 프로필 구축 중...")
+        profile_manager = build_profile_manager(lang, user_ids)
+        profile_manager.save_snapshot(snapshot_path, {"sources": sources})
+        profile_managers[lang] = profile_manager
+    
+    return profile_managers
+
+
+def build_next_word_model(lang: str, user_ids: list[str] | None = None) -> NextWordModel:
+    """프로필과 같은 문장 파일들로부터 한 언어의 다음 단어 예측 모델을 구축합니다.
+    
+    Args:
+        lang: 언어 코드
+        user_ids: 사용자 ID 리스트 (기본값: 시뮬레이션 사용자 전체)
+    
+    Returns:
+        구축된 NextWordModel (문장이 없으면 빈 모델)
+    """
+    if user_ids is None:
+        user_ids = DEFAULT_USER_IDS
+    
+    sentences = (
+        extract_words_from_sentence(sentence, lang)
+        for user_id in user_ids
+        for sentence in load_user_sentences(user_id, lang)
+    )
+    return NextWordModel.build(sentences)
+
+
+def build_next_word_models(
+    languages: list[str] | None = None, user_ids: list[str] | None = None
+) -> dict[str, NextWordModel]:
+    """언어별 다음 단어 예측 모델을 구축합니다. (문장이 하나도 없는 언어는 제외)
+    
+    Args:
+        languages: 언어 코드 리스트 (기본값: en, it, ja)
+        user_ids: 사용자 ID 리스트 (기본값: 시뮬레이션 사용자 전체)
+    
+    Returns:
+        언어별 NextWordModel 딕셔너리
+    """
+    if languages is None:
+        languages = DEFAULT_LANGUAGES
+    
+    models: dict[str, NextWordModel] = {}
+    for lang in languages:
+        model = build_next_word_model(lang, user_ids)
+        if model.stats()["vocabulary"]:
+            models[lang] = model
+    return models
+
+
 def main():
     """메인 함수 - 모든 사용자 프로필 구축 (모든 언어)"""
     print("=" * 60)
     print("사용자 프로필 구축 (다국어)")
     print("=" * 60)
     
-    languages = ["en", "it", "ja"]
-    user_ids = ["developer", "writer", "business", "student", "general"]
+    languages = DEFAULT_LANGUAGES
+    user_ids = DEFAULT_USER_IDS
     
     # 추천 시스템 초기화 (모든 언어)
     print("\n추천 시스템 초기화 중...")
@@ -159,38 +360,10 @@ def main():
         print(f"[{lang.upper()}] 언어 프로필 구축")
         print("=" * 60)
         
-        profile_manager = UserProfileManager()
-        
-        for user_id in user_ids:
-            print(f"\n[{user_id}] 프로필 구축 중...")
-            
-            # 문장 로드
-            sentences = load_user_sentences(user_id, lang)
-            
-            if not sentences:
-                print(f"  경고: {user_id}의 {lang} 문장 데이터가 없습니다.")
-                continue
-            
-            print(f"  문장 수: {len(sentences)}")
-            
-            # 프로필 구축
-            profile = build_user_profile_from_sentences(user_id, sentences, lang, recommender)
-            profile_manager.profiles[user_id] = profile
-            
-            # 통계 출력
-            total_words = sum(profile.word_counts.values())
-            unique_words = len(profile.word_counts)
-            
-            print(f"  총 단어 사용 횟수: {total_words}")
-            print(f"  고유 단어 수: {unique_words}")
-            
-            # 가장 많이 사용한 단어 Top 5
-            top_words = sorted(
-                profile.word_counts.items(), key=lambda x: x[1], reverse=True
-            )[:5]
-            print(f"  가장 많이 사용한 단어:")
-            for word, count in top_words:
-                print(f"    - {word}: {count}회")
+        # 스냅샷 갱신을 위해 구축 전에 원본 파일 정보를 기록
+        sources = get_sentence_sources(lang, user_ids)
+        profile_manager = build_profile_manager(lang, user_ids, verbose=True)
+        profile_manager.save_snapshot(get_snapshot_path(lang), {"sources": sources})
         
         profile_managers[lang] = profile_manager
     